@@ -2,15 +2,12 @@
 Alembic environment configuration for AI Agent Platform.
 """
 
-import asyncio
 from logging.config import fileConfig
-from sqlalchemy import pool
 from sqlalchemy.engine import Connection
-from sqlalchemy.ext.asyncio import create_async_engine
 
 from alembic import context
 
-from src.shared.database.base import Base
+from src.shared.database.base import Base, get_sync_engine
 from src.shared.config import get_settings
 
 # Import all models to ensure they are registered with SQLAlchemy
@@ -74,22 +71,10 @@ def do_run_migrations(connection: Connection) -> None:
         context.run_migrations()
 
 
-async def run_async_migrations() -> None:
-    """Run migrations in async mode."""
-    connectable = create_async_engine(
-        get_url(),
-        poolclass=pool.NullPool,
-    )
-
-    async with connectable.connect() as connection:
-        await connection.run_sync(do_run_migrations)
-
-    await connectable.dispose()
-
-
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode."""
-    asyncio.run(run_async_migrations())
+    with get_sync_engine().connect() as connection:
+        do_run_migrations(connection)
 
 
 if context.is_offline_mode():
@@ -0,0 +1,31 @@
+"""Create the initial schema
+
+Revision ID: 0000_initial_schema
+Revises:
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from src.shared.database.base import Base
+from src.shared.database import models  # noqa: F401  (registers the tables)
+
+
+# revision identifiers, used by Alembic.
+revision = '0000_initial_schema'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Same DDL as create_tables(), including the updated_at triggers and the
+    # default partitions. Tables that already exist are left alone, so a
+    # database built by create_tables() can be upgraded in place; the later
+    # revisions only change what is not already in this shape.
+    Base.metadata.create_all(op.get_bind(), checkfirst=True)
+
+
+def downgrade() -> None:
+    Base.metadata.drop_all(op.get_bind(), checkfirst=True)
@@ -0,0 +1,28 @@
+"""Maintain updated_at with a Postgres trigger
+
+Revision ID: 0001_updated_at_triggers
+Revises: 0000_initial_schema
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from src.shared.database.base import SET_UPDATED_AT_FUNCTION, SET_UPDATED_AT_TRIGGERS
+
+
+# revision identifiers, used by Alembic.
+revision = '0001_updated_at_triggers'
+down_revision = '0000_initial_schema'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(SET_UPDATED_AT_FUNCTION)
+    op.execute(SET_UPDATED_AT_TRIGGERS)
+
+
+def downgrade() -> None:
+    # CASCADE drops the per-table triggers along with the function
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at() CASCADE")
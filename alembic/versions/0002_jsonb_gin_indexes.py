@@ -0,0 +1,72 @@
+"""Add jsonb_path_ops GIN indexes on JSONB columns
+
+Revision ID: 0002_jsonb_gin_indexes
+Revises: 0001_updated_at_triggers
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002_jsonb_gin_indexes'
+down_revision = '0001_updated_at_triggers'
+branch_labels = None
+depends_on = None
+
+GIN_INDEXES = [
+    ("llm_models", "config_params_json"),
+    ("agents", "tools_config"),
+    ("tasks", "context_task_ids"),
+    ("tasks", "config_json"),
+    ("workflow_executions", "inputs_json"),
+    ("workflow_executions", "final_output_json"),
+    ("workflow_executions", "usage_metrics_json"),
+    ("task_executions", "inputs_data"),
+]
+
+
+def is_partitioned(table: str) -> bool:
+    """Check whether a table is declaratively partitioned."""
+    return op.get_bind().execute(
+        sa.text("SELECT relkind = 'p' FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+        {"table": table},
+    ).scalar()
+
+
+def is_jsonb(table: str, column: str) -> bool:
+    """Check whether a column is still JSONB (0008 turns context_task_ids into an array)."""
+    return op.get_bind().execute(
+        sa.text("SELECT data_type = 'jsonb' FROM information_schema.columns "
+                "WHERE table_name = :table AND column_name = :column"),
+        {"table": table, "column": column},
+    ).scalar()
+
+
+def upgrade() -> None:
+    # CONCURRENTLY avoids blocking writes but cannot run in a transaction,
+    # and is not supported on partitioned tables
+    indexes = [(table, column) for table, column in GIN_INDEXES if is_jsonb(table, column)]
+    partitioned = {table for table, _ in indexes if is_partitioned(table)}
+    with op.get_context().autocommit_block():
+        for table, column in indexes:
+            op.create_index(
+                f"ix_{table}_{column}_gin",
+                table,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "jsonb_path_ops"},
+                postgresql_concurrently=table not in partitioned,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, column in GIN_INDEXES:
+            op.drop_index(
+                f"ix_{table}_{column}_gin",
+                table_name=table,
+                if_exists=True,
+            )
@@ -0,0 +1,49 @@
+"""Create quarterly partitions for the execution tables
+
+Revision ID: 0003_execution_partitions
+Revises: 0002_jsonb_gin_indexes
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003_execution_partitions'
+down_revision = '0002_jsonb_gin_indexes'
+branch_labels = None
+depends_on = None
+
+PARTITIONED_TABLES = ["workflow_executions", "task_executions"]
+FIRST_YEAR = 2025
+LAST_YEAR = 2027
+
+
+def quarters():
+    """Yield (suffix, start, end) for each quarter in the partitioned range."""
+    for year in range(FIRST_YEAR, LAST_YEAR + 1):
+        for quarter in range(1, 5):
+            start_month = 3 * quarter - 2
+            end = f"{year + 1}-01-01" if quarter == 4 else f"{year}-{start_month + 3:02d}-01"
+            yield f"{year}_q{quarter}", f"{year}-{start_month:02d}-01", end
+
+
+def upgrade() -> None:
+    # Rows outside these ranges go to the <table>_default partition
+    for table in PARTITIONED_TABLES:
+        for suffix, start, end in quarters():
+            op.execute(
+                f"CREATE TABLE IF NOT EXISTS {table}_{suffix} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{start}') TO ('{end}')"
+            )
+
+
+def downgrade() -> None:
+    # task_executions first, since it references workflow_executions; a
+    # partition the foreign key points into has to be detached before it
+    # can be dropped
+    for table in reversed(PARTITIONED_TABLES):
+        for suffix, _, _ in quarters():
+            op.execute(f"ALTER TABLE {table} DETACH PARTITION {table}_{suffix}")
+            op.execute(f"DROP TABLE {table}_{suffix}")
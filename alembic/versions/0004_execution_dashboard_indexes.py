@@ -0,0 +1,80 @@
+"""Add covering indexes for execution dashboard queries
+
+Revision ID: 0004_execution_dashboard_indexes
+Revises: 0003_execution_partitions
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004_execution_dashboard_indexes'
+down_revision = '0003_execution_partitions'
+branch_labels = None
+depends_on = None
+
+# (index name, table, index definition)
+INDEXES = [
+    (
+        "ix_workflow_executions_user_status_time",
+        "workflow_executions",
+        "(user_id, status, start_time DESC) INCLUDE (workflow_id, duration_ms)",
+    ),
+    (
+        "ix_workflow_executions_active_by_user",
+        "workflow_executions",
+        "(user_id, start_time) WHERE status IN ('running', 'pending')",
+    ),
+    (
+        "ix_task_executions_execution_status_time",
+        "task_executions",
+        "(execution_id, status, start_time DESC) INCLUDE (assigned_agent_id, duration_ms)",
+    ),
+]
+
+# Partitions of :table without an index attached to the partitioned index :index
+UNINDEXED_PARTITIONS = """
+SELECT inhrelid::regclass::text FROM pg_inherits
+WHERE inhparent = CAST(:table AS regclass)
+  AND inhrelid NOT IN (
+      SELECT i.indrelid FROM pg_index i
+      JOIN pg_inherits attached ON attached.inhrelid = i.indexrelid
+      WHERE attached.inhparent = CAST(:index AS regclass)
+  )
+"""
+
+
+def create_partitioned_index(name: str, table: str, definition: str) -> None:
+    """
+    Build an index on a partitioned table without blocking writes.
+
+    CREATE INDEX CONCURRENTLY is not supported on partitioned tables, so the
+    parent index is created ON ONLY the parent (invalid until complete) and
+    each partition's index is built concurrently and attached to it.
+    """
+    op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON ONLY {table} {definition}")
+
+    # Partitions created after the parent index (or with the table by
+    # create_tables()) already have a matching index attached
+    partitions = op.get_bind().execute(
+        sa.text(UNINDEXED_PARTITIONS),
+        {"table": table, "index": name},
+    ).scalars().all()
+    with op.get_context().autocommit_block():
+        for partition in partitions:
+            partition_index = f"{partition}_{name[len('ix_' + table) + 1:]}"
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {partition_index} ON {partition} {definition}")
+            op.execute(f"ALTER INDEX {name} ATTACH PARTITION {partition_index}")
+
+
+def upgrade() -> None:
+    for name, table, definition in INDEXES:
+        create_partitioned_index(name, table, definition)
+
+
+def downgrade() -> None:
+    # Dropping the parent index drops the attached partition indexes too
+    for name, _, _ in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
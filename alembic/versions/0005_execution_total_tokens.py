@@ -0,0 +1,51 @@
+"""Add generated total_tokens column to workflow executions
+
+Revision ID: 0005_execution_total_tokens
+Revises: 0004_execution_dashboard_indexes
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005_execution_total_tokens'
+down_revision = '0004_execution_dashboard_indexes'
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_workflow_executions_total_tokens"
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE workflow_executions ADD COLUMN IF NOT EXISTS total_tokens int "
+        "GENERATED ALWAYS AS ((usage_metrics_json->>'total_tokens')::int) STORED"
+    )
+
+    # workflow_executions is partitioned, so build the index concurrently on
+    # each partition and attach it to an index created ON ONLY the parent;
+    # partitions that already have one attached are skipped
+    op.execute(f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON ONLY workflow_executions (total_tokens)")
+    partitions = op.get_bind().execute(
+        sa.text("SELECT inhrelid::regclass::text FROM pg_inherits "
+                "WHERE inhparent = 'workflow_executions'::regclass "
+                "AND inhrelid NOT IN ("
+                "SELECT i.indrelid FROM pg_index i "
+                "JOIN pg_inherits attached ON attached.inhrelid = i.indexrelid "
+                "WHERE attached.inhparent = CAST(:index AS regclass))"),
+        {"index": INDEX_NAME},
+    ).scalars().all()
+    with op.get_context().autocommit_block():
+        for partition in partitions:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {partition}_total_tokens "
+                f"ON {partition} (total_tokens)"
+            )
+            op.execute(f"ALTER INDEX {INDEX_NAME} ATTACH PARTITION {partition}_total_tokens")
+
+
+def downgrade() -> None:
+    op.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+    op.execute("ALTER TABLE workflow_executions DROP COLUMN IF EXISTS total_tokens")
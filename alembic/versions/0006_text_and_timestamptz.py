@@ -0,0 +1,99 @@
+"""Use TEXT for free-form strings and TIMESTAMPTZ for timestamps
+
+Revision ID: 0006_text_and_timestamptz
+Revises: 0005_execution_total_tokens
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006_text_and_timestamptz'
+down_revision = '0005_execution_total_tokens'
+branch_labels = None
+depends_on = None
+
+# Column -> previous varchar length
+TEXT_COLUMNS = {
+    "users": {"username": 255, "email": 255, "password_hash": 255, "first_name": 255, "last_name": 255},
+    "llm_models": {"name": 255, "model_identifier": 255, "endpoint_url": 500},
+    "knowledge_bases": {"name": 255, "vector_db_collection_name": 255},
+    "kb_documents": {"original_file_name": 500, "storage_path_or_url": 1000, "content_hash": 255},
+    "agents": {"name": 255},
+    "workflows": {"name": 255},
+    "workflow_agents": {"alias_in_workflow": 255},
+}
+
+TIMESTAMP_COLUMNS = {
+    "kb_documents": ["processed_at"],
+    "workflow_executions": ["end_time"],
+    "task_executions": ["end_time"],
+}
+
+# Every model has created_at/updated_at
+ALL_TABLES = [
+    "users", "roles", "user_roles", "llm_models", "knowledge_bases",
+    "kb_documents", "agents", "agent_knowledge_bases", "workflows",
+    "workflow_agents", "tasks", "workflow_executions", "task_executions",
+]
+
+
+def _timestamp_columns(data_type: str):
+    """Yield (table, columns) for the timestamp columns currently of data_type."""
+    for table in ALL_TABLES:
+        current = set(op.get_bind().execute(
+            sa.text("SELECT column_name FROM information_schema.columns "
+                    "WHERE table_name = :table AND data_type = :data_type"),
+            {"table": table, "data_type": data_type},
+        ).scalars())
+        columns = [
+            column
+            for column in ["created_at", "updated_at"] + TIMESTAMP_COLUMNS.get(table, [])
+            if column in current
+        ]
+        if columns:
+            yield table, columns
+
+
+def upgrade() -> None:
+    for table, columns in TEXT_COLUMNS.items():
+        op.execute(
+            f"ALTER TABLE {table} "
+            + ", ".join(f"ALTER COLUMN {column} TYPE text" for column in columns)
+        )
+
+    # Existing naive values were written in UTC. start_time is the partition
+    # key of the execution tables and cannot be altered in place, so it and
+    # task_executions.execution_start_time, which references it, stay naive
+    # in tables created before this revision until they are rebuilt.
+    # Columns that are already timestamptz are skipped: converting them
+    # again would shift their values by the session time zone.
+    for table, columns in _timestamp_columns("timestamp without time zone"):
+        op.execute(
+            f"ALTER TABLE {table} "
+            + ", ".join(
+                f"ALTER COLUMN {column} TYPE timestamptz USING {column} AT TIME ZONE 'UTC'"
+                for column in columns
+            )
+        )
+
+
+def downgrade() -> None:
+    for table, columns in _timestamp_columns("timestamp with time zone"):
+        op.execute(
+            f"ALTER TABLE {table} "
+            + ", ".join(
+                f"ALTER COLUMN {column} TYPE timestamp USING {column} AT TIME ZONE 'UTC'"
+                for column in columns
+            )
+        )
+
+    for table, columns in TEXT_COLUMNS.items():
+        op.execute(
+            f"ALTER TABLE {table} "
+            + ", ".join(
+                f"ALTER COLUMN {column} TYPE varchar({length})" for column, length in columns.items()
+            )
+        )
@@ -0,0 +1,94 @@
+"""Add status CHECK constraints and NULLS NOT DISTINCT association uniques
+
+Revision ID: 0007_status_checks_unique_nulls
+Revises: 0006_text_and_timestamptz
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007_status_checks_unique_nulls'
+down_revision = '0006_text_and_timestamptz'
+branch_labels = None
+depends_on = None
+
+STATUS_VALUES = {
+    "knowledge_bases": ["pending", "indexing", "ready", "error"],
+    "kb_documents": ["pending_processing", "processing", "processed", "error_processing"],
+    "workflow_executions": ["pending", "running", "completed", "failed", "cancelled"],
+    "task_executions": ["pending", "running", "completed", "failed"],
+}
+
+# (constraint name, table, columns)
+UNIQUE_CONSTRAINTS = [
+    ("uq_user_role", "user_roles", "user_id, role_id"),
+    ("uq_agent_kb", "agent_knowledge_bases", "agent_id, kb_id"),
+]
+
+
+def constraint_exists(table: str, name: str) -> bool:
+    """Check whether a table already has a constraint with this name."""
+    return op.get_bind().execute(
+        sa.text("SELECT EXISTS (SELECT 1 FROM pg_constraint "
+                "WHERE conrelid = CAST(:table AS regclass) AND conname = :name)"),
+        {"table": table, "name": name},
+    ).scalar()
+
+
+def is_nulls_not_distinct(table: str, name: str) -> bool:
+    """Check whether a unique constraint already treats NULLs as equal."""
+    return op.get_bind().execute(
+        sa.text("SELECT i.indnullsnotdistinct FROM pg_constraint c "
+                "JOIN pg_index i ON i.indexrelid = c.conindid "
+                "WHERE c.conrelid = CAST(:table AS regclass) AND c.conname = :name"),
+        {"table": table, "name": name},
+    ).scalar()
+
+
+def upgrade() -> None:
+    # Tables created from the models already have these constraints
+    # (status_check() produces the same ck_<table>_status name)
+    # NOT VALID skips the full-table scan under the ACCESS EXCLUSIVE lock;
+    # VALIDATE then scans holding only SHARE UPDATE EXCLUSIVE
+    for table, statuses in STATUS_VALUES.items():
+        if constraint_exists(table, f"ck_{table}_status"):
+            continue
+        allowed = ", ".join(f"'{status}'" for status in statuses)
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT ck_{table}_status "
+            f"CHECK (status IN ({allowed})) NOT VALID"
+        )
+        op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT ck_{table}_status")
+
+    uniques = [
+        (name, table, columns)
+        for name, table, columns in UNIQUE_CONSTRAINTS
+        if not is_nulls_not_distinct(table, name)
+    ]
+
+    # Build the replacement index without blocking writes, then swap it in
+    with op.get_context().autocommit_block():
+        for name, table, columns in uniques:
+            op.execute(
+                f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {name}_nnd "
+                f"ON {table} ({columns}) NULLS NOT DISTINCT"
+            )
+    for name, table, _ in uniques:
+        op.execute(
+            f"ALTER TABLE {table} DROP CONSTRAINT {name}, "
+            f"ADD CONSTRAINT {name} UNIQUE USING INDEX {name}_nnd"
+        )
+
+
+def downgrade() -> None:
+    for name, table, columns in UNIQUE_CONSTRAINTS:
+        op.execute(
+            f"ALTER TABLE {table} DROP CONSTRAINT {name}, "
+            f"ADD CONSTRAINT {name} UNIQUE ({columns})"
+        )
+
+    for table in STATUS_VALUES:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS ck_{table}_status")
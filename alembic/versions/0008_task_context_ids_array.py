@@ -0,0 +1,58 @@
+"""Store task context ids as a bigint array
+
+Revision ID: 0008_task_context_ids_array
+Revises: 0007_status_checks_unique_nulls
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0008_task_context_ids_array'
+down_revision = '0007_status_checks_unique_nulls'
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_tasks_context_task_ids_gin"
+
+
+def column_type() -> str:
+    """Current type of tasks.context_task_ids, e.g. 'jsonb' or 'bigint[]'."""
+    return op.get_bind().execute(
+        sa.text("SELECT format_type(atttypid, atttypmod) FROM pg_attribute "
+                "WHERE attrelid = 'tasks'::regclass AND attname = 'context_task_ids'")
+    ).scalar()
+
+
+def upgrade() -> None:
+    # Tables created from the models already have the array column and its index
+    if column_type() == "jsonb":
+        # The jsonb_path_ops index cannot survive the type change
+        op.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+        # USING cannot contain a subquery, so rewrite the JSON array literal
+        # [1, 2] as the Postgres array literal {1, 2}
+        op.execute(
+            "ALTER TABLE tasks ALTER COLUMN context_task_ids TYPE bigint[] "
+            "USING translate(context_task_ids::text, '[]', '{}')::bigint[]"
+        )
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+            "ON tasks USING gin (context_task_ids)"
+        )
+
+
+def downgrade() -> None:
+    if column_type() == "bigint[]":
+        op.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+        op.execute(
+            "ALTER TABLE tasks ALTER COLUMN context_task_ids TYPE jsonb "
+            "USING to_jsonb(context_task_ids)"
+        )
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+            "ON tasks USING gin (context_task_ids jsonb_path_ops)"
+        )
@@ -0,0 +1,103 @@
+"""Compute execution duration_ms as a generated column
+
+Revision ID: 0009_generated_duration_ms
+Revises: 0008_task_context_ids_array
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0009_generated_duration_ms'
+down_revision = '0008_task_context_ids_array'
+branch_labels = None
+depends_on = None
+
+# Covering indexes from 0004 that INCLUDE duration_ms and are dropped with it
+COVERING_INDEXES = {
+    "workflow_executions": (
+        "ix_workflow_executions_user_status_time",
+        "(user_id, status, start_time DESC) INCLUDE (workflow_id, duration_ms)",
+    ),
+    "task_executions": (
+        "ix_task_executions_execution_status_time",
+        "(execution_id, status, start_time DESC) INCLUDE (assigned_agent_id, duration_ms)",
+    ),
+}
+
+# Partitions of :table without an index attached to the partitioned index :index
+UNINDEXED_PARTITIONS = """
+SELECT inhrelid::regclass::text FROM pg_inherits
+WHERE inhparent = CAST(:table AS regclass)
+  AND inhrelid NOT IN (
+      SELECT i.indrelid FROM pg_index i
+      JOIN pg_inherits attached ON attached.inhrelid = i.indexrelid
+      WHERE attached.inhparent = CAST(:index AS regclass)
+  )
+"""
+
+
+def duration_expression(table: str) -> str:
+    """
+    Duration in milliseconds between start_time and end_time.
+
+    Tables created before 0006 keep a naive start_time, and subtracting it
+    from a timestamptz depends on the session time zone, which a generated
+    column does not allow; end_time is converted back to naive UTC instead.
+    """
+    start_type = op.get_bind().execute(
+        sa.text("SELECT data_type FROM information_schema.columns "
+                "WHERE table_name = :table AND column_name = 'start_time'"),
+        {"table": table},
+    ).scalar()
+    end_time = "end_time AT TIME ZONE 'UTC'" if start_type == "timestamp without time zone" else "end_time"
+    return f"(EXTRACT(EPOCH FROM ({end_time} - start_time)) * 1000)::bigint"
+
+
+def create_partitioned_index(name: str, table: str, definition: str) -> None:
+    """Create an index ON ONLY the parent and attach concurrently built partition indexes."""
+    op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON ONLY {table} {definition}")
+
+    # Partitions created after the parent index (or with the table by
+    # create_tables()) already have a matching index attached
+    partitions = op.get_bind().execute(
+        sa.text(UNINDEXED_PARTITIONS),
+        {"table": table, "index": name},
+    ).scalars().all()
+    with op.get_context().autocommit_block():
+        for partition in partitions:
+            partition_index = f"{partition}_{name[len('ix_' + table) + 1:]}"
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {partition_index} ON {partition} {definition}")
+            op.execute(f"ALTER INDEX {name} ATTACH PARTITION {partition_index}")
+
+
+def is_generated(table: str, column: str) -> bool:
+    """Check whether a column is already a generated column."""
+    return op.get_bind().execute(
+        sa.text("SELECT is_generated = 'ALWAYS' FROM information_schema.columns "
+                "WHERE table_name = :table AND column_name = :column"),
+        {"table": table, "column": column},
+    ).scalar()
+
+
+def upgrade() -> None:
+    # Rewrites both tables; existing durations are recomputed from the timestamps
+    for table, (covering_index, definition) in COVERING_INDEXES.items():
+        if not is_generated(table, "duration_ms"):
+            op.execute(
+                f"ALTER TABLE {table} DROP COLUMN duration_ms, "
+                f"ADD COLUMN duration_ms bigint GENERATED ALWAYS AS ({duration_expression(table)}) STORED"
+            )
+        create_partitioned_index(covering_index, table, definition)
+        create_partitioned_index(f"ix_{table}_duration_ms", table, "(duration_ms)")
+
+
+def downgrade() -> None:
+    for table, (covering_index, definition) in COVERING_INDEXES.items():
+        op.execute(f"ALTER TABLE {table} ADD COLUMN duration_ms_stored integer")
+        op.execute(f"UPDATE {table} SET duration_ms_stored = duration_ms")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN duration_ms")
+        op.execute(f"ALTER TABLE {table} RENAME COLUMN duration_ms_stored TO duration_ms")
+        create_partitioned_index(covering_index, table, definition)
@@ -0,0 +1,46 @@
+"""
+Array reductions over workflow execution samples.
+
+Compiled with Numba when it is installed, otherwise evaluated with NumPy.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _summarize_loop(dur: np.ndarray, ok: np.ndarray) -> Tuple[int, float, float, float, int]:
+    """
+    Count, sum, min, max and successes of a non-empty window of samples, in
+    one pass (loop form for Numba).
+
+    min/max start from the first sample rather than infinity sentinels,
+    which fastmath lets the compiler assume never occur.
+    """
+    n = len(dur)
+    total = dur[0]
+    low = dur[0]
+    high = dur[0]
+    successes = int(ok[0])
+    for i in range(1, n):
+        value = dur[i]
+        total += value
+        low = min(low, value)
+        high = max(high, value)
+        successes += ok[i]
+    return n, total, low, high, successes
+
+
+def _summarize_vectorized(dur: np.ndarray, ok: np.ndarray) -> Tuple[int, float, float, float, int]:
+    """Count, sum, min, max and successes of a non-empty window of samples (NumPy form)."""
+    return len(dur), float(dur.sum()), float(dur.min()), float(dur.max()), int(np.count_nonzero(ok))
+
+
+# Compile the reduction when Numba is installed; NumPy otherwise.
+summarize = njit(cache=True, fastmath=True)(_summarize_loop) if NUMBA_AVAILABLE else _summarize_vectorized
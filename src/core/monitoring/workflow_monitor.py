@@ -2,11 +2,23 @@
 WorkflowMonitor - Performance monitoring and analytics for CrewAI workflows.
 """
 
+import math
+import sys
+from array import array
+import threading
 import time
 import logging
-from typing import Dict, Any, Optional, List
+import weakref
+from typing import Callable, Dict, Any, Iterator, NamedTuple, Optional, List, Tuple
 from datetime import datetime, timedelta
-from collections import defaultdict, deque
+from collections import deque
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from ._kernels import summarize
 
 try:
     from prometheus_client import Counter, Histogram, Gauge, start_http_server
@@ -15,6 +27,269 @@ except ImportError:
     PROMETHEUS_AVAILABLE = False
 
 
+# Per-sample layout of the execution ring buffers: start time, duration, outcome
+_RECORD_DTYPE = np.dtype([('ts', 'i8'), ('dur', 'f8'), ('ok', '?')])
+
+# Samples retained per workflow for windowed queries and error-rate checks
+EXECUTION_RECORDS_PER_WORKFLOW = 10_000
+
+# Seconds between background Prometheus updates; far below any scrape interval
+PROMETHEUS_FLUSH_INTERVAL = 0.1
+
+
+def _drain_prometheus(monitor_ref: "weakref.ref[WorkflowMonitor]", stop: threading.Event) -> None:
+    """
+    Background loop flushing a monitor's Prometheus updates until it is
+    closed. Only a weak reference is held, so a monitor that is dropped
+    without close() is still collected and its thread exits.
+    """
+    while not stop.wait(PROMETHEUS_FLUSH_INTERVAL):
+        monitor = monitor_ref()
+        if monitor is None:
+            return
+        try:
+            monitor._flush_prom()
+        except Exception as e:
+            monitor.logger.warning(f"Failed to update Prometheus metrics: {e}")
+        del monitor
+    
+    monitor = monitor_ref()
+    if monitor is not None:
+        monitor._flush_prom()
+
+
+def _epoch_ns(moment: datetime) -> int:
+    """Integer nanoseconds since the epoch, at microsecond resolution."""
+    return int(moment.timestamp() * 1_000_000) * 1000
+
+
+@lru_cache(maxsize=1024)
+def _parse_workflow_name(workflow_id: str) -> str:
+    """
+    Workflow name is the part of the ID before the first underscore.
+    
+    Names are interned so every record and label key of a workflow shares
+    one string, and dict lookups on it short-circuit on identity.
+    """
+    return sys.intern(workflow_id.partition('_')[0])
+
+
+class Alert(NamedTuple):
+    """A performance alert; value is the execution time or error rate that crossed threshold."""
+    type: str
+    workflow_name: str
+    value: float
+    threshold: float
+
+
+@dataclass(slots=True)
+class ActiveExecution:
+    """A workflow execution that has started but not yet ended."""
+    workflow_id: str
+    workflow_name: str
+    start_time: datetime
+    start_ns: int
+    metadata: Dict[str, Any]
+
+
+class RingDeque:
+    """
+    Bounded FIFO over a contiguous NumPy array.
+    
+    Unlike collections.deque, indexing is O(1) and the newest k items are a
+    slice rather than a walk over linked blocks.
+    """
+    
+    __slots__ = ('buf', 'head', 'size')
+    
+    def __init__(self, maxlen: int, dtype: Any = object):
+        self.buf = np.empty(maxlen, dtype)
+        self.head = 0
+        self.size = 0
+    
+    @property
+    def maxlen(self) -> int:
+        return len(self.buf)
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError('RingDeque index out of range')
+        return self.buf[(self.head + index) % len(self.buf)]
+    
+    def __iter__(self):
+        return iter(self.view())
+    
+    def append(self, item: Any):
+        """Add an item, overwriting the oldest one when full."""
+        capacity = len(self.buf)
+        self.buf[(self.head + self.size) % capacity] = item
+        if self.size < capacity:
+            self.size += 1
+        else:
+            self.head = (self.head + 1) % capacity
+    
+    def latest(self, k: int) -> np.ndarray:
+        """The newest k items, oldest first."""
+        k = min(k, self.size)
+        return self._slice(self.size - k, self.size)
+    
+    def view(self) -> np.ndarray:
+        """All items, oldest first; copies only once the buffer has wrapped."""
+        return self._slice(0, self.size)
+    
+    def _slice(self, start: int, stop: int) -> np.ndarray:
+        capacity = len(self.buf)
+        begin = (self.head + start) % capacity
+        end = begin + stop - start
+        if end <= capacity:
+            return self.buf[begin:end]
+        return np.concatenate((self.buf[begin:], self.buf[:end - capacity]))
+
+
+class _RingBuffer(RingDeque):
+    """
+    Fixed-capacity execution samples for one workflow, sorted by start time.
+    
+    Once full, each append overwrites the oldest sample. The running totals
+    cover every execution ever recorded, including overwritten ones, and the
+    recent failure count covers the last `window` executions to complete.
+    """
+    
+    __slots__ = ('count', 'total', 'min', 'max', 'successes',
+                 'recent_size', 'recent_failures', '_recent', '_recent_pos')
+    
+    def __init__(self, capacity: int = EXECUTION_RECORDS_PER_WORKFLOW, window: int = 10):
+        super().__init__(capacity, _RECORD_DTYPE)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.successes = 0
+        self.recent_size = 0
+        self.recent_failures = 0
+        self._recent = array('B', bytes(window))
+        self._recent_pos = 0
+    
+    def append(self, ts: int, dur: float, ok: bool):
+        """Add a sample, overwriting the oldest one when the buffer is full."""
+        super().append((ts, dur, ok))
+        
+        # Executions can finish out of start order; sink the sample until sorted
+        buf = self.buf
+        capacity = len(buf)
+        i = self.size - 1
+        while i > 0:
+            prev, cur = (self.head + i - 1) % capacity, (self.head + i) % capacity
+            if buf['ts'][prev] <= ts:
+                break
+            buf[[prev, cur]] = buf[[cur, prev]]
+            i -= 1
+        
+        self.count += 1
+        self.total += dur
+        self.min = min(self.min, dur)
+        self.max = max(self.max, dur)
+        self.successes += bool(ok)
+        
+        # Rolling failure count over the last `window` completions
+        failed = 0 if ok else 1
+        recent = self._recent
+        if self.recent_size == len(recent):
+            self.recent_failures -= recent[self._recent_pos]
+        else:
+            self.recent_size += 1
+        recent[self._recent_pos] = failed
+        self.recent_failures += failed
+        self._recent_pos = (self._recent_pos + 1) % len(recent)
+    
+    def since(self, ts: int) -> np.ndarray:
+        """
+        Samples that started at or after ts, oldest first.
+        
+        Binary-searches the one or two contiguous runs of the buffer in place,
+        so only the matching samples are ever copied.
+        """
+        buf_ts = self.buf['ts']
+        capacity = len(buf_ts)
+        end = self.head + self.size
+        if end <= capacity:
+            start = int(np.searchsorted(buf_ts[self.head:end], ts))
+        else:
+            older = buf_ts[self.head:]
+            if ts <= older[-1]:
+                start = int(np.searchsorted(older, ts))
+            else:
+                start = len(older) + int(np.searchsorted(buf_ts[:end - capacity], ts))
+        return self._slice(start, self.size)
+
+
+class _StripedDict(MutableMapping):
+    """
+    Mapping split into shards, each guarded by its own lock, so threads
+    working on different keys never serialize on one another.
+    
+    Like defaultdict, a missing key is created from default_factory on lookup.
+    """
+    
+    _SHARDS = 16
+    
+    def __init__(self, default_factory: Optional[Callable[[], Any]] = None):
+        self.default_factory = default_factory
+        self._locks = [threading.Lock() for _ in range(self._SHARDS)]
+        self._shards: List[Dict[Any, Any]] = [{} for _ in range(self._SHARDS)]
+    
+    def lock_for(self, key: Any) -> threading.Lock:
+        """Lock of the shard holding key, for compound updates to its value."""
+        return self._locks[hash(key) & (self._SHARDS - 1)]
+    
+    def __getitem__(self, key: Any) -> Any:
+        index = hash(key) & (self._SHARDS - 1)
+        shard = self._shards[index]
+        try:
+            return shard[key]
+        except KeyError:
+            if self.default_factory is None:
+                raise
+        with self._locks[index]:
+            value = shard.get(key)
+            if value is None:
+                value = shard[key] = self.default_factory()
+            return value
+    
+    def __setitem__(self, key: Any, value: Any):
+        index = hash(key) & (self._SHARDS - 1)
+        with self._locks[index]:
+            self._shards[index][key] = value
+    
+    def __delitem__(self, key: Any):
+        index = hash(key) & (self._SHARDS - 1)
+        with self._locks[index]:
+            del self._shards[index][key]
+    
+    def __contains__(self, key: Any) -> bool:
+        return key in self._shards[hash(key) & (self._SHARDS - 1)]
+    
+    def __iter__(self) -> Iterator[Any]:
+        for shard in self._shards:
+            yield from list(shard)
+    
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._shards[hash(key) & (self._SHARDS - 1)].get(key, default)
+    
+    def pop(self, key: Any, *default: Any) -> Any:
+        index = hash(key) & (self._SHARDS - 1)
+        with self._locks[index]:
+            return self._shards[index].pop(key, *default)
+
+
 class WorkflowMonitor:
     """
     Monitoring and analytics system for CrewAI workflows.
@@ -27,17 +302,47 @@ class WorkflowMonitor:
         self.enable_prometheus = enable_prometheus and PROMETHEUS_AVAILABLE
         
         # In-memory metrics storage
-        self.execution_metrics: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-        self.active_executions: Dict[str, Dict[str, Any]] = {}
-        self.performance_history: deque = deque(maxlen=1000)
+        self.execution_metrics: MutableMapping[str, _RingBuffer] = _StripedDict(
+            lambda: _RingBuffer(window=self.error_rate_window)
+        )
+        self.active_executions: MutableMapping[str, ActiveExecution] = _StripedDict()
+        self.performance_history = RingDeque(maxlen=1000)
+        self._history_lock = threading.Lock()
+        
+        # Running totals across all workflows for get_system_health
+        self._global_count = 0
+        self._global_sum = 0.0
+        self._global_success = 0
+        self._totals_lock = threading.Lock()
         
         # Performance thresholds
         self.execution_time_threshold = 300  # 5 minutes
         self.error_rate_threshold = 0.1  # 10%
+        self.error_rate_window = 10  # Most recent executions considered, fixed per workflow on first record
+        self.min_samples_for_error_rate = 5
+        
+        # Labelled children of the Prometheus metrics, resolved once per label set
+        self._counter_children: Dict[tuple, Any] = {}
+        self._hist_children: Dict[str, Any] = {}
+        self._error_children: Dict[tuple, Any] = {}
+        
+        # Completed executions awaiting Prometheus updates, applied off the
+        # caller's thread; the oldest are dropped if the drain falls behind
+        self._prom_queue: deque = deque(maxlen=65536)
+        self._prom_flush_lock = threading.Lock()
+        self._prom_stop = threading.Event()
+        self._prom_thread: Optional[threading.Thread] = None
         
         # Initialize Prometheus metrics if available
         if self.enable_prometheus:
             self._init_prometheus_metrics()
+            self._prom_thread = threading.Thread(
+                target=_drain_prometheus,
+                args=(weakref.ref(self), self._prom_stop),
+                name='workflow-monitor-prometheus',
+                daemon=True,
+            )
+            self._prom_thread.start()
             if prometheus_port:
                 try:
                     start_http_server(prometheus_port)
@@ -73,6 +378,60 @@ class WorkflowMonitor:
             ['workflow_name', 'error_type']
         )
     
+    def _counter_for(self, workflow_name: str, status: str) -> Any:
+        """Cached executions counter child for a workflow and status."""
+        key = (workflow_name, status)
+        child = self._counter_children.get(key)
+        if child is None:
+            child = self._counter_children[key] = self.workflow_executions_total.labels(
+                workflow_name=workflow_name, status=status
+            )
+        return child
+    
+    def _hist_for(self, workflow_name: str) -> Any:
+        """Cached duration histogram child for a workflow."""
+        child = self._hist_children.get(workflow_name)
+        if child is None:
+            child = self._hist_children[workflow_name] = self.workflow_execution_duration.labels(
+                workflow_name=workflow_name
+            )
+        return child
+    
+    def _errors_for(self, workflow_name: str, error_type: str) -> Any:
+        """Cached errors counter child for a workflow and error type."""
+        key = (workflow_name, error_type)
+        child = self._error_children.get(key)
+        if child is None:
+            child = self._error_children[key] = self.workflow_errors_total.labels(
+                workflow_name=workflow_name, error_type=error_type
+            )
+        return child
+    
+    def _flush_prom(self):
+        """Apply all queued Prometheus updates."""
+        queue = self._prom_queue
+        with self._prom_flush_lock:
+            while True:
+                try:
+                    workflow_name, success, execution_time = queue.popleft()
+                except IndexError:
+                    return
+                
+                status = 'success' if success else 'failure'
+                self._counter_for(workflow_name, status).inc()
+                self._hist_for(workflow_name).observe(execution_time)
+                self.active_workflows.dec()
+                
+                if not success:
+                    self._errors_for(workflow_name, 'execution_failed').inc()
+    
+    def close(self):
+        """Stop the Prometheus update thread after applying pending updates."""
+        self._prom_stop.set()
+        if self._prom_thread is not None:
+            self._prom_thread.join()
+            self._prom_thread = None
+    
     def start_execution(self, workflow_id: str, metadata: Optional[Dict[str, Any]] = None):
         """
         Start monitoring a workflow execution.
@@ -82,14 +441,15 @@ class WorkflowMonitor:
             metadata: Additional metadata about the execution
         """
         start_time = datetime.now()
-        workflow_name = workflow_id.split('_')[0]  # Extract name from ID
-        
-        execution_data = {
-            'workflow_id': workflow_id,
-            'workflow_name': workflow_name,
-            'start_time': start_time,
-            'metadata': metadata or {}
-        }
+        workflow_name = _parse_workflow_name(workflow_id)
+        
+        execution_data = ActiveExecution(
+            workflow_id=workflow_id,
+            workflow_name=workflow_name,
+            start_time=start_time,
+            start_ns=time.monotonic_ns(),
+            metadata=metadata or {}
+        )
         
         self.active_executions[workflow_id] = execution_data
         
@@ -98,7 +458,7 @@ class WorkflowMonitor:
         
         self.logger.info(f"Started monitoring workflow: {workflow_id}")
     
-    def end_execution(self, workflow_id: str, success: bool, execution_time: float, 
+    def end_execution(self, workflow_id: str, success: bool, execution_time: Optional[float] = None, 
                      result_data: Optional[Dict[str, Any]] = None):
         """
         End monitoring for a workflow execution.
@@ -106,58 +466,78 @@ class WorkflowMonitor:
         Args:
             workflow_id: Workflow identifier
             success: Whether the execution was successful
-            execution_time: Total execution time in seconds
+            execution_time: Total execution time in seconds; measured on the
+                monotonic clock since start_execution when omitted
             result_data: Additional result data
         """
-        if workflow_id not in self.active_executions:
+        execution_data = self.active_executions.pop(workflow_id, None)
+        if execution_data is None:
             self.logger.warning(f"Workflow {workflow_id} not found in active executions")
             return
         
-        execution_data = self.active_executions.pop(workflow_id)
-        workflow_name = execution_data['workflow_name']
+        workflow_name = execution_data.workflow_name
+        start_time = execution_data.start_time
+        if execution_time is None:
+            execution_time = (time.monotonic_ns() - execution_data.start_ns) / 1e9
         
-        # Create execution record
-        execution_record = {
-            **execution_data,
-            'end_time': datetime.now(),
-            'execution_time': execution_time,
-            'success': success,
-            'result_data': result_data or {}
-        }
+        # Store metrics; the sample append also snapshots the error-rate
+        # counters, so the alert check needs no second lookup or lock
+        recent = self._record(workflow_name, start_time, execution_time, success)
         
-        # Store metrics
-        self.execution_metrics[workflow_name].append(execution_record)
-        self.performance_history.append(execution_record)
+        # end_time follows from the duration rather than a second wall-clock read
+        history = self.performance_history
+        with self._history_lock:
+            history.append({
+                'workflow_id': workflow_id,
+                'workflow_name': workflow_name,
+                'start_time': start_time,
+                'metadata': execution_data.metadata,
+                'end_time': start_time + timedelta(seconds=execution_time),
+                'execution_time': execution_time,
+                'success': success,
+                'result_data': result_data or {}
+            })
         
-        # Update Prometheus metrics
+        # Update Prometheus metrics from the background thread
         if self.enable_prometheus:
-            status = 'success' if success else 'failure'
-            self.workflow_executions_total.labels(
-                workflow_name=workflow_name, status=status
-            ).inc()
-            
-            self.workflow_execution_duration.labels(
-                workflow_name=workflow_name
-            ).observe(execution_time)
-            
-            self.active_workflows.dec()
-            
-            if not success:
-                self.workflow_errors_total.labels(
-                    workflow_name=workflow_name, error_type='execution_failed'
-                ).inc()
+            self._prom_queue.append((workflow_name, success, execution_time))
         
         # Check for performance alerts
-        self._check_performance_alerts(workflow_name, execution_time, success)
+        self._check_performance_alerts(workflow_name, execution_time, success, recent)
         
         status_msg = "successfully" if success else "with errors"
         self.logger.info(f"Workflow {workflow_id} completed {status_msg} in {execution_time:.2f}s")
     
+    def _record(self, workflow_name: str, start_time: datetime, execution_time: float,
+                success: bool) -> Tuple[int, int]:
+        """
+        Add an execution sample to the workflow's ring buffer.
+        
+        Returns:
+            The workflow's recent sample and failure counts after the append
+        """
+        workflow_name = sys.intern(workflow_name)
+        metrics = self.execution_metrics
+        series = metrics[workflow_name]
+        with metrics.lock_for(workflow_name):
+            series.append(_epoch_ns(start_time), execution_time, success)
+            recent = series.recent_size, series.recent_failures
+        
+        with self._totals_lock:
+            self._global_count += 1
+            self._global_sum += execution_time
+            self._global_success += bool(success)
+        
+        return recent
+    
     def get_workflow_metrics(self, workflow_name: str, 
                            time_window: Optional[timedelta] = None) -> Dict[str, Any]:
         """
         Get metrics for a specific workflow.
         
+        All-time metrics cover every execution; windowed metrics only see the
+        samples still held in the workflow's ring buffer.
+        
         Args:
             workflow_name: Name of the workflow
             time_window: Optional time window for metrics (defaults to last 24 hours)
@@ -168,29 +548,28 @@ class WorkflowMonitor:
         if workflow_name not in self.execution_metrics:
             return {'error': f'No metrics found for workflow: {workflow_name}'}
         
-        executions = self.execution_metrics[workflow_name]
-        
-        # Filter by time window if specified
-        if time_window:
-            cutoff_time = datetime.now() - time_window
-            executions = [
-                exec_data for exec_data in executions
-                if exec_data['start_time'] >= cutoff_time
-            ]
+        series = self.execution_metrics[workflow_name]
+        cutoff = _epoch_ns(datetime.now() - time_window) if time_window else None
         
-        if not executions:
-            return {'error': 'No executions found in specified time window'}
+        with self.execution_metrics.lock_for(workflow_name):
+            if time_window:
+                # Samples are sorted by start time, so the window is a suffix
+                samples = series.since(cutoff)
+                
+                if not len(samples):
+                    return {'error': 'No executions found in specified time window'}
+                
+                (total_executions, total_execution_time, min_execution_time,
+                 max_execution_time, successful_executions) = summarize(samples['dur'], samples['ok'])
+                avg_execution_time = total_execution_time / total_executions
+            else:
+                total_executions = series.count
+                successful_executions = series.successes
+                avg_execution_time = series.total / total_executions
+                min_execution_time = series.min
+                max_execution_time = series.max
         
-        # Calculate metrics
-        total_executions = len(executions)
-        successful_executions = sum(1 for exec_data in executions if exec_data['success'])
         failed_executions = total_executions - successful_executions
-        
-        execution_times = [exec_data['execution_time'] for exec_data in executions]
-        avg_execution_time = sum(execution_times) / len(execution_times)
-        min_execution_time = min(execution_times)
-        max_execution_time = max(execution_times)
-        
         success_rate = successful_executions / total_executions if total_executions > 0 else 0
         
         return {
@@ -210,17 +589,15 @@ class WorkflowMonitor:
         active_workflows = len(self.active_executions)
         total_workflows = len(self.execution_metrics)
         
-        # Calculate overall success rate
-        all_executions = []
-        for workflow_executions in self.execution_metrics.values():
-            all_executions.extend(workflow_executions)
+        # Calculate overall success rate from the running totals
+        with self._totals_lock:
+            total_executions = self._global_count
+            successful = self._global_success
+            total_execution_time = self._global_sum
         
-        if all_executions:
-            successful = sum(1 for exec_data in all_executions if exec_data['success'])
-            overall_success_rate = successful / len(all_executions)
-            
-            execution_times = [exec_data['execution_time'] for exec_data in all_executions]
-            avg_execution_time = sum(execution_times) / len(execution_times)
+        if total_executions:
+            overall_success_rate = successful / total_executions
+            avg_execution_time = total_execution_time / total_executions
         else:
             overall_success_rate = 1.0
             avg_execution_time = 0.0
@@ -234,37 +611,36 @@ class WorkflowMonitor:
             'timestamp': datetime.now().isoformat()
         }
     
-    def _check_performance_alerts(self, workflow_name: str, execution_time: float, success: bool):
-        """Check for performance issues and generate alerts."""
+    def _check_performance_alerts(self, workflow_name: str, execution_time: float, success: bool,
+                                  recent: Optional[Tuple[int, int]] = None) -> List[Alert]:
+        """
+        Check for performance issues and generate alerts.
+        
+        recent is the (sample count, failure count) pair returned by _record;
+        when omitted it is read from the workflow's ring buffer.
+        """
         alerts = []
+        time_threshold = self.execution_time_threshold
+        error_rate_threshold = self.error_rate_threshold
         
         # Check execution time threshold
-        if execution_time > self.execution_time_threshold:
-            alert = {
-                'type': 'slow_execution',
-                'workflow_name': workflow_name,
-                'execution_time': execution_time,
-                'threshold': self.execution_time_threshold,
-                'timestamp': datetime.now()
-            }
-            alerts.append(alert)
+        if execution_time > time_threshold:
+            alerts.append(Alert('slow_execution', workflow_name, execution_time, time_threshold))
             self.logger.warning(f"Slow execution alert: {workflow_name} took {execution_time:.2f}s")
         
         # Check error rate
-        if workflow_name in self.execution_metrics:
-            recent_executions = self.execution_metrics[workflow_name][-10:]  # Last 10 executions
-            if len(recent_executions) >= 5:  # Only check if we have enough data
-                error_rate = sum(1 for exec_data in recent_executions if not exec_data['success']) / len(recent_executions)
+        if recent is None:
+            series = self.execution_metrics.get(workflow_name)
+            if series is not None:
+                with self.execution_metrics.lock_for(workflow_name):
+                    recent = series.recent_size, series.recent_failures
+        if recent is not None:
+            recent_size, recent_failures = recent
+            if recent_size >= self.min_samples_for_error_rate:  # Only check if we have enough data
+                error_rate = recent_failures / recent_size
                 
-                if error_rate > self.error_rate_threshold:
-                    alert = {
-                        'type': 'high_error_rate',
-                        'workflow_name': workflow_name,
-                        'error_rate': error_rate,
-                        'threshold': self.error_rate_threshold,
-                        'timestamp': datetime.now()
-                    }
-                    alerts.append(alert)
+                if error_rate > error_rate_threshold:
+                    alerts.append(Alert('high_error_rate', workflow_name, error_rate, error_rate_threshold))
                     self.logger.warning(f"High error rate alert: {workflow_name} has {error_rate:.2%} error rate")
         
         return alerts
@@ -2,25 +2,73 @@
 CrewManager - Core orchestration engine for managing multi-agent workflows.
 """
 
+import asyncio
+import hashlib
+import heapq
+import itertools
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Deque, Dict, Any, Iterable, List, Optional, Tuple
+from datetime import datetime, timedelta
 from pathlib import Path
 
+import orjson
 from crewai import Crew
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ..monitoring.workflow_monitor import WorkflowMonitor
 
 
 class WorkflowConfig(BaseModel):
     """Configuration for a workflow execution."""
+    model_config = ConfigDict(frozen=True)
+    
     name: str = Field(..., description="Workflow name")
     description: str = Field("", description="Workflow description")
     agents: List[Dict[str, Any]] = Field([], description="Agent configurations")
     tasks: List[Dict[str, Any]] = Field([], description="Task configurations") 
     inputs: Dict[str, Any] = Field({}, description="Input parameters")
     output_dir: Optional[str] = Field(None, description="Output directory")
+    
+    def fingerprint(self) -> str:
+        """Hash of the agent and task definitions, which determine the crew built from them."""
+        payload = orjson.dumps(
+            {"agents": self.agents, "tasks": self.tasks},
+            option=orjson.OPT_SORT_KEYS,
+            default=str
+        )
+        return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class ExecutionRecord:
+    """A single workflow execution in the CrewManager history."""
+    workflow_id: str
+    status: str
+    start_time: datetime
+    end_time: datetime
+    execution_time: float
+    inputs: Dict[str, Any]
+    result: Optional[str] = None
+    error: Optional[str] = None
+
+
+# Oldest records are dropped beyond this so long-running managers stay bounded
+MAX_EXECUTION_HISTORY = 10_000
+
+# Workflows kicked off at once per manager, to stay within LLM rate limits
+MAX_CONCURRENT_WORKFLOWS = int(os.getenv("CREW_MAX_CONCURRENCY", "8"))
+
+
+def _workflow_name(workflow_id: str) -> str:
+    """Strip the _YYYYmmdd_HHMMSS suffix that load_workflow appends to the name."""
+    return workflow_id.rsplit('_', 2)[0]
 
 
 class CrewManager:
@@ -32,9 +80,54 @@ class CrewManager:
     
     def __init__(self, monitor: Optional[WorkflowMonitor] = None):
         self.logger = logging.getLogger(__name__)
+        # A monitor passed in belongs to the caller; only our own is closed
+        self._owns_monitor = monitor is None
         self.monitor = monitor or WorkflowMonitor()
         self.active_crews: Dict[str, Crew] = {}
-        self.execution_history: List[Dict[str, Any]] = []
+        # Never-executed crews keyed by WorkflowConfig.fingerprint(); loads
+        # hand out copies, which reuse the agents' LLM clients and tools
+        self._materialized: Dict[str, Crew] = {}
+        self.execution_history = []
+        # asyncio semaphores are bound to the loop that first waits on them,
+        # so async callers get one per event loop; blocking callers share a
+        # thread semaphore, since each of them runs its own loop
+        self._loop_semaphores = weakref.WeakKeyDictionary()
+        self._sync_slots = threading.BoundedSemaphore(MAX_CONCURRENT_WORKFLOWS)
+    
+    def _loop_semaphore(self) -> asyncio.Semaphore:
+        """Concurrency limit for workflows started on the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._loop_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._loop_semaphores.setdefault(loop, asyncio.Semaphore(MAX_CONCURRENT_WORKFLOWS))
+        return semaphore
+    
+    @property
+    def execution_history(self) -> Deque[ExecutionRecord]:
+        """The most recent workflow executions, oldest first."""
+        return self._execution_history
+    
+    @execution_history.setter
+    def execution_history(self, records: Iterable[ExecutionRecord]) -> None:
+        # Records are also indexed by workflow name so filtered lookups do
+        # not scan the whole history; each entry carries its position in the
+        # history so several names can be merged back in order
+        self._execution_history = deque(maxlen=MAX_EXECUTION_HISTORY)
+        self._history_by_name: Dict[str, Deque[Tuple[int, ExecutionRecord]]] = defaultdict(deque)
+        self._history_seq = itertools.count()
+        for record in records:
+            self._record_execution(record)
+    
+    def _record_execution(self, record: ExecutionRecord) -> None:
+        """Append a record to the execution history and the name index."""
+        if len(self._execution_history) == self._execution_history.maxlen:
+            # The evicted record is also the oldest one under its name
+            name = _workflow_name(self._execution_history[0].workflow_id)
+            self._history_by_name[name].popleft()
+            if not self._history_by_name[name]:
+                del self._history_by_name[name]
+        self._execution_history.append(record)
+        self._history_by_name[_workflow_name(record.workflow_id)].append((next(self._history_seq), record))
     
     def load_workflow(self, config: WorkflowConfig) -> str:
         """
@@ -49,18 +142,23 @@ class CrewManager:
         workflow_id = f"{config.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         try:
-            # Create agents and tasks from configuration
-            agents = self._create_agents(config.agents)
-            tasks = self._create_tasks(config.tasks, agents)
-            
-            # Initialize crew
-            crew = Crew(
-                agents=agents,
-                tasks=tasks,
-                verbose=True
-            )
+            fingerprint = config.fingerprint()
+            template = self._materialized.get(fingerprint)
+            if template is None:
+                # Create agents and tasks from configuration
+                agents = self._create_agents(config.agents)
+                tasks = self._create_tasks(config.tasks, agents)
+                
+                # Initialize crew
+                template = Crew(
+                    agents=agents,
+                    tasks=tasks,
+                    verbose=True
+                )
+                self._materialized[fingerprint] = template
             
-            self.active_crews[workflow_id] = crew
+            # Copied so crews loaded from the same template never share task state
+            self.active_crews[workflow_id] = template.copy()
             
             self.logger.info(f"Workflow {workflow_id} loaded successfully")
             return workflow_id
@@ -73,6 +171,33 @@ class CrewManager:
         """
         Execute a loaded workflow.
         
+        Blocking wrapper around execute_workflow_async. Called from a thread
+        that is already running an event loop, the workflow runs on a worker
+        thread and that loop is blocked until it finishes, as it was when
+        this method called crew.kickoff directly.
+        
+        Args:
+            workflow_id: ID of the workflow to execute
+            inputs: Runtime inputs for the workflow
+            
+        Returns:
+            Execution results
+        """
+        with self._sync_slots:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self.execute_workflow_async(workflow_id, inputs))
+            
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                return executor.submit(
+                    asyncio.run, self.execute_workflow_async(workflow_id, inputs)
+                ).result()
+    
+    async def execute_workflow_async(self, workflow_id: str, inputs: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Execute a loaded workflow without blocking the event loop.
+        
         Args:
             workflow_id: ID of the workflow to execute
             inputs: Runtime inputs for the workflow
@@ -86,30 +211,34 @@ class CrewManager:
         crew = self.active_crews[workflow_id]
         execution_inputs = inputs or {}
         
+        # Durations come from the monotonic clock; only the start is read
+        # from the wall clock
         start_time = datetime.now()
+        started = perf_counter()
         
         try:
             self.logger.info(f"Starting execution of workflow {workflow_id}")
             self.monitor.start_execution(workflow_id)
             
             # Execute the crew
-            result = crew.kickoff(inputs=execution_inputs)
+            async with self._loop_semaphore():
+                result = await crew.kickoff_async(inputs=execution_inputs)
             
-            end_time = datetime.now()
-            execution_time = (end_time - start_time).total_seconds()
+            execution_time = perf_counter() - started
+            end_time = start_time + timedelta(seconds=execution_time)
             
             # Record execution
-            execution_record = {
-                'workflow_id': workflow_id,
-                'start_time': start_time,
-                'end_time': end_time,
-                'execution_time': execution_time,
-                'status': 'success',
-                'result': str(result),
-                'inputs': execution_inputs
-            }
+            execution_record = ExecutionRecord(
+                workflow_id=workflow_id,
+                status='success',
+                start_time=start_time,
+                end_time=end_time,
+                execution_time=execution_time,
+                inputs=execution_inputs,
+                result=str(result)
+            )
             
-            self.execution_history.append(execution_record)
+            self._record_execution(execution_record)
             self.monitor.end_execution(workflow_id, True, execution_time)
             
             self.logger.info(f"Workflow {workflow_id} completed successfully in {execution_time:.2f}s")
@@ -123,33 +252,40 @@ class CrewManager:
             }
             
         except Exception as e:
-            end_time = datetime.now()
-            execution_time = (end_time - start_time).total_seconds()
+            execution_time = perf_counter() - started
+            end_time = start_time + timedelta(seconds=execution_time)
             
-            execution_record = {
-                'workflow_id': workflow_id,
-                'start_time': start_time,
-                'end_time': end_time,
-                'execution_time': execution_time,
-                'status': 'failed',
-                'error': str(e),
-                'inputs': execution_inputs
-            }
+            execution_record = ExecutionRecord(
+                workflow_id=workflow_id,
+                status='failed',
+                start_time=start_time,
+                end_time=end_time,
+                execution_time=execution_time,
+                inputs=execution_inputs,
+                error=str(e)
+            )
             
-            self.execution_history.append(execution_record)
+            self._record_execution(execution_record)
             self.monitor.end_execution(workflow_id, False, execution_time)
             
             self.logger.error(f"Workflow {workflow_id} failed: {e}")
             raise
     
-    def get_execution_history(self, workflow_name: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get execution history, optionally filtered by workflow name."""
+    def get_execution_history(self, workflow_name: Optional[str] = None) -> List[ExecutionRecord]:
+        """Get execution history, optionally filtered by workflow ID prefix."""
         if workflow_name:
-            return [
-                record for record in self.execution_history 
-                if record['workflow_id'].startswith(workflow_name)
-            ]
-        return self.execution_history.copy()
+            buckets = []
+            for name, entries in self._history_by_name.items():
+                if name.startswith(workflow_name):
+                    buckets.append(entries)
+                elif workflow_name.startswith(name):
+                    # The prefix reaches into the timestamp suffix
+                    buckets.append(
+                        entry for entry in entries
+                        if entry[1].workflow_id.startswith(workflow_name)
+                    )
+            return [record for _, record in heapq.merge(*buckets, key=lambda entry: entry[0])]
+        return list(self.execution_history)
     
     def cleanup_workflow(self, workflow_id: str) -> bool:
         """Remove a workflow from active crews."""
@@ -159,6 +295,17 @@ class CrewManager:
             return True
         return False
     
+    def close(self) -> None:
+        """Stop the background work of the monitor this manager created."""
+        if self._owns_monitor:
+            self.monitor.close()
+    
+    def __enter__(self) -> "CrewManager":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
     def _create_agents(self, agent_configs: List[Dict[str, Any]]) -> List:
         """Create agents from configuration."""
         # This would be implemented based on your agent configuration format
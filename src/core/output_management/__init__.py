@@ -6,7 +6,7 @@ for multi-agent workflows to ensure consistent and usable results.
 """
 
 from .output_formatter import OutputFormatter
-from .output_validator import OutputValidator, ValidationRule
+from .output_validator import OutputValidator, ValidationRule, ValidationContext
 from .output_processor import OutputProcessor
 from .structured_output import (
     StructuredOutput, 
@@ -25,6 +25,7 @@ __all__ = [
     "OutputFormatter",
     "OutputValidator",
     "ValidationRule", 
+    "ValidationContext",
     "OutputProcessor",
     "StructuredOutput",
     "OutputMetadata",
@@ -6,10 +6,21 @@ to ensure outputs meet requirements and maintain consistency.
 """
 
 import re
+import json
 import logging
-from typing import Any, Dict, List, Optional, Union, Callable
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Union, Callable
 from datetime import datetime
 
+import numpy as np
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 from .structured_output import (
     StructuredOutput, 
     OutputValidation, 
@@ -19,34 +30,89 @@ from .structured_output import (
 )
 
 
+# Characters a JSON document can start with (json.loads also accepts NaN/Infinity)
+_JSON_START_CHARS = frozenset('{["tfn-0123456789NI')
+
+
+def _looks_like_json(text: str) -> bool:
+    """Cheap pre-check so clearly non-JSON text skips the json.loads exception path."""
+    stripped = text.lstrip()
+    return bool(stripped) and stripped[0] in _JSON_START_CHARS
+
+
+def _build_keyword_automaton(keywords: Set[str]) -> Optional[Any]:
+    """Build an Aho-Corasick automaton matching all keywords in a single pass."""
+    if not keywords or not AHOCORASICK_AVAILABLE:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+class ValidationContext:
+    """
+    Per-call view of an output shared by all rules in a validation pass.
+    
+    Derived representations of the content are computed lazily and at most
+    once, so rules that need e.g. the lowercased content do not each redo it.
+    """
+    
+    def __init__(self, output: StructuredOutput):
+        self.output = output
+    
+    @cached_property
+    def content_str(self) -> str:
+        """Content rendered as a string."""
+        return str(self.output.content)
+    
+    @cached_property
+    def content_lower(self) -> str:
+        """Lowercased content for case-insensitive checks."""
+        return self.content_str.lower()
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class ValidationRule:
     """A single validation rule with criteria and error handling."""
     
-    def __init__(
-        self,
-        name: str,
-        description: str,
-        validator_func: Callable[[StructuredOutput], bool],
-        error_message: str,
-        warning_only: bool = False,
-        weight: float = 1.0
-    ):
-        self.name = name
-        self.description = description
-        self.validator_func = validator_func
-        self.error_message = error_message
-        self.warning_only = warning_only
-        self.weight = weight
+    name: str
+    description: str
+    validator_func: Callable[[Any], bool]
+    error_message: str
+    warning_only: bool = False
+    weight: float = 1.0
+    # None means the rule applies to every output type
+    applicable_types: Optional[FrozenSet[OutputType]] = None
+    # Context-aware validators receive a ValidationContext instead of the output
+    context_aware: bool = False
     
-    def validate(self, output: StructuredOutput) -> tuple[bool, str]:
+    def applies_to(self, output_type: OutputType) -> bool:
+        """Check whether this rule is relevant for the given output type."""
+        return self.applicable_types is None or output_type in self.applicable_types
+    
+    def validate(
+        self,
+        output: StructuredOutput,
+        context: Optional[ValidationContext] = None
+    ) -> tuple[bool, str]:
         """
         Validate an output against this rule.
         
+        Args:
+            output: Output to validate
+            context: Shared per-call context, created on demand if omitted
+        
         Returns:
             Tuple of (is_valid, message)
         """
         try:
-            is_valid = self.validator_func(output)
+            if self.context_aware:
+                is_valid = self.validator_func(context or ValidationContext(output))
+            else:
+                is_valid = self.validator_func(output)
             return is_valid, "" if is_valid else self.error_message
         except Exception as e:
             return False, f"Validation error in {self.name}: {str(e)}"
@@ -62,13 +128,23 @@ class OutputValidator:
         self.logger = logging.getLogger(__name__)
         self.custom_rules: List[ValidationRule] = []
         self.built_in_rules = self._create_built_in_rules()
+        self._active_rules_cache: Dict[OutputType, List[ValidationRule]] = {}
+    
+    def _get_active_rules(self, output_type: OutputType) -> List[ValidationRule]:
+        """Get the built-in rules applicable to an output type (cached per type)."""
+        active_rules = self._active_rules_cache.get(output_type)
+        if active_rules is None:
+            active_rules = [rule for rule in self.built_in_rules if rule.applies_to(output_type)]
+            self._active_rules_cache[output_type] = active_rules
+        return active_rules
     
     def validate_output(
         self,
         output: StructuredOutput,
         schema: Optional[OutputSchema] = None,
         custom_rules: Optional[List[ValidationRule]] = None,
-        strict_mode: bool = False
+        strict_mode: bool = False,
+        fail_fast: bool = False
     ) -> OutputValidation:
         """
         Validate a structured output against schema and rules.
@@ -78,6 +154,8 @@ class OutputValidator:
             schema: Optional schema to validate against
             custom_rules: Additional validation rules
             strict_mode: Whether to treat warnings as errors
+            fail_fast: Stop at the first error instead of evaluating every rule.
+                The result then only covers the rules evaluated so far.
             
         Returns:
             OutputValidation with detailed results
@@ -93,46 +171,37 @@ class OutputValidator:
             warnings.extend(schema_validation.warnings)
             requirements_met.update(schema_validation.requirements_met)
         
-        # Built-in rule validation
-        for rule in self.built_in_rules:
-            is_valid, message = rule.validate(output)
-            if not is_valid:
-                if rule.warning_only and not strict_mode:
-                    warnings.append(f"{rule.name}: {message}")
-                else:
-                    errors.append(f"{rule.name}: {message}")
-                requirements_met[rule.name] = False
-            else:
-                requirements_met[rule.name] = True
+        # Built-in rules (skipping those for other output types), then custom rules
+        rules_to_check = self._get_active_rules(output.output_type) + (custom_rules or self.custom_rules)
         
-        # Custom rule validation
-        rules_to_check = custom_rules or self.custom_rules
-        for rule in rules_to_check:
-            is_valid, message = rule.validate(output)
-            if not is_valid:
+        if not (fail_fast and errors):
+            context = ValidationContext(output)
+            for rule in rules_to_check:
+                is_valid, message = rule.validate(output, context)
+                if is_valid:
+                    requirements_met[rule.name] = True
+                    continue
+                
+                requirements_met[rule.name] = False
                 if rule.warning_only and not strict_mode:
                     warnings.append(f"{rule.name}: {message}")
                 else:
                     errors.append(f"{rule.name}: {message}")
-                requirements_met[rule.name] = False
-            else:
-                requirements_met[rule.name] = True
+                    if fail_fast:
+                        break
         
         # Calculate validation score
-        total_requirements = len(requirements_met)
-        if total_requirements > 0:
-            # Weight the score by rule importance
+        if requirements_met:
+            # Weight the score by rule importance (first rule with a name wins,
+            # requirements without a matching rule default to 1.0)
+            rule_weights: Dict[str, float] = {}
+            for rule in rules_to_check:
+                rule_weights.setdefault(rule.name, rule.weight)
+            
             weighted_score = 0.0
             total_weight = 0.0
-            
             for rule_name, met in requirements_met.items():
-                # Find rule weight (default to 1.0)
-                weight = 1.0
-                for rule in self.built_in_rules + rules_to_check:
-                    if rule.name == rule_name:
-                        weight = rule.weight
-                        break
-                
+                weight = rule_weights.get(rule_name, 1.0)
                 if met:
                     weighted_score += weight
                 total_weight += weight
@@ -171,13 +240,14 @@ class OutputValidator:
         outputs: List[StructuredOutput],
         schema: Optional[OutputSchema] = None,
         custom_rules: Optional[List[ValidationRule]] = None,
-        strict_mode: bool = False
+        strict_mode: bool = False,
+        fail_fast: bool = False
     ) -> List[OutputValidation]:
         """Validate multiple outputs and return list of validations."""
         validations = []
         
         for output in outputs:
-            validation = self.validate_output(output, schema, custom_rules, strict_mode)
+            validation = self.validate_output(output, schema, custom_rules, strict_mode, fail_fast)
             validations.append(validation)
         
         return validations
@@ -199,23 +269,32 @@ class OutputValidator:
         if total_validations == 0:
             return {"error": "No validations to summarize"}
         
-        valid_count = sum(1 for v in validations if v.is_valid)
-        total_errors = sum(len(v.errors) for v in validations)
-        total_warnings = sum(len(v.warnings) for v in validations)
+        # Materialize per-validation stats once and reduce them vectorized
+        scores = np.fromiter(
+            (v.validation_score for v in validations), dtype=np.float64, count=total_validations
+        )
+        valid_flags = np.fromiter(
+            (v.is_valid for v in validations), dtype=np.bool_, count=total_validations
+        )
+        error_counts = np.fromiter(
+            (len(v.errors) for v in validations), dtype=np.int64, count=total_validations
+        )
+        warning_counts = np.fromiter(
+            (len(v.warnings) for v in validations), dtype=np.int64, count=total_validations
+        )
         
-        scores = [v.validation_score for v in validations]
-        avg_score = sum(scores) / len(scores)
+        valid_count = int(np.count_nonzero(valid_flags))
         
         return {
             "total_validations": total_validations,
             "valid_count": valid_count,
             "invalid_count": total_validations - valid_count,
             "success_rate": valid_count / total_validations,
-            "total_errors": total_errors,
-            "total_warnings": total_warnings,
-            "avg_validation_score": avg_score,
-            "min_score": min(scores),
-            "max_score": max(scores)
+            "total_errors": int(error_counts.sum()),
+            "total_warnings": int(warning_counts.sum()),
+            "avg_validation_score": float(scores.mean()),
+            "min_score": float(scores.min()),
+            "max_score": float(scores.max())
         }
     
     def _create_built_in_rules(self) -> List[ValidationRule]:
@@ -270,7 +349,8 @@ class OutputValidator:
             validator_func=self._validate_content_type_consistency,
             error_message="Content does not match declared output type",
             warning_only=True,
-            weight=1.0
+            weight=1.0,
+            applicable_types=frozenset({OutputType.JSON, OutputType.MARKDOWN, OutputType.HTML, OutputType.CSV})
         ))
         
         # Word count reasonableness rule
@@ -289,7 +369,8 @@ class OutputValidator:
             description="Content should not contain suspicious patterns",
             validator_func=self._validate_no_suspicious_content,
             error_message="Content contains suspicious patterns",
-            weight=2.0
+            weight=2.0,
+            context_aware=True
         ))
         
         # Proper encoding rule
@@ -307,7 +388,8 @@ class OutputValidator:
             description="JSON outputs should be valid JSON",
             validator_func=self._validate_json_validity,
             error_message="JSON content is not valid JSON",
-            weight=2.0
+            weight=2.0,
+            applicable_types=frozenset({OutputType.JSON})
         ))
         
         # Markdown structure rule (for Markdown outputs)
@@ -317,7 +399,8 @@ class OutputValidator:
             validator_func=self._validate_markdown_structure,
             error_message="Markdown content has structural issues",
             warning_only=True,
-            weight=0.5
+            weight=0.5,
+            applicable_types=frozenset({OutputType.MARKDOWN})
         ))
         
         return rules
@@ -327,13 +410,14 @@ class OutputValidator:
         content_str = str(output.content)
         
         if output.output_type == OutputType.JSON:
+            if isinstance(output.content, (dict, list)):
+                return True
+            if not _looks_like_json(content_str):
+                return False
             try:
-                import json
-                if isinstance(output.content, (dict, list)):
-                    return True
                 json.loads(content_str)
                 return True
-            except:
+            except (ValueError, TypeError):
                 return False
         
         elif output.output_type == OutputType.MARKDOWN:
@@ -365,9 +449,9 @@ class OutputValidator:
         variance = abs(actual_words - reported_words) / max(actual_words, 1)
         return variance <= 0.1
     
-    def _validate_no_suspicious_content(self, output: StructuredOutput) -> bool:
+    def _validate_no_suspicious_content(self, context: ValidationContext) -> bool:
         """Check for suspicious or problematic content patterns."""
-        content_str = str(output.content).lower()
+        content_str = context.content_lower
         
         suspicious_patterns = [
             r'<script[^>]*>',  # Script tags
@@ -404,16 +488,18 @@ class OutputValidator:
             return True  # Not applicable to non-JSON outputs
         
         try:
-            import json
             if isinstance(output.content, (dict, list)):
                 # Already parsed, try to serialize
                 json.dumps(output.content)
                 return True
             else:
                 # String content, try to parse
-                json.loads(str(output.content))
+                content_str = str(output.content)
+                if not _looks_like_json(content_str):
+                    return False
+                json.loads(content_str)
                 return True
-        except:
+        except (ValueError, TypeError):
             return False
     
     def _validate_markdown_structure(self, output: StructuredOutput) -> bool:
@@ -460,8 +546,14 @@ class OutputValidator:
         Returns:
             ValidationRule for content quality
         """
-        def validate_content_quality(output: StructuredOutput) -> bool:
-            content_str = str(output.content).lower()
+        # Normalize keyword lists once at rule creation instead of on every call
+        required_set = {keyword.lower() for keyword in required_keywords or [] if keyword}
+        forbidden_set = {word.lower() for word in forbidden_words or [] if word}
+        required_automaton = _build_keyword_automaton(required_set)
+        forbidden_automaton = _build_keyword_automaton(forbidden_set)
+        
+        def validate_content_quality(context: ValidationContext) -> bool:
+            content_str = context.content_lower
             word_count = len(content_str.split())
             
             # Check word count limits
@@ -471,16 +563,21 @@ class OutputValidator:
                 return False
             
             # Check required keywords
-            if required_keywords:
-                for keyword in required_keywords:
-                    if keyword.lower() not in content_str:
+            if required_set:
+                if required_automaton is not None:
+                    found = {keyword for _, keyword in required_automaton.iter(content_str)}
+                    if not required_set.issubset(found):
                         return False
+                elif any(keyword not in content_str for keyword in required_set):
+                    return False
             
             # Check forbidden words
-            if forbidden_words:
-                for word in forbidden_words:
-                    if word.lower() in content_str:
+            if forbidden_set:
+                if forbidden_automaton is not None:
+                    for _ in forbidden_automaton.iter(content_str):
                         return False
+                elif any(word in content_str for word in forbidden_set):
+                    return False
             
             return True
         
@@ -489,7 +586,8 @@ class OutputValidator:
             description="Content quality standards",
             validator_func=validate_content_quality,
             error_message="Content does not meet quality standards",
-            weight=1.5
+            weight=1.5,
+            context_aware=True
         )
     
     def create_business_rule(
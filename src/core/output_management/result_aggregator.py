@@ -5,19 +5,260 @@ Combines and aggregates multiple agent outputs into comprehensive
 workflow results with analytics, insights, and summary reporting.
 """
 
+import heapq
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union, Tuple
+from itertools import chain
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Union, Tuple
 from collections import defaultdict, Counter
-from statistics import mean, median
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 from .structured_output import StructuredOutput, OutputStatus, OutputType, OutputMetadata
 from .output_formatter import OutputFormatter
 
 
+# Small integer code per status, so status checks over many outputs can be
+# done as a single vectorized comparison on an int8 array.
+_STATUS_CODES: Dict[str, int] = {status: code for code, status in enumerate(OutputStatus)}
+_SUCCESS_CODE = _STATUS_CODES[OutputStatus.SUCCESS]
+
+
+def _status_codes(statuses: Any) -> np.ndarray:
+    """Encode an iterable of statuses as an int8 array of status codes."""
+    return np.fromiter((_STATUS_CODES.get(status, -1) for status in statuses), dtype=np.int8)
+
+
+def _status_points(points: Dict[OutputStatus, float]) -> np.ndarray:
+    """Lookup table of score points indexed by status code."""
+    table = np.zeros(len(_STATUS_CODES), dtype=np.float64)
+    for status, value in points.items():
+        table[_STATUS_CODES[status]] = value
+    return table
+
+
+# Scoring parameters over the feature columns built by _score_features:
+# status points by status code, then per-column weights and caps for
+# validation score, word count, confidence score and section count.
+_BEST_STATUS_POINTS = _status_points({OutputStatus.SUCCESS: 3.0, OutputStatus.PARTIAL: 1.0})
+_BEST_WEIGHTS = np.array([2.0, 0.001, 1.0, 0.1], dtype=np.float64)
+_BEST_CAPS = np.array([np.inf, 2.0, np.inf, np.inf], dtype=np.float64)
+
+_RANK_STATUS_POINTS = _status_points({OutputStatus.SUCCESS: 30.0, OutputStatus.PARTIAL: 15.0})
+_RANK_WEIGHTS = np.array([25.0, 0.01, 15.0, 2.0], dtype=np.float64)
+_RANK_CAPS = np.array([np.inf, 20.0, np.inf, 10.0], dtype=np.float64)
+
+
+def _score_features(outputs: List[StructuredOutput]) -> np.ndarray:
+    """
+    Extract an (N, 5) float64 feature matrix for output scoring.
+    
+    Columns are status code, validation score, word count, confidence score
+    and section count; missing values are stored as 0.
+    """
+    features = np.zeros((len(outputs), 5), dtype=np.float64)
+    for index, output in enumerate(outputs):
+        metadata = output.metadata
+        validation = output.validation
+        sections = output.sections
+        features[index] = (
+            _STATUS_CODES.get(output.status, -1),
+            validation.validation_score if validation else 0.0,
+            metadata.word_count or 0,
+            metadata.confidence_score or 0.0,
+            len(sections) if sections else 0
+        )
+    return features
+
+
+def _score_rows(features: np.ndarray, status_points: np.ndarray,
+                weights: np.ndarray, caps: np.ndarray) -> np.ndarray:
+    """Weighted, capped linear score per feature row (loop form for Numba)."""
+    count = features.shape[0]
+    columns = weights.shape[0]
+    scores = np.zeros(count, dtype=np.float64)
+    for i in range(count):
+        code = int(features[i, 0])
+        score = status_points[code] if 0 <= code < status_points.shape[0] else 0.0
+        for j in range(columns):
+            score += min(features[i, j + 1] * weights[j], caps[j])
+        scores[i] = score
+    return scores
+
+
+def _score_rows_vectorized(features: np.ndarray, status_points: np.ndarray,
+                           weights: np.ndarray, caps: np.ndarray) -> np.ndarray:
+    """Weighted, capped linear score per feature row (NumPy form)."""
+    codes = features[:, 0].astype(np.intp)
+    known = (codes >= 0) & (codes < status_points.shape[0])
+    points = np.where(known, status_points[np.where(known, codes, 0)], 0.0)
+    # Clip raw features to the cap expressed in feature units, so the
+    # weighted sum is a single matrix-vector product
+    clipped = np.minimum(features[:, 1:], caps / weights)
+    return points + clipped @ weights
+
+
+# Compile the scoring kernel when Numba is installed; NumPy otherwise.
+_score_matrix = njit(cache=True)(_score_rows) if NUMBA_AVAILABLE else _score_rows_vectorized
+
+
+# Status markers used in workflow summaries (anything else is shown as failed)
+_STATUS_EMOJI = {OutputStatus.SUCCESS: "✅", OutputStatus.PARTIAL: "⚠️", OutputStatus.FAILED: "❌"}
+
+# Section names (lowercase) highlighted in workflow summaries
+_KEY_SECTIONS = frozenset({'summary', 'findings', 'conclusion', 'recommendations'})
+
+
+# Per-criterion value extractors for comparison reports
+_CRITERION_EXTRACTORS: Dict[str, Callable[[StructuredOutput], Any]] = {
+    "word_count": lambda output: output.metadata.word_count or 0,
+    "execution_time": lambda output: output.metadata.execution_time or 0,
+    "confidence_score": lambda output: output.metadata.confidence_score or 0,
+    "validation_score": lambda output: output.validation.validation_score if output.validation else 0,
+    "status": lambda output: output.status,
+    "content_type": lambda output: output.output_type,
+}
+_NUMERIC_CRITERIA = frozenset({"word_count", "execution_time", "confidence_score", "validation_score"})
+
+
+# Fixed workflow insight messages
+_INSIGHT_PERFECT_EXECUTION = "🎉 Perfect execution - all outputs completed successfully!"
+_INSIGHT_HIGH_SUCCESS = "✅ High success rate - most outputs completed successfully"
+_INSIGHT_MODERATE_SUCCESS = "⚠️ Moderate success rate - some outputs may need attention"
+_INSIGHT_LOW_SUCCESS = "❌ Low success rate - workflow may need debugging"
+_INSIGHT_HIGH_VOLUME = "📝 High content volume generated"
+_INSIGHT_MODERATE_VOLUME = "📄 Moderate content volume generated"
+_INSIGHT_SLOW_EXECUTION = "⏱️ Long execution time - consider optimization"
+_INSIGHT_FAST_EXECUTION = "⚡ Fast execution time - efficient workflow"
+_INSIGHT_HIGH_QUALITY = "🏆 High quality outputs with excellent validation scores"
+
+
+def _reported(values: np.ndarray) -> np.ndarray:
+    """Select the entries of a metric column that were reported (non-zero)."""
+    return values[values != 0]
+
+
+def _mean_or_none(values: np.ndarray) -> Optional[float]:
+    """Mean of a column, or None when it is empty."""
+    return float(values.mean()) if values.size else None
+
+
+class _OutputColumns:
+    """
+    Column-oriented (struct-of-arrays) view of workflow outputs.
+    
+    Walks the outputs once and stores each metric as a parallel NumPy array,
+    so analytics can be computed with vectorized reductions instead of
+    rescanning the output objects for every statistic. Missing metrics are
+    stored as 0, which matches how unreported values were skipped before.
+    """
+    
+    def __init__(self, outputs: List[StructuredOutput]):
+        count = len(outputs)
+        self.statuses: List[Any] = [None] * count
+        self.output_type_counts: Counter = Counter()
+        # Agents are mapped to dense integer codes (in order of first
+        # appearance) so per-agent stats can be computed with grouped
+        # reductions over the columns instead of regrouping output objects.
+        agent_codes_by_role: Dict[str, int] = {}
+        agent_codes = [0] * count
+        word_counts = [0] * count
+        execution_times = [0.0] * count
+        confidence_scores = [0.0] * count
+        validation_scores = [0.0] * count
+        has_validation = [False] * count
+        has_errors = [False] * count
+        has_warnings = [False] * count
+        
+        for index, output in enumerate(outputs):
+            metadata = output.metadata
+            validation = output.validation
+            
+            self.statuses[index] = output.status
+            self.output_type_counts[output.output_type] += 1
+            word_counts[index] = metadata.word_count or 0
+            execution_times[index] = metadata.execution_time or 0.0
+            confidence_scores[index] = metadata.confidence_score or 0.0
+            if validation:
+                validation_scores[index] = validation.validation_score
+                has_validation[index] = True
+                has_errors[index] = bool(validation.errors)
+                has_warnings[index] = bool(validation.warnings)
+            agent_codes[index] = agent_codes_by_role.setdefault(
+                metadata.agent_role, len(agent_codes_by_role)
+            )
+        
+        self.success_mask = _status_codes(self.statuses) == _SUCCESS_CODE
+        self.agent_roles: List[str] = list(agent_codes_by_role)
+        self.agent_codes = np.array(agent_codes, dtype=np.intp)
+        self.word_counts = np.array(word_counts, dtype=np.int64)
+        self.execution_times = np.array(execution_times, dtype=np.float64)
+        self.confidence_scores = np.array(confidence_scores, dtype=np.float64)
+        self.validation_scores = np.array(validation_scores, dtype=np.float64)
+        self.has_validation = np.array(has_validation, dtype=np.bool_)
+        self.has_errors = np.array(has_errors, dtype=np.bool_)
+        self.has_warnings = np.array(has_warnings, dtype=np.bool_)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Convert to an aware UTC datetime; naive values are taken as local time."""
+    return value.astimezone(timezone.utc)
+
+
+class _slot_cached_property:
+    """
+    cached_property for classes with __slots__.
+    
+    functools.cached_property stores its value in the instance __dict__;
+    this variant stores it in the slot named "_cached_<name>" (leading
+    underscores stripped), which the owning class must declare.
+    """
+    
+    def __init__(self, func: Any):
+        self.func = func
+        self.__doc__ = func.__doc__
+        self.slot_name = f"_cached_{func.__name__.lstrip('_')}"
+    
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self.slot_name)
+        except AttributeError:
+            value = self.func(instance)
+            setattr(instance, self.slot_name, value)
+            return value
+
+
 class WorkflowResult:
     """Complete result from a workflow execution with aggregated insights."""
     
+    __slots__ = (
+        "workflow_id",
+        "workflow_name",
+        "outputs",
+        "execution_start",
+        "execution_end",
+        "execution_time",
+        # Caches for the lazily computed properties below
+        "_cached_analytics",
+        "_cached_summary",
+        "_cached_insights",
+        "_cached_columns",
+        "_cached_status_counts",
+        "_cached_success_rate",
+        "_cached_agent_performance",
+        "_cached_content_metrics",
+        "_cached_performance_metrics",
+        "_cached_quality_metrics",
+    )
+    
     def __init__(
         self,
         workflow_id: str,
@@ -29,35 +270,26 @@ class WorkflowResult:
         self.workflow_id = workflow_id
         self.workflow_name = workflow_name
         self.outputs = outputs
-        self.execution_start = execution_start
-        self.execution_end = execution_end
-        self.execution_time = (execution_end - execution_start).total_seconds()
-        
-        # Calculated properties
-        self._analytics = None
-        self._summary = None
-        self._insights = None
+        # Output timestamps are UTC-aware while callers often pass naive
+        # datetime.now(); compare both in UTC
+        self.execution_start = _as_utc(execution_start)
+        self.execution_end = _as_utc(execution_end)
+        self.execution_time = (self.execution_end - self.execution_start).total_seconds()
     
-    @property
+    @_slot_cached_property
     def analytics(self) -> Dict[str, Any]:
-        """Get workflow analytics."""
-        if self._analytics is None:
-            self._analytics = self._calculate_analytics()
-        return self._analytics
+        """Get workflow analytics (computed once, on first access)."""
+        return self._calculate_analytics()
     
-    @property
+    @_slot_cached_property
     def summary(self) -> Dict[str, Any]:
-        """Get workflow summary."""
-        if self._summary is None:
-            self._summary = self._generate_summary()
-        return self._summary
+        """Get workflow summary (computed once, on first access)."""
+        return self._generate_summary()
     
-    @property
+    @_slot_cached_property
     def insights(self) -> List[str]:
-        """Get workflow insights."""
-        if self._insights is None:
-            self._insights = self._generate_insights()
-        return self._insights
+        """Get workflow insights (computed once, on first access)."""
+        return self._generate_insights()
     
     def _calculate_analytics(self) -> Dict[str, Any]:
         """Calculate detailed analytics for the workflow."""
@@ -65,118 +297,175 @@ class WorkflowResult:
         if total_outputs == 0:
             return {"error": "No outputs to analyze"}
         
-        # Status distribution
-        status_counts = Counter(output.status for output in self.outputs)
-        
-        # Agent performance
-        agent_performance = defaultdict(list)
-        for output in self.outputs:
-            agent_performance[output.metadata.agent_role].append(output)
-        
-        # Content metrics
-        word_counts = [output.metadata.word_count for output in self.outputs if output.metadata.word_count]
-        execution_times = [output.metadata.execution_time for output in self.outputs if output.metadata.execution_time]
-        confidence_scores = [output.metadata.confidence_score for output in self.outputs if output.metadata.confidence_score]
-        
         return {
             "total_outputs": total_outputs,
-            "status_distribution": dict(status_counts),
-            "success_rate": status_counts.get(OutputStatus.SUCCESS, 0) / total_outputs,
-            "agent_count": len(agent_performance),
-            "agent_performance": {
-                agent: {
-                    "output_count": len(outputs),
-                    "success_rate": sum(1 for o in outputs if o.status == OutputStatus.SUCCESS) / len(outputs),
-                    "avg_word_count": mean([o.metadata.word_count for o in outputs if o.metadata.word_count]) if any(o.metadata.word_count for o in outputs) else None,
-                    "avg_execution_time": mean([o.metadata.execution_time for o in outputs if o.metadata.execution_time]) if any(o.metadata.execution_time for o in outputs) else None
-                }
-                for agent, outputs in agent_performance.items()
-            },
-            "content_metrics": {
-                "total_words": sum(word_counts) if word_counts else 0,
-                "avg_words_per_output": mean(word_counts) if word_counts else 0,
-                "min_words": min(word_counts) if word_counts else 0,
-                "max_words": max(word_counts) if word_counts else 0,
-                "median_words": median(word_counts) if word_counts else 0
-            },
-            "performance_metrics": {
-                "total_execution_time": self.execution_time,
-                "avg_task_time": mean(execution_times) if execution_times else 0,
-                "min_task_time": min(execution_times) if execution_times else 0,
-                "max_task_time": max(execution_times) if execution_times else 0,
-                "avg_confidence": mean(confidence_scores) if confidence_scores else None,
-                "min_confidence": min(confidence_scores) if confidence_scores else None,
-                "max_confidence": max(confidence_scores) if confidence_scores else None
-            },
-            "quality_metrics": {
-                "outputs_with_validation": sum(1 for o in self.outputs if o.validation),
-                "avg_validation_score": mean([o.validation.validation_score for o in self.outputs if o.validation]) if any(o.validation for o in self.outputs) else None,
-                "outputs_with_errors": sum(1 for o in self.outputs if o.validation and o.validation.errors),
-                "outputs_with_warnings": sum(1 for o in self.outputs if o.validation and o.validation.warnings)
+            "status_distribution": self._status_counts,
+            "output_type_distribution": self._columns.output_type_counts,
+            "success_rate": self._success_rate,
+            "agent_count": len(self._columns.agent_roles),
+            "agent_performance": self._agent_performance,
+            "content_metrics": self._content_metrics,
+            "performance_metrics": self._performance_metrics,
+            "quality_metrics": self._quality_metrics
+        }
+    
+    # Analytics sections are computed lazily so that summary and insights
+    # only build the sections they actually read.
+    
+    @_slot_cached_property
+    def _columns(self) -> _OutputColumns:
+        """Per-metric columns extracted in a single pass over the outputs."""
+        return _OutputColumns(self.outputs)
+    
+    @_slot_cached_property
+    def _status_counts(self) -> Counter:
+        """Status distribution."""
+        return Counter(self._columns.statuses)
+    
+    @_slot_cached_property
+    def _success_rate(self) -> float:
+        """Fraction of outputs that completed successfully."""
+        success_mask = self._columns.success_mask
+        if success_mask.size == 0:
+            return 0.0
+        return float(success_mask.mean())
+    
+    @_slot_cached_property
+    def _agent_performance(self) -> Dict[str, Dict[str, Any]]:
+        """Per-agent output counts, success rates and averages."""
+        columns = self._columns
+        codes = columns.agent_codes
+        agent_count = len(columns.agent_roles)
+        
+        def per_agent_sum(weights: Any) -> np.ndarray:
+            return np.bincount(codes, weights=weights, minlength=agent_count)
+        
+        output_counts = np.bincount(codes, minlength=agent_count)
+        successes = per_agent_sum(columns.success_mask)
+        word_totals = per_agent_sum(columns.word_counts)
+        word_reported = per_agent_sum(columns.word_counts != 0)
+        time_totals = per_agent_sum(columns.execution_times)
+        time_reported = per_agent_sum(columns.execution_times != 0)
+        
+        agent_performance = {}
+        for code, agent in enumerate(columns.agent_roles):
+            agent_performance[agent] = {
+                "output_count": int(output_counts[code]),
+                "success_rate": float(successes[code] / output_counts[code]),
+                "avg_word_count": (
+                    float(word_totals[code] / word_reported[code]) if word_reported[code] else None
+                ),
+                "avg_execution_time": (
+                    float(time_totals[code] / time_reported[code]) if time_reported[code] else None
+                )
             }
+        return agent_performance
+    
+    @_slot_cached_property
+    def _content_metrics(self) -> Dict[str, Any]:
+        """Word count statistics."""
+        word_counts = _reported(self._columns.word_counts)
+        has_words = word_counts.size > 0
+        return {
+            "total_words": int(word_counts.sum()),
+            "avg_words_per_output": float(word_counts.mean()) if has_words else 0,
+            "min_words": int(word_counts.min()) if has_words else 0,
+            "max_words": int(word_counts.max()) if has_words else 0,
+            "median_words": float(np.median(word_counts)) if has_words else 0
+        }
+    
+    @_slot_cached_property
+    def _performance_metrics(self) -> Dict[str, Any]:
+        """Execution time and confidence statistics."""
+        execution_times = _reported(self._columns.execution_times)
+        confidence_scores = _reported(self._columns.confidence_scores)
+        has_times = execution_times.size > 0
+        has_confidence = confidence_scores.size > 0
+        return {
+            "total_execution_time": self.execution_time,
+            "avg_task_time": float(execution_times.mean()) if has_times else 0,
+            "min_task_time": float(execution_times.min()) if has_times else 0,
+            "max_task_time": float(execution_times.max()) if has_times else 0,
+            "avg_confidence": float(confidence_scores.mean()) if has_confidence else None,
+            "min_confidence": float(confidence_scores.min()) if has_confidence else None,
+            "max_confidence": float(confidence_scores.max()) if has_confidence else None
+        }
+    
+    @_slot_cached_property
+    def _quality_metrics(self) -> Dict[str, Any]:
+        """Validation coverage and score statistics."""
+        columns = self._columns
+        validation_scores = columns.validation_scores[columns.has_validation]
+        return {
+            "outputs_with_validation": int(validation_scores.size),
+            "avg_validation_score": _mean_or_none(validation_scores),
+            "outputs_with_errors": int(np.count_nonzero(columns.has_errors)),
+            "outputs_with_warnings": int(np.count_nonzero(columns.has_warnings))
         }
     
     def _generate_summary(self) -> Dict[str, Any]:
         """Generate a workflow summary."""
-        analytics = self.analytics
-        
         return {
             "workflow_id": self.workflow_id,
             "workflow_name": self.workflow_name,
             "execution_time": f"{self.execution_time:.2f}s",
-            "total_outputs": analytics["total_outputs"],
-            "success_rate": f"{analytics['success_rate']:.1%}",
-            "total_words": analytics["content_metrics"]["total_words"],
-            "agent_count": analytics["agent_count"],
+            "total_outputs": len(self.outputs),
+            "success_rate": f"{self._success_rate:.1%}",
+            "total_words": self._content_metrics["total_words"],
+            "agent_count": len(self._columns.agent_roles),
             "started_at": self.execution_start.isoformat(),
             "completed_at": self.execution_end.isoformat(),
-            "quality_score": analytics["quality_metrics"]["avg_validation_score"]
+            "quality_score": self._quality_metrics["avg_validation_score"]
         }
     
     def _generate_insights(self) -> List[str]:
         """Generate insights about the workflow execution."""
         insights = []
-        analytics = self.analytics
+        success_rate = self._success_rate
+        content_metrics = self._content_metrics
+        perf_metrics = self._performance_metrics
+        quality_metrics = self._quality_metrics
         
         # Performance insights
-        if analytics["success_rate"] == 1.0:
-            insights.append("🎉 Perfect execution - all outputs completed successfully!")
-        elif analytics["success_rate"] >= 0.8:
-            insights.append("✅ High success rate - most outputs completed successfully")
-        elif analytics["success_rate"] >= 0.5:
-            insights.append("⚠️ Moderate success rate - some outputs may need attention")
+        if success_rate == 1.0:
+            insights.append(_INSIGHT_PERFECT_EXECUTION)
+        elif success_rate >= 0.8:
+            insights.append(_INSIGHT_HIGH_SUCCESS)
+        elif success_rate >= 0.5:
+            insights.append(_INSIGHT_MODERATE_SUCCESS)
         else:
-            insights.append("❌ Low success rate - workflow may need debugging")
+            insights.append(_INSIGHT_LOW_SUCCESS)
         
         # Content insights
-        content_metrics = analytics["content_metrics"]
-        if content_metrics["total_words"] > 10000:
-            insights.append("📝 High content volume generated")
-        elif content_metrics["total_words"] > 5000:
-            insights.append("📄 Moderate content volume generated")
+        total_words = content_metrics["total_words"]
+        if total_words > 10000:
+            insights.append(_INSIGHT_HIGH_VOLUME)
+        elif total_words > 5000:
+            insights.append(_INSIGHT_MODERATE_VOLUME)
         
         # Performance insights
-        perf_metrics = analytics["performance_metrics"]
-        if perf_metrics["total_execution_time"] > 300:  # 5 minutes
-            insights.append("⏱️ Long execution time - consider optimization")
-        elif perf_metrics["total_execution_time"] < 30:  # 30 seconds
-            insights.append("⚡ Fast execution time - efficient workflow")
+        total_execution_time = perf_metrics["total_execution_time"]
+        if total_execution_time > 300:  # 5 minutes
+            insights.append(_INSIGHT_SLOW_EXECUTION)
+        elif total_execution_time < 30:  # 30 seconds
+            insights.append(_INSIGHT_FAST_EXECUTION)
         
         # Quality insights
-        quality_metrics = analytics["quality_metrics"]
-        if quality_metrics["avg_validation_score"] and quality_metrics["avg_validation_score"] > 0.9:
-            insights.append("🏆 High quality outputs with excellent validation scores")
-        elif quality_metrics["outputs_with_errors"] > 0:
-            insights.append(f"⚠️ {quality_metrics['outputs_with_errors']} outputs have validation errors")
+        avg_validation_score = quality_metrics["avg_validation_score"]
+        outputs_with_errors = quality_metrics["outputs_with_errors"]
+        if avg_validation_score and avg_validation_score > 0.9:
+            insights.append(_INSIGHT_HIGH_QUALITY)
+        elif outputs_with_errors > 0:
+            insights.append(f"⚠️ {outputs_with_errors} outputs have validation errors")
         
         # Agent insights
-        agent_perf = analytics["agent_performance"]
+        agent_perf = self._agent_performance
         best_agent = max(agent_perf.items(), key=lambda x: x[1]["success_rate"], default=None)
         if best_agent and best_agent[1]["success_rate"] == 1.0:
             insights.append(f"🌟 {best_agent[0]} achieved perfect performance")
         
         # Diversity insights
-        output_types = Counter(output.output_type for output in self.outputs)
+        output_types = self._columns.output_type_counts
         if len(output_types) > 1:
             insights.append(f"🎨 Diverse output types: {', '.join(output_types.keys())}")
         
@@ -215,17 +504,14 @@ class ResultAggregator:
             WorkflowResult with aggregated data and insights
         """
         # Set default timestamps if not provided
+        if execution_start is None and outputs:
+            # Estimate start time from earliest output timestamp
+            execution_start = min(output.metadata.timestamp for output in outputs)
         if execution_end is None:
-            execution_end = datetime.now()
+            execution_end = datetime.now(timezone.utc)
         if execution_start is None:
-            # Estimate start time from earliest output timestamp
-            earliest_timestamp = min(
-                (output.metadata.timestamp for output in outputs),
-                default=execution_end - timedelta(seconds=sum(
-                    output.metadata.execution_time or 0 for output in outputs
-                ))
-            )
-            execution_start = earliest_timestamp
+            # No outputs, so no reported execution time to subtract
+            execution_start = execution_end
         
         return WorkflowResult(
             workflow_id=workflow_id,
@@ -268,34 +554,53 @@ class ResultAggregator:
         """Merge multiple outputs into a single comprehensive output."""
         
         # Combine all content
-        merged_content_parts = []
+        merged_content_parts = [""] * len(outputs)
         merged_sections = {}
-        all_tags = set()
-        all_keywords = set()
         
-        for i, output in enumerate(outputs):
+        # Aggregate metadata, accumulated in the same pass
+        status_priority = {OutputStatus.FAILED: 0, OutputStatus.PARTIAL: 1, OutputStatus.SUCCESS: 2}
+        overall_status = None
+        overall_priority = None
+        total_words = 0
+        total_execution_time = 0
+        total_sources = 0
+        confidence_sum = 0.0
+        confidence_count = 0
+        
+        for index, output in enumerate(outputs):
+            metadata = output.metadata
+            status = output.status
+            
+            # Determine overall status (the lowest priority wins, first on ties)
+            priority = status_priority.get(status, 0)
+            if overall_priority is None or priority < overall_priority:
+                overall_status = status
+                overall_priority = priority
+            
+            total_words += metadata.word_count or 0
+            total_execution_time += metadata.execution_time or 0
+            total_sources += metadata.source_count or 0
+            confidence_score = metadata.confidence_score
+            if confidence_score:
+                confidence_sum += confidence_score
+                confidence_count += 1
+            
             # Add content with agent attribution
-            agent_name = output.metadata.agent_role
-            merged_content_parts.append(f"## {agent_name} Output\n\n{str(output.content)}")
+            agent_name = metadata.agent_role
+            merged_content_parts[index] = f"## {agent_name} Output\n\n{str(output.content)}"
             
             # Merge sections
-            if output.sections:
-                for section_name, section_content in output.sections.items():
-                    prefixed_section = f"{agent_name.lower().replace(' ', '_')}_{section_name}"
-                    merged_sections[prefixed_section] = section_content
-            
-            # Collect tags and keywords
-            all_tags.update(output.tags)
-            all_keywords.update(output.keywords)
+            sections = output.sections
+            if sections:
+                section_prefix = agent_name.lower().replace(' ', '_')
+                for section_name, section_content in sections.items():
+                    merged_sections[f"{section_prefix}_{section_name}"] = section_content
         
-        # Calculate aggregate metadata
-        total_words = sum(output.metadata.word_count or 0 for output in outputs)
-        total_execution_time = sum(output.metadata.execution_time or 0 for output in outputs)
-        avg_confidence = mean([output.metadata.confidence_score for output in outputs if output.metadata.confidence_score]) if any(output.metadata.confidence_score for output in outputs) else None
+        avg_confidence = confidence_sum / confidence_count if confidence_count else None
         
-        # Determine overall status
-        status_priority = {OutputStatus.FAILED: 0, OutputStatus.PARTIAL: 1, OutputStatus.SUCCESS: 2}
-        overall_status = min(outputs, key=lambda x: status_priority.get(x.status, 0)).status
+        # Collect tags and keywords
+        all_tags = set(chain.from_iterable(output.tags for output in outputs))
+        all_keywords = set(chain.from_iterable(output.keywords for output in outputs))
         
         consolidated_output = StructuredOutput(
             content="\n\n".join(merged_content_parts),
@@ -308,7 +613,7 @@ class ResultAggregator:
                 word_count=total_words,
                 execution_time=total_execution_time,
                 confidence_score=avg_confidence,
-                source_count=sum(output.metadata.source_count or 0 for output in outputs)
+                source_count=total_sources
             ),
             sections=merged_sections,
             tags=list(all_tags),
@@ -321,24 +626,27 @@ class ResultAggregator:
     def _summarize_outputs(self, outputs: List[StructuredOutput], agent_role: str) -> StructuredOutput:
         """Create a summary of multiple outputs."""
         
-        summary_parts = []
-        summary_parts.append("# Workflow Summary\n")
+        # Header and overview lines are known up front; the rest is appended
+        summary_parts = [""] * (2 + len(outputs))
+        summary_parts[0] = "# Workflow Summary\n"
         
         # Overview
-        summary_parts.append(f"This summary consolidates results from {len(outputs)} agents:\n")
-        for output in outputs:
-            status_emoji = "✅" if output.status == OutputStatus.SUCCESS else "⚠️" if output.status == OutputStatus.PARTIAL else "❌"
-            summary_parts.append(f"- {status_emoji} **{output.metadata.agent_role}**: {output.get_content_preview(100)}")
+        summary_parts[1] = f"This summary consolidates results from {len(outputs)} agents:\n"
+        for index, output in enumerate(outputs, 2):
+            status_emoji = _STATUS_EMOJI.get(output.status, "❌")
+            summary_parts[index] = f"- {status_emoji} **{output.metadata.agent_role}**: {output.get_content_preview(100)}"
         
         summary_parts.append("\n## Key Findings\n")
         
         # Extract key sections from each output
         key_sections = defaultdict(list)
         for output in outputs:
-            if output.sections:
-                for section_name, section_content in output.sections.items():
-                    if section_name.lower() in ['summary', 'findings', 'conclusion', 'recommendations']:
-                        key_sections[section_name].append(f"**{output.metadata.agent_role}**: {str(section_content)[:300]}...")
+            sections = output.sections
+            if sections:
+                agent_name = output.metadata.agent_role
+                for section_name, section_content in sections.items():
+                    if section_name.lower() in _KEY_SECTIONS:
+                        key_sections[section_name].append(f"**{agent_name}**: {str(section_content)[:300]}...")
         
         for section_name, content_list in key_sections.items():
             summary_parts.append(f"### {section_name.title()}\n")
@@ -347,12 +655,22 @@ class ResultAggregator:
         
         # Aggregate metrics
         total_words = sum(output.metadata.word_count or 0 for output in outputs)
-        avg_confidence = mean([output.metadata.confidence_score for output in outputs if output.metadata.confidence_score]) if any(output.metadata.confidence_score for output in outputs) else None
+        avg_confidence = _mean_or_none(np.fromiter(
+            (output.metadata.confidence_score for output in outputs if output.metadata.confidence_score),
+            dtype=np.float64
+        ))
+        
+        successful_outputs = int(np.count_nonzero(
+            _status_codes(output.status for output in outputs) == _SUCCESS_CODE
+        ))
         
         summary_parts.append("## Workflow Metrics\n")
         summary_parts.append(f"- **Total Word Count**: {total_words:,}")
         summary_parts.append(f"- **Average Confidence**: {avg_confidence:.1%}" if avg_confidence else "- **Average Confidence**: N/A")
-        summary_parts.append(f"- **Successful Outputs**: {sum(1 for o in outputs if o.status == OutputStatus.SUCCESS)}/{len(outputs)}")
+        summary_parts.append(f"- **Successful Outputs**: {successful_outputs}/{len(outputs)}")
+        
+        # Parts are joined with whitespace, so word counts add up per part
+        summary_word_count = sum(len(part.split()) for part in summary_parts)
         
         summary_output = StructuredOutput(
             content="\n".join(summary_parts),
@@ -362,7 +680,7 @@ class ResultAggregator:
                 agent_id="summary",
                 agent_role=agent_role,
                 workflow_id=outputs[0].metadata.workflow_id if outputs else None,
-                word_count=len("\n".join(summary_parts).split()),
+                word_count=summary_word_count,
                 source_count=sum(output.metadata.source_count or 0 for output in outputs)
             ),
             processing_notes=[f"Summary generated from {len(outputs)} agent outputs"]
@@ -373,37 +691,10 @@ class ResultAggregator:
     def _select_best_output(self, outputs: List[StructuredOutput], agent_role: str) -> StructuredOutput:
         """Select the best output based on quality metrics."""
         
-        def score_output(output: StructuredOutput) -> float:
-            score = 0.0
-            
-            # Status score
-            if output.status == OutputStatus.SUCCESS:
-                score += 3.0
-            elif output.status == OutputStatus.PARTIAL:
-                score += 1.0
-            
-            # Validation score
-            if output.validation:
-                score += output.validation.validation_score * 2.0
-            
-            # Content quality indicators
-            if output.metadata.word_count:
-                # Prefer outputs with substantial content but not excessively long
-                word_score = min(output.metadata.word_count / 1000, 2.0)
-                score += word_score
-            
-            # Confidence score
-            if output.metadata.confidence_score:
-                score += output.metadata.confidence_score * 1.0
-            
-            # Completeness (has sections)
-            if output.sections:
-                score += len(output.sections) * 0.1
-            
-            return score
-        
-        # Find the best output
-        best_output = max(outputs, key=score_output)
+        scores = _score_matrix(
+            _score_features(outputs), _BEST_STATUS_POINTS, _BEST_WEIGHTS, _BEST_CAPS
+        )
+        best_output = outputs[int(np.argmax(scores))]
         
         # Clone the best output with updated metadata
         best_copy = StructuredOutput(
@@ -433,7 +724,8 @@ class ResultAggregator:
     def generate_comparison_report(
         self,
         outputs: List[StructuredOutput],
-        comparison_criteria: Optional[List[str]] = None
+        comparison_criteria: Optional[List[str]] = None,
+        top_k: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Generate a detailed comparison report between multiple outputs.
@@ -441,6 +733,7 @@ class ResultAggregator:
         Args:
             outputs: List of outputs to compare
             comparison_criteria: Specific criteria to compare (default: all)
+            top_k: Only include the top K outputs in the ranking (default: all)
             
         Returns:
             Detailed comparison report
@@ -464,88 +757,60 @@ class ResultAggregator:
             comparison["detailed_comparison"][criterion] = self._compare_by_criterion(outputs, criterion)
         
         # Overall ranking
-        comparison["ranking"] = self._rank_outputs(outputs)
+        comparison["ranking"] = self._rank_outputs(outputs, top_k=top_k)
         
         return comparison
     
     def _compare_by_criterion(self, outputs: List[StructuredOutput], criterion: str) -> Dict[str, Any]:
         """Compare outputs by a specific criterion."""
-        values = []
-        
-        for output in outputs:
-            if criterion == "word_count":
-                values.append(output.metadata.word_count or 0)
-            elif criterion == "execution_time":
-                values.append(output.metadata.execution_time or 0)
-            elif criterion == "confidence_score":
-                values.append(output.metadata.confidence_score or 0)
-            elif criterion == "validation_score":
-                values.append(output.validation.validation_score if output.validation else 0)
-            elif criterion == "status":
-                values.append(output.status)
-            elif criterion == "content_type":
-                values.append(output.output_type)
-            else:
-                values.append("N/A")
+        extractor = _CRITERION_EXTRACTORS.get(criterion)
+        values = [extractor(output) for output in outputs] if extractor else ["N/A"] * len(outputs)
         
         result = {
             "values": values,
             "agents": [output.metadata.agent_role for output in outputs]
         }
         
-        # Add statistics for numeric values
-        numeric_values = [v for v in values if isinstance(v, (int, float))]
-        if numeric_values:
+        # Add statistics for numeric criteria
+        if criterion in _NUMERIC_CRITERIA and values:
+            numeric_values = np.fromiter(values, dtype=np.float64, count=len(values))
             result.update({
-                "min": min(numeric_values),
-                "max": max(numeric_values),
-                "avg": mean(numeric_values),
-                "median": median(numeric_values)
+                "min": float(numeric_values.min()),
+                "max": float(numeric_values.max()),
+                "avg": float(numeric_values.mean()),
+                "median": float(np.median(numeric_values))
             })
         
         return result
     
-    def _rank_outputs(self, outputs: List[StructuredOutput]) -> List[Dict[str, Any]]:
-        """Rank outputs by overall quality score."""
-        scored_outputs = []
+    def _rank_outputs(
+        self,
+        outputs: List[StructuredOutput],
+        top_k: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Rank outputs by overall quality score, optionally keeping only the top K."""
+        scores = _score_matrix(
+            _score_features(outputs), _RANK_STATUS_POINTS, _RANK_WEIGHTS, _RANK_CAPS
+        )
+        rounded_scores = [round(score, 2) for score in scores.tolist()]
         
-        for i, output in enumerate(outputs):
-            score = 0.0
-            
-            # Status weight
-            if output.status == OutputStatus.SUCCESS:
-                score += 30
-            elif output.status == OutputStatus.PARTIAL:
-                score += 15
-            
-            # Validation weight
-            if output.validation:
-                score += output.validation.validation_score * 25
-            
-            # Content weight
-            if output.metadata.word_count:
-                score += min(output.metadata.word_count / 100, 20)
-            
-            # Confidence weight
-            if output.metadata.confidence_score:
-                score += output.metadata.confidence_score * 15
-            
-            # Completeness weight
-            if output.sections:
-                score += min(len(output.sections) * 2, 10)
-            
+        # Order by score (ties keep input order); a partial sort suffices for top K
+        if top_k is None:
+            order = sorted(range(len(outputs)), key=rounded_scores.__getitem__, reverse=True)
+        else:
+            order = heapq.nlargest(top_k, range(len(outputs)), key=rounded_scores.__getitem__)
+        
+        scored_outputs = []
+        for rank, index in enumerate(order, 1):
+            output = outputs[index]
+            validation = output.validation
             scored_outputs.append({
-                "rank": 0,  # Will be set after sorting
+                "rank": rank,
                 "agent": output.metadata.agent_role,
-                "score": round(score, 2),
+                "score": rounded_scores[index],
                 "status": output.status,
                 "word_count": output.metadata.word_count,
-                "validation_score": output.validation.validation_score if output.validation else None
+                "validation_score": validation.validation_score if validation else None
             })
         
-        # Sort by score and assign ranks
-        scored_outputs.sort(key=lambda x: x["score"], reverse=True)
-        for i, item in enumerate(scored_outputs):
-            item["rank"] = i + 1
-        
         return scored_outputs 
\ No newline at end of file
@@ -5,14 +5,17 @@ Provides standardized data structures and schemas for agent outputs
 to ensure consistency and easy processing across workflows.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Union, Type
 from enum import Enum
-from pydantic import BaseModel, Field, validator, ConfigDict
-import json
+from pydantic import BaseModel, Field, PrivateAttr, SkipValidation, validator, ConfigDict
+import orjson
 import uuid
 
 
+_UTC = timezone.utc
+
+
 class OutputType(str, Enum):
     """Enumeration of supported output types."""
     TEXT = "text"
@@ -35,14 +38,20 @@ class OutputStatus(str, Enum):
 class OutputMetadata(BaseModel):
     """Metadata associated with agent outputs."""
     
-    model_config = ConfigDict(protected_namespaces=())
+    # Immutable once created; assignment is rejected rather than validated
+    model_config = ConfigDict(
+        protected_namespaces=(),
+        frozen=True,
+        extra="forbid",
+        validate_assignment=False
+    )
     
     agent_id: str = Field(..., description="ID of the agent that produced the output")
     agent_role: str = Field(..., description="Role of the agent")
     task_id: Optional[str] = Field(None, description="ID of the task that generated the output")
     task_name: Optional[str] = Field(None, description="Name of the task")
     workflow_id: Optional[str] = Field(None, description="ID of the parent workflow")
-    timestamp: datetime = Field(default_factory=datetime.now, description="When the output was generated")
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(_UTC), description="When the output was generated (UTC)")
     execution_time: Optional[float] = Field(None, description="Time taken to generate output in seconds")
     tokens_used: Optional[int] = Field(None, description="Number of tokens consumed")
     model_used: Optional[str] = Field(None, description="AI model used for generation")
@@ -54,6 +63,8 @@ class OutputMetadata(BaseModel):
 class OutputValidation(BaseModel):
     """Validation results for agent outputs."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid", validate_assignment=False)
+    
     is_valid: bool = Field(..., description="Whether the output passes validation")
     validation_score: float = Field(..., ge=0.0, le=1.0, description="Validation score")
     errors: List[str] = Field(default_factory=list, description="List of validation errors")
@@ -75,7 +86,8 @@ class StructuredOutput(BaseModel):
     
     # Core output data
     id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique output identifier")
-    content: Union[str, Dict[str, Any], List[Any]] = Field(..., description="The actual output content")
+    # Content is produced by agents (str, dict or list) and stored as-is
+    content: SkipValidation[Any] = Field(..., description="The actual output content")
     output_type: OutputType = Field(default=OutputType.TEXT, description="Type of output content")
     status: OutputStatus = Field(default=OutputStatus.SUCCESS, description="Processing status")
     
@@ -98,11 +110,20 @@ class StructuredOutput(BaseModel):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary with proper JSON serialization."""
-        return json.loads(self.model_dump_json())
+        return self.model_dump(mode="json")
     
     def to_json(self, indent: int = 2) -> str:
         """Convert to formatted JSON string."""
-        return self.model_dump_json(indent=indent)
+        return self.to_json_bytes(indent=indent).decode()
+    
+    def to_json_bytes(self, indent: Optional[int] = 2) -> bytes:
+        """Convert to UTF-8 encoded JSON, for callers that can write bytes directly."""
+        if not indent:
+            return orjson.dumps(self.model_dump(mode="json"))
+        if indent == 2:
+            return orjson.dumps(self.model_dump(mode="json"), option=orjson.OPT_INDENT_2)
+        # orjson only supports 2-space indentation
+        return self.model_dump_json(indent=indent).encode()
     
     def get_summary(self) -> Dict[str, Any]:
         """Get a summary of the output for quick overview."""
@@ -120,12 +141,8 @@ class StructuredOutput(BaseModel):
     
     def get_content_preview(self, max_length: int = 200) -> str:
         """Get a preview of the content."""
-        if isinstance(self.content, str):
-            return self.content[:max_length] + ("..." if len(self.content) > max_length else "")
-        elif isinstance(self.content, dict):
-            return str(self.content)[:max_length] + ("..." if len(str(self.content)) > max_length else "")
-        else:
-            return str(self.content)[:max_length] + ("..." if len(str(self.content)) > max_length else "")
+        content = self.content if isinstance(self.content, str) else str(self.content)
+        return content[:max_length] + ("..." if len(content) > max_length else "")
 
 
 class OutputSchema(BaseModel):
@@ -153,55 +170,74 @@ class OutputSchema(BaseModel):
     min_confidence: float = Field(default=0.7, ge=0.0, le=1.0, description="Minimum confidence score")
     required_sources: Optional[int] = Field(None, description="Minimum number of sources required")
     
+    # Which optional checks this schema enables, resolved once at construction
+    _checks_min_word_count: bool = PrivateAttr(default=False)
+    _checks_max_word_count: bool = PrivateAttr(default=False)
+    _checks_sources: bool = PrivateAttr(default=False)
+    _checks_sections: bool = PrivateAttr(default=False)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Cache which optional checks are enabled by this schema."""
+        self._checks_min_word_count = bool(self.min_word_count)
+        self._checks_max_word_count = bool(self.max_word_count)
+        self._checks_sources = bool(self.required_sources)
+        self._checks_sections = bool(self.required_sections)
+    
     def validate_output(self, output: StructuredOutput) -> OutputValidation:
         """Validate an output against this schema."""
         errors = []
         warnings = []
-        requirements_met = {}
+        # (requirement, met) pairs, counted as they are checked
+        checks = []
+        met_requirements = 0
+        metadata = output.metadata
         
         # Check word count
-        if self.min_word_count and output.metadata.word_count:
-            if output.metadata.word_count < self.min_word_count:
-                errors.append(f"Word count {output.metadata.word_count} below minimum {self.min_word_count}")
-                requirements_met["min_word_count"] = False
-            else:
-                requirements_met["min_word_count"] = True
+        word_count = metadata.word_count
+        if self._checks_min_word_count and word_count:
+            met = word_count >= self.min_word_count
+            if not met:
+                errors.append(f"Word count {word_count} below minimum {self.min_word_count}")
+            checks.append(("min_word_count", met))
+            met_requirements += met
         
-        if self.max_word_count and output.metadata.word_count:
-            if output.metadata.word_count > self.max_word_count:
-                warnings.append(f"Word count {output.metadata.word_count} exceeds maximum {self.max_word_count}")
-                requirements_met["max_word_count"] = False
-            else:
-                requirements_met["max_word_count"] = True
+        if self._checks_max_word_count and word_count:
+            met = word_count <= self.max_word_count
+            if not met:
+                warnings.append(f"Word count {word_count} exceeds maximum {self.max_word_count}")
+            checks.append(("max_word_count", met))
+            met_requirements += met
         
         # Check confidence score
-        if output.metadata.confidence_score:
-            if output.metadata.confidence_score < self.min_confidence:
-                warnings.append(f"Confidence score {output.metadata.confidence_score} below minimum {self.min_confidence}")
-                requirements_met["min_confidence"] = False
-            else:
-                requirements_met["min_confidence"] = True
+        confidence_score = metadata.confidence_score
+        if confidence_score:
+            met = confidence_score >= self.min_confidence
+            if not met:
+                warnings.append(f"Confidence score {confidence_score} below minimum {self.min_confidence}")
+            checks.append(("min_confidence", met))
+            met_requirements += met
         
         # Check required sources
-        if self.required_sources and output.metadata.source_count:
-            if output.metadata.source_count < self.required_sources:
-                errors.append(f"Source count {output.metadata.source_count} below required {self.required_sources}")
-                requirements_met["required_sources"] = False
-            else:
-                requirements_met["required_sources"] = True
+        source_count = metadata.source_count
+        if self._checks_sources and source_count:
+            met = source_count >= self.required_sources
+            if not met:
+                errors.append(f"Source count {source_count} below required {self.required_sources}")
+            checks.append(("required_sources", met))
+            met_requirements += met
         
         # Check required sections
-        if self.required_sections and output.sections:
+        sections = output.sections
+        if self._checks_sections and sections:
             for section in self.required_sections:
-                if section not in output.sections:
+                met = section in sections
+                if not met:
                     errors.append(f"Required section '{section}' missing")
-                    requirements_met[f"section_{section}"] = False
-                else:
-                    requirements_met[f"section_{section}"] = True
+                checks.append((f"section_{section}", met))
+                met_requirements += met
         
         # Calculate validation score
-        total_requirements = len(requirements_met)
-        met_requirements = sum(1 for met in requirements_met.values() if met)
+        total_requirements = len(checks)
         validation_score = met_requirements / total_requirements if total_requirements > 0 else 1.0
         
         # Determine if valid (no errors)
@@ -212,40 +248,54 @@ class OutputSchema(BaseModel):
             validation_score=validation_score,
             errors=errors,
             warnings=warnings,
-            requirements_met=requirements_met
+            requirements_met=dict(checks)
         )
 
 
-# Predefined schemas for common use cases
-RESEARCH_OUTPUT_SCHEMA = OutputSchema(
+# Predefined schemas for common use cases. These are built from trusted
+# literals, so they skip validation; every field is spelled out so the
+# constants do not depend on model_construct's default handling.
+RESEARCH_OUTPUT_SCHEMA = OutputSchema.model_construct(
     name="research_output",
     description="Schema for research task outputs",
+    version="1.0",
     required_fields=["findings", "sources", "summary"],
     optional_fields=["statistics", "quotes", "trends"],
+    field_types={},
     required_sections=["executive_summary", "key_findings", "sources"],
+    format_requirements={},
     min_word_count=500,
     max_word_count=5000,
+    min_confidence=0.7,
     required_sources=3
 )
 
-CONTENT_OUTPUT_SCHEMA = OutputSchema(
+CONTENT_OUTPUT_SCHEMA = OutputSchema.model_construct(
     name="content_output", 
     description="Schema for content creation outputs",
+    version="1.0",
     required_fields=["title", "content", "meta_description"],
     optional_fields=["tags", "keywords", "call_to_action"],
+    field_types={},
     required_sections=["introduction", "body", "conclusion"],
+    format_requirements={},
     min_word_count=800,
     max_word_count=3000,
-    min_confidence=0.8
+    min_confidence=0.8,
+    required_sources=None
 )
 
-ANALYSIS_OUTPUT_SCHEMA = OutputSchema(
+ANALYSIS_OUTPUT_SCHEMA = OutputSchema.model_construct(
     name="analysis_output",
     description="Schema for analytical task outputs", 
+    version="1.0",
     required_fields=["analysis", "insights", "recommendations"],
     optional_fields=["data_points", "charts", "metrics"],
+    field_types={},
     required_sections=["overview", "detailed_analysis", "recommendations"],
+    format_requirements={},
     min_word_count=300,
     max_word_count=2000,
+    min_confidence=0.7,
     required_sources=2
-) 
\ No newline at end of file
+)
@@ -9,9 +9,18 @@ from crewai_tools import BaseTool
 from typing import Optional, Type, Dict, Any, List
 from pydantic import BaseModel, Field
 import requests
+from requests.adapters import HTTPAdapter
+import asyncio
 import os
 from datetime import datetime
 
+# Shared HTTP session for platform API calls, so connections (and TLS
+# handshakes) are pooled across posts and tool instances
+_http_session = requests.Session()
+_http_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50)
+_http_session.mount("https://", _http_adapter)
+_http_session.mount("http://", _http_adapter)
+
 class SocialMediaPostSchema(BaseModel):
     """Input schema for social media posting."""
     content: str = Field(..., description="The content to post")
@@ -41,6 +50,12 @@ class SocialMediaTool(BaseTool):
         self.twitter_api_key = os.getenv('TWITTER_API_KEY')
         self.linkedin_api_key = os.getenv('LINKEDIN_API_KEY')
         self.facebook_api_key = os.getenv('FACEBOOK_API_KEY')
+        self._http = _http_session
+        self._platform_handlers = {
+            "twitter": self._post_to_twitter,
+            "linkedin": self._post_to_linkedin,
+            "facebook": self._post_to_facebook,
+        }
     
     def _run(
         self, 
@@ -68,15 +83,7 @@ class SocialMediaTool(BaseTool):
             formatted_content = self._format_content(content, hashtags)
             
             for platform in platforms:
-                if platform.lower() == "twitter":
-                    result = self._post_to_twitter(formatted_content, schedule_time)
-                elif platform.lower() == "linkedin":
-                    result = self._post_to_linkedin(formatted_content, schedule_time)
-                elif platform.lower() == "facebook":
-                    result = self._post_to_facebook(formatted_content, schedule_time)
-                else:
-                    result = f"❌ Unsupported platform: {platform}"
-                
+                result = self._post_to_platform(platform, formatted_content, schedule_time)
                 results.append(f"{platform.title()}: {result}")
             
             return "\n".join(results)
@@ -84,10 +91,61 @@ class SocialMediaTool(BaseTool):
         except Exception as e:
             return f"Error posting to social media: {str(e)}"
     
+    async def _arun(
+        self, 
+        content: str, 
+        platforms: List[str] = ["twitter", "linkedin"],
+        hashtags: Optional[List[str]] = None,
+        schedule_time: Optional[str] = None
+    ) -> str:
+        """
+        Post content to specified social media platforms concurrently.
+        
+        Each platform is posted to in its own worker thread, so total latency
+        is that of the slowest platform rather than the sum of all of them.
+        A failure on one platform is reported without affecting the others.
+        
+        Args:
+            content: The content to post
+            platforms: List of platforms to post to
+            hashtags: Optional hashtags to include
+            schedule_time: Optional scheduling time
+            
+        Returns:
+            String summary of posting results
+        """
+        try:
+            formatted_content = self._format_content(content, hashtags)
+            
+            results = await asyncio.gather(
+                *(
+                    asyncio.to_thread(self._post_to_platform, platform, formatted_content, schedule_time)
+                    for platform in platforms
+                ),
+                return_exceptions=True
+            )
+            
+            return "\n".join(
+                f"{platform.title()}: "
+                + (f"❌ Error: {result}" if isinstance(result, Exception) else result)
+                for platform, result in zip(platforms, results)
+            )
+            
+        except Exception as e:
+            return f"Error posting to social media: {str(e)}"
+    
+    def _post_to_platform(self, platform: str, content: str, schedule_time: Optional[str] = None) -> str:
+        """Post content to a single platform by name."""
+        handler = self._platform_handlers.get(platform.lower())
+        if handler:
+            return handler(content, schedule_time)
+        return f"❌ Unsupported platform: {platform}"
+    
     def _format_content(self, content: str, hashtags: Optional[List[str]] = None) -> str:
         """Format content with hashtags."""
         if hashtags:
-            hashtag_string = " ".join([f"#{tag.strip('#')}" for tag in hashtags])
+            # Only leading '#' is normalized, so tags like "C#" keep their suffix
+            hashtag_string = " ".join("#" + tag.lstrip("#") for tag in hashtags)
             return f"{content}\n\n{hashtag_string}"
         return content
     
@@ -127,6 +185,26 @@ class SocialMediaTool(BaseTool):
         else:
             return "✅ Posted to Facebook successfully"
 
+# Report templates for SocialMediaAnalyticsTool, filled with str.format_map
+SPECIFIC_POST_TEMPLATE = (
+    "📊 Analytics for {platform} Post {post_id}:\n"
+    "• Likes: {likes}\n"
+    "• Shares: {shares}\n"
+    "• Comments: {comments}\n"
+    "• Reach: {reach}\n"
+    "• Engagement Rate: {engagement_rate}"
+)
+
+RECENT_POSTS_TEMPLATE = (
+    "📈 {platform} Analytics (Last {days_back} days):\n"
+    "• Total Posts: {total_posts}\n"
+    "• Average Likes: {avg_likes}\n"
+    "• Average Shares: {avg_shares}\n"
+    "• Average Comments: {avg_comments}\n"
+    "• Total Reach: {total_reach}\n"
+    "• Average Engagement Rate: {avg_engagement_rate}"
+)
+
 class SocialMediaAnalyticsSchema(BaseModel):
     """Input schema for social media analytics."""
     platform: str = Field(..., description="Platform to analyze (twitter, linkedin, facebook)")
@@ -178,14 +256,9 @@ class SocialMediaAnalyticsTool(BaseTool):
             "engagement_rate": "2.3%"
         }
         
-        return f"""
-📊 Analytics for {platform.title()} Post {post_id}:
-• Likes: {metrics['likes']}
-• Shares: {metrics['shares']}
-• Comments: {metrics['comments']}
-• Reach: {metrics['reach']}
-• Engagement Rate: {metrics['engagement_rate']}
-        """.strip()
+        return SPECIFIC_POST_TEMPLATE.format_map(
+            {"platform": platform.title(), "post_id": post_id, **metrics}
+        )
     
     def _analyze_recent_posts(self, platform: str, days_back: int) -> str:
         """Analyze metrics for recent posts."""
@@ -199,15 +272,9 @@ class SocialMediaAnalyticsTool(BaseTool):
             "avg_engagement_rate": "2.1%"
         }
         
-        return f"""
-📈 {platform.title()} Analytics (Last {days_back} days):
-• Total Posts: {metrics['total_posts']}
-• Average Likes: {metrics['avg_likes']}
-• Average Shares: {metrics['avg_shares']}
-• Average Comments: {metrics['avg_comments']}
-• Total Reach: {metrics['total_reach']}
-• Average Engagement Rate: {metrics['avg_engagement_rate']}
-        """.strip()
+        return RECENT_POSTS_TEMPLATE.format_map(
+            {"platform": platform.title(), "days_back": days_back, **metrics}
+        )
 
 # Example usage
 if __name__ == "__main__":
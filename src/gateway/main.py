@@ -5,12 +5,18 @@ Routes requests to appropriate microservices.
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from collections import deque
 import httpx
-import uuid
+import os
 
 from src.shared.config import get_settings
-from src.shared.utils.logging import configure_logging, get_logger
+from src.shared.utils.logging import (
+    add_correlation_id,
+    clear_log_context,
+    configure_logging,
+    get_logger,
+)
 
 # Configure logging
 configure_logging()
@@ -18,55 +24,75 @@ logger = get_logger(__name__)
 
 settings = get_settings()
 
+# Settings read by the gateway, resolved once at import
+CORS_ORIGINS = settings.security.cors_origins
+GATEWAY_HOST = settings.services.api_gateway_host
+GATEWAY_PORT = settings.services.api_gateway_port
+
 app = FastAPI(
     title="AI Agent Platform API Gateway",
     description="API Gateway for the AI Agent & Workflow Management Platform",
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.security.cors_origins,
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 
-@app.middleware("http")
-async def add_correlation_id(request: Request, call_next):
-    """Add correlation ID to all requests."""
-    correlation_id = str(uuid.uuid4())
-    request.state.correlation_id = correlation_id
-    
-    response = await call_next(request)
-    response.headers["X-Correlation-ID"] = correlation_id
-    return response
+# Correlation IDs are 128-bit random hex strings, drawn from a pool that is
+# refilled with a single os.urandom call instead of one call per request.
+# They are kept as ASCII bytes so they can go straight into response headers.
+CORRELATION_ID_BATCH_SIZE = 1024
+CORRELATION_ID_HEADER = b"x-correlation-id"
+_correlation_id_pool: deque = deque()
+
+
+def _next_correlation_id() -> bytes:
+    """Take a correlation ID from the pool, refilling it when empty."""
+    if not _correlation_id_pool:
+        random_hex = os.urandom(16 * CORRELATION_ID_BATCH_SIZE).hex().encode("ascii")
+        _correlation_id_pool.extend(
+            random_hex[start:start + 32] for start in range(0, len(random_hex), 32)
+        )
+    return _correlation_id_pool.popleft()
 
 
 @app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log all incoming requests."""
-    logger.info(
-        "Incoming request",
-        method=request.method,
-        url=str(request.url),
-        correlation_id=getattr(request.state, "correlation_id", None),
-    )
-    
-    response = await call_next(request)
+async def observe_requests(request: Request, call_next):
+    """Add a correlation ID to each request and log it on entry and completion."""
+    correlation_id_bytes = _next_correlation_id()
+    correlation_id = correlation_id_bytes.decode("ascii")
+    request.state.correlation_id = correlation_id
+    method = request.method
+    url = str(request.url)
     
-    logger.info(
-        "Request completed",
-        method=request.method,
-        url=str(request.url),
-        status_code=response.status_code,
-        correlation_id=getattr(request.state, "correlation_id", None),
-    )
+    # Every log line emitted while handling the request carries the ID
+    add_correlation_id(correlation_id)
+    try:
+        logger.info("Incoming request", method=method, url=url)
+        
+        response = await call_next(request)
+        
+        logger.info(
+            "Request completed",
+            method=method,
+            url=url,
+            status_code=response.status_code,
+        )
+    finally:
+        clear_log_context()
     
+    # Append the raw header directly, skipping MutableHeaders' str->bytes encoding
+    response.raw_headers.append((CORRELATION_ID_HEADER, correlation_id_bytes))
     return response
 
 
@@ -94,7 +120,7 @@ if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
         "src.gateway.main:app",
-        host=settings.services.api_gateway_host,
-        port=settings.services.api_gateway_port,
+        host=GATEWAY_HOST,
+        port=GATEWAY_PORT,
         reload=settings.debug,
     ) 
\ No newline at end of file
@@ -6,12 +6,33 @@ enabling automated lead management, opportunity tracking, and customer data anal
 """
 
 from typing import Dict, List, Optional, Any
+import asyncio
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import csv
+import io
+import logging
 import os
+import random
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 import json
 
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+from src.shared.config import get_settings
+
+logger = logging.getLogger(__name__)
+
 @dataclass
 class SalesforceConfig:
     """Configuration for Salesforce integration."""
@@ -23,6 +44,174 @@ class SalesforceConfig:
     instance_url: str = "https://login.salesforce.com"
     api_version: str = "v58.0"
 
+# Salesforce token responses usually omit expires_in; sessions default to a
+# 2 hour timeout, so assume slightly less than that
+DEFAULT_TOKEN_LIFETIME_SECONDS = 6600
+# Re-authenticate this long before the token is expected to expire
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+
+# Transient failures (rate limiting and server errors) are retried with
+# exponential backoff plus jitter; other 4xx responses are never retried
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# A 500/502/504 to a POST may come after Salesforce created the record, so
+# non-idempotent requests are only retried when they were rejected outright
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PATCH"})
+REJECTED_STATUS_CODES = frozenset({429, 503})
+MAX_RETRIES = 3
+RETRY_BASE_DELAY_SECONDS = 1.0
+RETRY_JITTER = 0.5
+RETRY_MAX_DELAY_SECONDS = 30.0
+
+# Redis lock that serializes token refreshes across worker processes;
+# concurrent refreshes for the same connected app are rejected by Salesforce
+AUTH_LOCK_KEY = "sf:auth:{client_id}"
+AUTH_LOCK_TIMEOUT_SECONDS = 30
+
+# Leads fetched by get_lead are cached in Redis briefly, since agents tend to
+# look up the same lead several times while reasoning about it. Record ids are
+# only unique within an org, so the key includes the org's instance URL
+LEAD_CACHE_KEY = "sf:lead:{instance_url}:{lead_id}"
+LEAD_CACHE_TTL_SECONDS = 60
+
+# Report queries, kept on one line so the query string stays short and
+# identical between calls
+RECENT_LEADS_SOQL = (
+    "SELECT Id,FirstName,LastName,Company,Email,Phone,Status,CreatedDate FROM Lead "
+    "WHERE CreatedDate=LAST_N_DAYS:{days} ORDER BY CreatedDate DESC"
+)
+PIPELINE_SOQL = (
+    "SELECT StageName,COUNT(Id) OpportunityCount,SUM(Amount) TotalAmount FROM Opportunity "
+    "WHERE IsClosed=false GROUP BY StageName"
+)
+
+# Maximum records per sObject Collections (composite/sobjects) request
+COMPOSITE_BATCH_SIZE = 200
+# Above this many records, bulk operations use a Bulk API 2.0 ingest job
+BULK_API_THRESHOLD = 10000
+# Ingest job states after which Salesforce makes no further changes
+INGEST_JOB_FINAL_STATES = frozenset({"JobComplete", "Failed", "Aborted"})
+
+
+def _chunks(items: List[Any], size: int):
+    """Yield successive slices of at most `size` items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+@lru_cache()
+def _redis_client() -> Optional["redis.Redis"]:
+    """Shared Redis client, or None if redis is not installed."""
+    if not REDIS_AVAILABLE:
+        return None
+    return redis.from_url(get_settings().redis.url)
+
+
+def _get_cached_lead(instance_url: str, lead_id: str) -> Optional[Dict[str, Any]]:
+    """Return the cached lead record, or None on a miss or Redis failure."""
+    client = _redis_client()
+    if client is None:
+        return None
+    
+    try:
+        cached = client.get(LEAD_CACHE_KEY.format(instance_url=instance_url, lead_id=lead_id))
+    except redis.RedisError:
+        return None
+    return json.loads(cached) if cached is not None else None
+
+
+def _cache_lead(instance_url: str, lead_id: str, data: Dict[str, Any]) -> None:
+    """Cache a lead record for LEAD_CACHE_TTL_SECONDS."""
+    client = _redis_client()
+    if client is None:
+        return
+    
+    try:
+        client.setex(
+            LEAD_CACHE_KEY.format(instance_url=instance_url, lead_id=lead_id),
+            LEAD_CACHE_TTL_SECONDS,
+            json.dumps(data)
+        )
+    except redis.RedisError:
+        logger.warning("Failed to cache Salesforce lead %s", lead_id)
+
+
+def _invalidate_leads(instance_url: str, lead_ids: List[str]) -> None:
+    """Drop cached lead records after they have been modified."""
+    client = _redis_client()
+    if client is None or not lead_ids:
+        return
+    
+    try:
+        client.delete(*(
+            LEAD_CACHE_KEY.format(instance_url=instance_url, lead_id=lead_id)
+            for lead_id in lead_ids
+        ))
+    except redis.RedisError:
+        # Stale entries still expire after LEAD_CACHE_TTL_SECONDS
+        logger.warning("Failed to invalidate cached Salesforce leads")
+
+
+def _config_from_env() -> SalesforceConfig:
+    """Load Salesforce configuration from environment variables."""
+    return SalesforceConfig(
+        client_id=os.getenv('SALESFORCE_CLIENT_ID', ''),
+        client_secret=os.getenv('SALESFORCE_CLIENT_SECRET', ''),
+        username=os.getenv('SALESFORCE_USERNAME', ''),
+        password=os.getenv('SALESFORCE_PASSWORD', ''),
+        security_token=os.getenv('SALESFORCE_SECURITY_TOKEN', ''),
+        instance_url=os.getenv('SALESFORCE_INSTANCE_URL', 'https://login.salesforce.com')
+    )
+
+
+def _auth_request_data(config: SalesforceConfig) -> Dict[str, str]:
+    """Form data for the OAuth username-password token request."""
+    return {
+        'grant_type': 'password',
+        'client_id': config.client_id,
+        'client_secret': config.client_secret,
+        'username': config.username,
+        'password': f"{config.password}{config.security_token}"
+    }
+
+
+def _token_lifetime(auth_result: Dict[str, Any]) -> float:
+    """Token lifetime in seconds from a token response."""
+    expires_in = auth_result.get('expires_in')
+    return float(expires_in) if expires_in else DEFAULT_TOKEN_LIFETIME_SECONDS
+
+
+def _retryable_status_codes(method: str) -> frozenset:
+    """Status codes after which a request with this method can be resent."""
+    return RETRYABLE_STATUS_CODES if method.upper() in IDEMPOTENT_METHODS else REJECTED_STATUS_CODES
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff delay with random jitter for a retry attempt."""
+    delay = min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * 2 ** attempt)
+    return delay * (1 + random.random() * RETRY_JITTER)
+
+
+def _summarize_pipeline(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Turn pipeline aggregate query records into per-stage and total figures."""
+    pipeline_data = {
+        record['StageName']: {
+            'count': record['OpportunityCount'],
+            'amount': record['TotalAmount'] or 0
+        }
+        for record in records
+    }
+    total_opportunities = sum(record['OpportunityCount'] for record in records)
+    total_amount = sum(record['TotalAmount'] or 0 for record in records)
+    
+    return {
+        "success": True,
+        "pipeline": pipeline_data,
+        "summary": {
+            "total_opportunities": total_opportunities,
+            "total_amount": total_amount
+        }
+    }
+
 class SalesforceIntegration:
     """
     Salesforce CRM Integration for CrewAI workflows.
@@ -36,6 +225,9 @@ class SalesforceIntegration:
     - Data analysis and reporting
     """
     
+    # Shared by all instances in the process so only one refreshes the token
+    _auth_lock = threading.Lock()
+    
     def __init__(self, config: Optional[SalesforceConfig] = None):
         """
         Initialize Salesforce integration.
@@ -43,23 +235,48 @@ class SalesforceIntegration:
         Args:
             config: Salesforce configuration object
         """
-        if config:
-            self.config = config
-        else:
-            # Load from environment variables
-            self.config = SalesforceConfig(
-                client_id=os.getenv('SALESFORCE_CLIENT_ID', ''),
-                client_secret=os.getenv('SALESFORCE_CLIENT_SECRET', ''),
-                username=os.getenv('SALESFORCE_USERNAME', ''),
-                password=os.getenv('SALESFORCE_PASSWORD', ''),
-                security_token=os.getenv('SALESFORCE_SECURITY_TOKEN', ''),
-                instance_url=os.getenv('SALESFORCE_INSTANCE_URL', 'https://login.salesforce.com')
-            )
+        # Load from environment variables unless a config is given
+        self.config = config or _config_from_env()
         
-        self.session = requests.Session()
+        self.session = self._create_session()
         self.access_token = None
         self.instance_url = None
+        self._base_url = None
+        self._lead_url = None
+        self._opportunity_url = None
+        self._query_url = None
+        self._composite_url = None
+        # Ingest job id -> lead ids to invalidate when the job finishes
+        self._pending_lead_invalidations: Dict[str, List[str]] = {}
+        self._token_issued_at = 0.0
+        self._token_expires_at = 0.0
+        
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Create an HTTP session with pooled keep-alive connections.
         
+        Connection failures are retried for idempotent requests only, so a
+        POST is never replayed after it may have reached Salesforce. Error
+        responses are retried by _send.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                allowed_methods=IDEMPOTENT_METHODS
+            )
+        )
+        session.mount("https://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        # Salesforce gzips REST responses on request; large SOQL results
+        # shrink several times over the wire
+        session.headers["Accept-Encoding"] = "gzip"
+        return session
+    
     def authenticate(self) -> bool:
         """
         Authenticate with Salesforce and obtain access token.
@@ -70,33 +287,135 @@ class SalesforceIntegration:
         try:
             auth_url = f"{self.config.instance_url}/services/oauth2/token"
             
-            auth_data = {
-                'grant_type': 'password',
-                'client_id': self.config.client_id,
-                'client_secret': self.config.client_secret,
-                'username': self.config.username,
-                'password': f"{self.config.password}{self.config.security_token}"
-            }
-            
-            response = self.session.post(auth_url, data=auth_data)
+            response = self.session.post(auth_url, data=_auth_request_data(self.config))
             response.raise_for_status()
             
             auth_result = response.json()
             self.access_token = auth_result['access_token']
             self.instance_url = auth_result['instance_url']
+            self._build_urls()
             
-            # Set authorization header for future requests
-            self.session.headers.update({
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/json'
-            })
+            # Track expiry so the token can be refreshed before it goes stale
+            self._token_issued_at = time.monotonic()
+            self._token_expires_at = self._token_issued_at + _token_lifetime(auth_result)
+            
+            # Set authorization header for future requests. Content-Type is
+            # left per request (json= sets it), since a session-wide JSON type
+            # would also label the form-encoded token request on re-auth
+            self.session.headers['Authorization'] = f'Bearer {self.access_token}'
             
             return True
             
-        except Exception as e:
-            print(f"Authentication failed: {str(e)}")
+        except Exception:
+            logger.exception("Salesforce authentication failed")
             return False
     
+    def _build_urls(self) -> None:
+        """Precompute REST endpoint URLs for the authenticated instance."""
+        self._base_url = f"{self.instance_url}/services/data/{self.config.api_version}"
+        self._lead_url = self._base_url + "/sobjects/Lead"
+        self._opportunity_url = self._base_url + "/sobjects/Opportunity"
+        self._query_url = self._base_url + "/query"
+        self._composite_url = self._base_url + "/composite"
+    
+    def _token_is_fresh(self) -> bool:
+        """Check whether the cached access token is valid beyond the refresh margin."""
+        return (
+            self.access_token is not None
+            and time.monotonic() < self._token_expires_at - TOKEN_REFRESH_MARGIN_SECONDS
+        )
+    
+    def _ensure_token(self) -> bool:
+        """
+        Make sure a fresh access token is available, re-authenticating
+        shortly before the cached one expires.
+        
+        Returns:
+            bool: True if a usable token is available, False otherwise
+        """
+        if self._token_is_fresh():
+            return True
+        
+        with self._auth_lock:
+            # Another thread may have refreshed the token while we waited
+            if self._token_is_fresh():
+                return True
+            return self._refresh_token()
+    
+    def _refresh_token(self) -> bool:
+        """
+        Re-authenticate while holding a Redis lock, so that worker processes
+        sharing this connected app refresh one at a time.
+        
+        Falls back to an unguarded refresh when Redis is unavailable.
+        """
+        client = _redis_client()
+        if client is None:
+            return self.authenticate()
+        
+        lock = client.lock(
+            AUTH_LOCK_KEY.format(client_id=self.config.client_id),
+            timeout=AUTH_LOCK_TIMEOUT_SECONDS,
+            blocking_timeout=AUTH_LOCK_TIMEOUT_SECONDS
+        )
+        try:
+            acquired = lock.acquire()
+        except redis.RedisError:
+            logger.warning("Redis unavailable, refreshing Salesforce token without lock")
+            return self.authenticate()
+        
+        try:
+            return self.authenticate()
+        finally:
+            if acquired:
+                try:
+                    lock.release()
+                except redis.RedisError:
+                    # The lock expires on its own after the timeout
+                    logger.warning("Failed to release Salesforce auth lock")
+    
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send an authenticated REST request.
+        
+        If Salesforce rejects the session (401, e.g. INVALID_SESSION_ID), the
+        cached token is discarded and the request is retried exactly once
+        with a fresh token. If re-authentication fails, the 401 is raised.
+        
+        Returns:
+            The successful response
+            
+        Raises:
+            requests.HTTPError: If the request fails
+        """
+        response = self._send(method, url, **kwargs)
+        
+        if response.status_code == 401:
+            self.access_token = None
+            if self._ensure_token():
+                response = self._send(method, url, **kwargs)
+        
+        response.raise_for_status()
+        return response
+    
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request, backing off and retrying transient failures
+        (429 and 5xx) up to MAX_RETRIES times. POSTs are only retried on
+        429 and 503, which mean the request was not processed.
+        
+        Returns:
+            The last response received
+        """
+        retryable = _retryable_status_codes(method)
+        for attempt in range(MAX_RETRIES):
+            response = self.session.request(method, url, **kwargs)
+            if response.status_code not in retryable:
+                return response
+            time.sleep(_backoff_delay(attempt))
+        
+        return self.session.request(method, url, **kwargs)
+    
     def create_lead(self, lead_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a new lead in Salesforce.
@@ -109,12 +428,11 @@ class SalesforceIntegration:
         Returns:
             Dict containing the created lead's ID and success status
         """
-        if not self.access_token:
-            if not self.authenticate():
-                return {"success": False, "error": "Authentication failed"}
+        if not self._ensure_token():
+            return {"success": False, "error": "Authentication failed"}
         
         try:
-            url = f"{self.instance_url}/services/data/{self.config.api_version}/sobjects/Lead"
+            url = self._lead_url
             
             # Ensure required fields are present
             if 'LastName' not in lead_data or 'Company' not in lead_data:
@@ -123,8 +441,7 @@ class SalesforceIntegration:
                     "error": "LastName and Company are required fields"
                 }
             
-            response = self.session.post(url, json=lead_data)
-            response.raise_for_status()
+            response = self._request("POST", url, json=lead_data)
             
             result = response.json()
             return {
@@ -146,17 +463,22 @@ class SalesforceIntegration:
         Returns:
             Dict containing lead information
         """
-        if not self.access_token:
-            if not self.authenticate():
-                return {"success": False, "error": "Authentication failed"}
+        # Authenticate first: the cache key needs the org's instance URL
+        if not self._ensure_token():
+            return {"success": False, "error": "Authentication failed"}
+        
+        cached = _get_cached_lead(self.instance_url, lead_id)
+        if cached is not None:
+            return {"success": True, "data": cached}
         
         try:
-            url = f"{self.instance_url}/services/data/{self.config.api_version}/sobjects/Lead/{lead_id}"
+            url = self._lead_url + "/" + lead_id
             
-            response = self.session.get(url)
-            response.raise_for_status()
+            response = self._request("GET", url)
+            data = response.json()
+            _cache_lead(self.instance_url, lead_id, data)
             
-            return {"success": True, "data": response.json()}
+            return {"success": True, "data": data}
             
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -172,15 +494,14 @@ class SalesforceIntegration:
         Returns:
             Dict containing success status
         """
-        if not self.access_token:
-            if not self.authenticate():
-                return {"success": False, "error": "Authentication failed"}
+        if not self._ensure_token():
+            return {"success": False, "error": "Authentication failed"}
         
         try:
-            url = f"{self.instance_url}/services/data/{self.config.api_version}/sobjects/Lead/{lead_id}"
+            url = self._lead_url + "/" + lead_id
             
-            response = self.session.patch(url, json=update_data)
-            response.raise_for_status()
+            response = self._request("PATCH", url, json=update_data)
+            _invalidate_leads(self.instance_url, [lead_id])
             
             return {"success": True, "updated_fields": update_data}
             
@@ -198,12 +519,11 @@ class SalesforceIntegration:
         Returns:
             Dict containing the created opportunity's ID and success status
         """
-        if not self.access_token:
-            if not self.authenticate():
-                return {"success": False, "error": "Authentication failed"}
+        if not self._ensure_token():
+            return {"success": False, "error": "Authentication failed"}
         
         try:
-            url = f"{self.instance_url}/services/data/{self.config.api_version}/sobjects/Opportunity"
+            url = self._opportunity_url
             
             # Ensure required fields are present
             required_fields = ['Name', 'StageName', 'CloseDate']
@@ -215,8 +535,7 @@ class SalesforceIntegration:
                     "error": f"Missing required fields: {', '.join(missing_fields)}"
                 }
             
-            response = self.session.post(url, json=opportunity_data)
-            response.raise_for_status()
+            response = self._request("POST", url, json=opportunity_data)
             
             result = response.json()
             return {
@@ -228,6 +547,156 @@ class SalesforceIntegration:
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    def bulk_create_leads(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create many leads with as few requests as possible.
+        
+        Up to BULK_API_THRESHOLD records are sent through the sObject
+        Collections API in batches of COMPOSITE_BATCH_SIZE; larger loads are
+        submitted as an asynchronous Bulk API 2.0 ingest job.
+        
+        Args:
+            records: Lead field dictionaries (LastName and Company required)
+            
+        Returns:
+            Dict containing per-record results, or the ingest job details
+        """
+        if len(records) > BULK_API_THRESHOLD:
+            return self._bulk_ingest("Lead", "insert", records)
+        return self._save_collection("POST", "Lead", records)
+    
+    def bulk_update_leads(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Update many leads with as few requests as possible.
+        
+        Args:
+            records: Lead field dictionaries, each including its Id
+            
+        Returns:
+            Dict containing per-record results, or the ingest job details
+        """
+        lead_ids = [record['Id'] for record in records if 'Id' in record]
+        if len(records) > BULK_API_THRESHOLD:
+            result = self._bulk_ingest("Lead", "update", records)
+            if result.get('success'):
+                # The job applies its updates after we return, so the leads
+                # are invalidated again once get_ingest_job sees it finish
+                self._pending_lead_invalidations[result['job_id']] = lead_ids
+        else:
+            result = self._save_collection("PATCH", "Lead", records)
+        
+        # Invalidate after the write, so a concurrent get_lead cannot cache
+        # the old values again
+        _invalidate_leads(self.instance_url, lead_ids)
+        return result
+    
+    def _save_collection(self, method: str, sobject_type: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create (POST) or update (PATCH) records via the sObject Collections API."""
+        if not self._ensure_token():
+            return {"success": False, "error": "Authentication failed"}
+        
+        try:
+            url = self._composite_url + "/sobjects"
+            attributes = {"type": sobject_type}
+            results = []
+            
+            for chunk in _chunks(records, COMPOSITE_BATCH_SIZE):
+                payload = {
+                    "allOrNone": False,
+                    "records": [{**record, "attributes": attributes} for record in chunk]
+                }
+                response = self._request(method, url, json=payload)
+                results.extend(response.json())
+            
+            failed = sum(1 for result in results if not result.get('success'))
+            return {
+                "success": failed == 0,
+                "processed": len(results),
+                "failed": failed,
+                "results": results
+            }
+            
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+    
+    def _bulk_ingest(self, sobject_type: str, operation: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Submit records as a Bulk API 2.0 ingest job (create job, upload CSV,
+        mark upload complete). Salesforce processes the job asynchronously.
+        """
+        if not self._ensure_token():
+            return {"success": False, "error": "Authentication failed"}
+        
+        try:
+            jobs_url = self._base_url + "/jobs/ingest"
+            
+            response = self._request("POST", jobs_url, json={
+                "object": sobject_type,
+                "operation": operation,
+                "contentType": "CSV",
+                "lineEnding": "LF"
+            })
+            job_id = response.json()['id']
+            
+            # Columns are the union of all record fields, in first-seen order
+            fieldnames = list(dict.fromkeys(field for record in records for field in record))
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=fieldnames, lineterminator="\n")
+            writer.writeheader()
+            writer.writerows(records)
+            
+            self._request(
+                "PUT",
+                f"{jobs_url}/{job_id}/batches",
+                data=buffer.getvalue().encode("utf-8"),
+                headers={"Content-Type": "text/csv"}
+            )
+            response = self._request("PATCH", f"{jobs_url}/{job_id}", json={"state": "UploadComplete"})
+            
+            return {
+                "success": True,
+                "job_id": job_id,
+                "state": response.json().get('state'),
+                "submitted": len(records)
+            }
+            
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+    
+    def get_ingest_job(self, job_id: str) -> Dict[str, Any]:
+        """
+        Get the state of a Bulk API 2.0 ingest job.
+        
+        Once the job has finished, leads updated by it are dropped from the
+        lead cache.
+        
+        Args:
+            job_id: Ingest job ID returned by a bulk operation
+            
+        Returns:
+            Dict containing the job state and record counts
+        """
+        if not self._ensure_token():
+            return {"success": False, "error": "Authentication failed"}
+        
+        try:
+            response = self._request("GET", f"{self._base_url}/jobs/ingest/{job_id}")
+            job = response.json()
+            
+            if job['state'] in INGEST_JOB_FINAL_STATES:
+                _invalidate_leads(self.instance_url, self._pending_lead_invalidations.pop(job_id, []))
+            
+            return {
+                "success": True,
+                "job_id": job_id,
+                "state": job['state'],
+                "processed": job.get('numberRecordsProcessed'),
+                "failed": job.get('numberRecordsFailed')
+            }
+            
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+    
     def query_records(self, soql_query: str) -> Dict[str, Any]:
         """
         Execute a SOQL query.
@@ -238,15 +707,13 @@ class SalesforceIntegration:
         Returns:
             Dict containing query results
         """
-        if not self.access_token:
-            if not self.authenticate():
-                return {"success": False, "error": "Authentication failed"}
+        if not self._ensure_token():
+            return {"success": False, "error": "Authentication failed"}
         
         try:
-            url = f"{self.instance_url}/services/data/{self.config.api_version}/query"
+            url = self._query_url
             
-            response = self.session.get(url, params={'q': soql_query})
-            response.raise_for_status()
+            response = self._request("GET", url, params={'q': soql_query})
             
             result = response.json()
             return {
@@ -268,14 +735,8 @@ class SalesforceIntegration:
         Returns:
             Dict containing recent leads
         """
-        soql_query = f"""
-        SELECT Id, FirstName, LastName, Company, Email, Phone, Status, CreatedDate
-        FROM Lead 
-        WHERE CreatedDate = LAST_N_DAYS:{days}
-        ORDER BY CreatedDate DESC
-        """
-        
-        return self.query_records(soql_query)
+        # int() keeps anything but a number out of the query text
+        return self.query_records(RECENT_LEADS_SOQL.format(days=int(days)))
     
     def get_pipeline_report(self) -> Dict[str, Any]:
         """
@@ -284,59 +745,33 @@ class SalesforceIntegration:
         Returns:
             Dict containing pipeline metrics
         """
-        soql_query = """
-        SELECT StageName, COUNT(Id) OpportunityCount, SUM(Amount) TotalAmount
-        FROM Opportunity 
-        WHERE IsClosed = false
-        GROUP BY StageName
-        """
-        
-        result = self.query_records(soql_query)
+        result = self.query_records(PIPELINE_SOQL)
         
         if result['success']:
             # Process the results into a more readable format
-            pipeline_data = {}
-            total_opportunities = 0
-            total_amount = 0
-            
-            for record in result['records']:
-                stage = record['StageName']
-                count = record['OpportunityCount']
-                amount = record['TotalAmount'] or 0
-                
-                pipeline_data[stage] = {
-                    'count': count,
-                    'amount': amount
-                }
-                
-                total_opportunities += count
-                total_amount += amount
-            
-            return {
-                "success": True,
-                "pipeline": pipeline_data,
-                "summary": {
-                    "total_opportunities": total_opportunities,
-                    "total_amount": total_amount
-                }
-            }
+            return _summarize_pipeline(result['records'])
         
         return result
     
-    def convert_lead_to_opportunity(self, lead_id: str, opportunity_name: str) -> Dict[str, Any]:
+    def convert_lead_to_opportunity(
+        self,
+        lead_id: str,
+        opportunity_name: str,
+        converted_status: str = "Closed - Converted"
+    ) -> Dict[str, Any]:
         """
         Convert a lead to an opportunity.
         
         Args:
             lead_id: Salesforce lead ID
             opportunity_name: Name for the new opportunity
+            converted_status: Lead status value to set once converted
             
         Returns:
             Dict containing conversion results
         """
-        if not self.access_token:
-            if not self.authenticate():
-                return {"success": False, "error": "Authentication failed"}
+        if not self._ensure_token():
+            return {"success": False, "error": "Authentication failed"}
         
         try:
             # First, get the lead information
@@ -345,46 +780,345 @@ class SalesforceIntegration:
                 return lead_result
             
             lead_data = lead_result['data']
+            sobjects_path = f"/services/data/{self.config.api_version}/sobjects"
             
-            # Create account if it doesn't exist
-            account_data = {
-                'Name': lead_data['Company'],
-                'Type': 'Prospect'
+            # Create the account, contact and opportunity and mark the lead as
+            # converted in a single all-or-nothing composite request; later
+            # sub-requests reference the new account's ID via @{account.id}
+            composite_request = {
+                "allOrNone": True,
+                "compositeRequest": [
+                    {
+                        "method": "POST",
+                        "url": f"{sobjects_path}/Account",
+                        "referenceId": "account",
+                        "body": {
+                            'Name': lead_data['Company'],
+                            'Type': 'Prospect'
+                        }
+                    },
+                    {
+                        "method": "POST",
+                        "url": f"{sobjects_path}/Contact",
+                        "referenceId": "contact",
+                        "body": {
+                            'FirstName': lead_data.get('FirstName', ''),
+                            'LastName': lead_data['LastName'],
+                            'Email': lead_data.get('Email', ''),
+                            'Phone': lead_data.get('Phone', ''),
+                            'AccountId': '@{account.id}'
+                        }
+                    },
+                    {
+                        "method": "POST",
+                        "url": f"{sobjects_path}/Opportunity",
+                        "referenceId": "opportunity",
+                        "body": {
+                            'Name': opportunity_name,
+                            'StageName': 'Prospecting',
+                            'CloseDate': datetime.now().strftime('%Y-%m-%d'),
+                            'AccountId': '@{account.id}'
+                        }
+                    },
+                    {
+                        "method": "PATCH",
+                        "url": f"{sobjects_path}/Lead/{lead_id}",
+                        "referenceId": "lead",
+                        "body": {'Status': converted_status}
+                    }
+                ]
             }
             
-            # Create contact
-            contact_data = {
-                'FirstName': lead_data.get('FirstName', ''),
-                'LastName': lead_data['LastName'],
-                'Email': lead_data.get('Email', ''),
-                'Phone': lead_data.get('Phone', '')
+            url = self._composite_url
+            response = self._request("POST", url, json=composite_request)
+            _invalidate_leads(self.instance_url, [lead_id])
+            sub_responses = {
+                sub_response['referenceId']: sub_response
+                for sub_response in response.json()['compositeResponse']
             }
             
-            # Create opportunity
-            opportunity_data = {
-                'Name': opportunity_name,
-                'StageName': 'Prospecting',
-                'CloseDate': datetime.now().strftime('%Y-%m-%d')
+            failed = [
+                sub_response for sub_response in sub_responses.values()
+                if sub_response['httpStatusCode'] >= 300
+            ]
+            if failed:
+                return {
+                    "success": False,
+                    "error": "Lead conversion failed",
+                    "details": [sub_response['body'] for sub_response in failed]
+                }
+            
+            return {
+                "success": True,
+                "message": "Lead converted",
+                "lead_id": lead_id,
+                "opportunity_name": opportunity_name,
+                "account_id": sub_responses['account']['body']['id'],
+                "contact_id": sub_responses['contact']['body']['id'],
+                "opportunity_id": sub_responses['opportunity']['body']['id']
             }
             
-            # In a real implementation, you would:
-            # 1. Create or find the account
-            # 2. Create the contact linked to the account
-            # 3. Create the opportunity linked to the account
-            # 4. Update the lead status to converted
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+
+@lru_cache(maxsize=1)
+def get_salesforce_client() -> SalesforceIntegration:
+    """
+    Get the process-wide Salesforce client.
+    
+    Sharing one client reuses its OAuth session and warm pooled connections
+    instead of opening new ones per task, and keeps the process within
+    Salesforce's per-user session limits.
+    """
+    client = SalesforceIntegration()
+    client._ensure_token()
+    return client
+
+
+class AsyncSalesforceIntegration:
+    """
+    Asynchronous Salesforce CRM client for async CrewAI workflows.
+    
+    Mirrors the core SalesforceIntegration operations on an httpx.AsyncClient,
+    so many calls can be in flight concurrently without blocking the event
+    loop; with HTTP/2 they are multiplexed over a single connection.
+    Use as an async context manager, or call aclose() when done.
+    """
+    
+    def __init__(self, config: Optional[SalesforceConfig] = None):
+        """
+        Initialize async Salesforce integration.
+        
+        Args:
+            config: Salesforce configuration object
+        """
+        self.config = config or _config_from_env()
+        self._client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=30.0,
+            headers={'Accept-Encoding': 'gzip'}
+        )
+        self.access_token = None
+        self.instance_url = None
+        self._base_url = None
+        self._lead_url = None
+        self._opportunity_url = None
+        self._query_url = None
+        self._composite_url = None
+        self._token_expires_at = 0.0
+        self._token_lock = asyncio.Lock()
+    
+    async def __aenter__(self) -> "AsyncSalesforceIntegration":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
+    
+    async def authenticate(self) -> bool:
+        """
+        Authenticate with Salesforce and obtain access token.
+        
+        Returns:
+            bool: True if authentication successful, False otherwise
+        """
+        try:
+            auth_url = f"{self.config.instance_url}/services/oauth2/token"
+            
+            response = await self._client.post(auth_url, data=_auth_request_data(self.config))
+            response.raise_for_status()
+            
+            auth_result = response.json()
+            self.access_token = auth_result['access_token']
+            self.instance_url = auth_result['instance_url']
+            self._build_urls()
+            self._token_expires_at = time.monotonic() + _token_lifetime(auth_result)
+            
+            # Content-Type is set per request (see SalesforceIntegration.authenticate)
+            self._client.headers['Authorization'] = f'Bearer {self.access_token}'
+            
+            return True
+            
+        except Exception:
+            logger.exception("Salesforce authentication failed")
+            return False
+    
+    def _build_urls(self) -> None:
+        """Precompute REST endpoint URLs for the authenticated instance."""
+        self._base_url = f"{self.instance_url}/services/data/{self.config.api_version}"
+        self._lead_url = self._base_url + "/sobjects/Lead"
+        self._opportunity_url = self._base_url + "/sobjects/Opportunity"
+        self._query_url = self._base_url + "/query"
+        self._composite_url = self._base_url + "/composite"
+    
+    def _token_is_fresh(self) -> bool:
+        """Check whether the cached access token is valid beyond the refresh margin."""
+        return (
+            self.access_token is not None
+            and time.monotonic() < self._token_expires_at - TOKEN_REFRESH_MARGIN_SECONDS
+        )
+    
+    async def _ensure_token(self) -> bool:
+        """Make sure a fresh access token is available (see SalesforceIntegration)."""
+        if self._token_is_fresh():
+            return True
+        
+        async with self._token_lock:
+            if self._token_is_fresh():
+                return True
+            return await self.authenticate()
+    
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send an authenticated REST request, retrying transient failures with
+        backoff and re-authenticating once on a 401 (raised if that fails).
+        
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        response = await self._send(method, url, **kwargs)
+        
+        if response.status_code == 401:
+            self.access_token = None
+            if await self._ensure_token():
+                response = await self._send(method, url, **kwargs)
+        
+        response.raise_for_status()
+        return response
+    
+    async def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a request, backing off and retrying 429 and 5xx responses
+        (only 429 and 503 for POSTs).
+        """
+        retryable = _retryable_status_codes(method)
+        for attempt in range(MAX_RETRIES):
+            response = await self._client.request(method, url, **kwargs)
+            if response.status_code not in retryable:
+                return response
+            await asyncio.sleep(_backoff_delay(attempt))
+        
+        return await self._client.request(method, url, **kwargs)
+    
+    async def create_lead(self, lead_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new lead (see SalesforceIntegration.create_lead)."""
+        if not await self._ensure_token():
+            return {"success": False, "error": "Authentication failed"}
+        
+        try:
+            if 'LastName' not in lead_data or 'Company' not in lead_data:
+                return {
+                    "success": False, 
+                    "error": "LastName and Company are required fields"
+                }
+            
+            url = self._lead_url
+            response = await self._request("POST", url, json=lead_data)
             
             return {
                 "success": True,
-                "message": "Lead conversion process initiated",
-                "lead_id": lead_id,
-                "opportunity_name": opportunity_name
+                "id": response.json()['id'],
+                "lead_data": lead_data
             }
             
         except Exception as e:
             return {"success": False, "error": str(e)}
+    
+    async def get_lead(self, lead_id: str) -> Dict[str, Any]:
+        """Retrieve a lead by ID (see SalesforceIntegration.get_lead)."""
+        if not await self._ensure_token():
+            return {"success": False, "error": "Authentication failed"}
+        
+        try:
+            url = self._lead_url + "/" + lead_id
+            response = await self._request("GET", url)
+            
+            return {"success": True, "data": response.json()}
+            
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+    
+    async def update_lead(self, lead_id: str, update_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Update an existing lead (see SalesforceIntegration.update_lead)."""
+        if not await self._ensure_token():
+            return {"success": False, "error": "Authentication failed"}
+        
+        try:
+            url = self._lead_url + "/" + lead_id
+            await self._request("PATCH", url, json=update_data)
+            # Shares the lead cache with the sync client; Redis calls block
+            await asyncio.to_thread(_invalidate_leads, self.instance_url, [lead_id])
+            
+            return {"success": True, "updated_fields": update_data}
+            
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+    
+    async def create_opportunity(self, opportunity_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new opportunity (see SalesforceIntegration.create_opportunity)."""
+        if not await self._ensure_token():
+            return {"success": False, "error": "Authentication failed"}
+        
+        try:
+            required_fields = ['Name', 'StageName', 'CloseDate']
+            missing_fields = [field for field in required_fields if field not in opportunity_data]
+            
+            if missing_fields:
+                return {
+                    "success": False, 
+                    "error": f"Missing required fields: {', '.join(missing_fields)}"
+                }
+            
+            url = self._opportunity_url
+            response = await self._request("POST", url, json=opportunity_data)
+            
+            return {
+                "success": True,
+                "id": response.json()['id'],
+                "opportunity_data": opportunity_data
+            }
+            
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+    
+    async def query_records(self, soql_query: str) -> Dict[str, Any]:
+        """Execute a SOQL query (see SalesforceIntegration.query_records)."""
+        if not await self._ensure_token():
+            return {"success": False, "error": "Authentication failed"}
+        
+        try:
+            url = self._query_url
+            response = await self._request("GET", url, params={'q': soql_query})
+            
+            result = response.json()
+            return {
+                "success": True,
+                "total_size": result['totalSize'],
+                "records": result['records']
+            }
+            
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+    
+    async def get_pipeline_report(self) -> Dict[str, Any]:
+        """Generate a sales pipeline report (see SalesforceIntegration.get_pipeline_report)."""
+        result = await self.query_records(PIPELINE_SOQL)
+        
+        if result['success']:
+            return _summarize_pipeline(result['records'])
+        
+        return result
+
 
 # Example usage and testing
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
     # Initialize Salesforce integration
     sf = SalesforceIntegration()
     
@@ -2,12 +2,32 @@
 Celery application configuration for the AI Agent Platform.
 """
 
+import os
+
 from celery import Celery
+from celery.signals import worker_process_init
 
 from src.shared.config import get_settings
 
 settings = get_settings()
 
+
+class QueueRateLimits:
+    """Task annotation applying per-queue rate limits by task module."""
+    
+    # Annotation dicts only match exact task names, so match prefixes here
+    RATE_LIMITS = {
+        "src.services.knowledge_base.tasks.": "100/s",
+        "src.services.orchestration.tasks.": "10/s",
+    }
+    
+    def annotate(self, task):
+        for prefix, rate_limit in self.RATE_LIMITS.items():
+            if task.name.startswith(prefix):
+                return {"rate_limit": rate_limit}
+        return None
+
+
 # Create Celery app
 celery_app = Celery(
     "ai_agent_platform",
@@ -21,14 +41,24 @@ celery_app = Celery(
 
 # Celery configuration
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # msgpack is compact and fast for float lists and large dicts; json stays
+    # accepted so messages queued before the switch can still be consumed
+    task_serializer="msgpack",
+    accept_content=["msgpack", "json"],
+    result_serializer="msgpack",
+    result_accept_content=["msgpack", "json"],
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
+    # Acknowledge after completion so tasks on a crashed worker are redelivered
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    # Must exceed task_time_limit, or unacked long tasks get redelivered early
+    broker_transport_options={"visibility_timeout": 3600},
+    # Default for long CrewAI runs; knowledge-base workers override it with
+    # --prefetch-multiplier (see docker-compose.yml)
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=1000,
     result_expires=3600,  # 1 hour
@@ -36,6 +66,7 @@ celery_app.conf.update(
         "src.services.knowledge_base.tasks.*": {"queue": "knowledge_base"},
         "src.services.orchestration.tasks.*": {"queue": "orchestration"},
     },
+    task_annotations=[QueueRateLimits()],
     task_default_queue="default",
     task_default_exchange="default",
     task_default_exchange_type="direct",
@@ -50,5 +81,17 @@ celery_app.conf.beat_schedule = {
     },
 }
 
+
+# Reuse one authenticated Salesforce client per worker process
+@worker_process_init.connect
+def prime_salesforce_client(**kwargs):
+    """Authenticate the shared Salesforce client as each worker process starts."""
+    if not os.getenv("SALESFORCE_CLIENT_ID"):
+        return
+    
+    from src.integrations.official.apis.salesforce_integration import get_salesforce_client
+    get_salesforce_client()
+
+
 if __name__ == "__main__":
     celery_app.start() 
\ No newline at end of file
@@ -6,31 +6,80 @@ import uuid
 from datetime import datetime
 from typing import AsyncGenerator
 
-from sqlalchemy import MetaData, create_engine
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    FetchedValue,
+    Identity,
+    MetaData,
+    Text,
+    create_engine,
+    event,
+    make_url,
+    text,
+)
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.pool import NullPool
 from sqlalchemy.sql import func
+from uuid6 import uuid7
 
 from src.shared.config import get_settings
 
 settings = get_settings()
 
+# Pool sizing comes from settings so it can be tuned per deployment;
+# PgBouncer in transaction mode does its own pooling
+if settings.database.null_pool:
+    pool_options = {"poolclass": NullPool}
+else:
+    pool_options = {
+        "pool_size": settings.database.pool_size,
+        "max_overflow": settings.database.max_overflow,
+        "pool_timeout": settings.database.pool_timeout,
+        "pool_recycle": settings.database.pool_recycle,
+        "pool_pre_ping": True,
+    }
+
+# Server-side prepared statements are bound to one server connection, which
+# PgBouncer in transaction mode does not guarantee across transactions
+connect_args = {"prepare_threshold": None} if settings.database.pgbouncer else {}
+
+# Bulk INSERTs are sent as multi-row VALUES statements (with RETURNING for
+# the identity keys), so N rows cost N / page size round trips
+INSERT_BATCH_SIZE = 500
+
 # Create async engine
 async_engine = create_async_engine(
     settings.database.url,
     echo=settings.debug,
-    pool_pre_ping=True,
-    pool_recycle=300,
+    insertmanyvalues_page_size=INSERT_BATCH_SIZE,
+    connect_args=connect_args,
+    **pool_options,
 )
 
-# Create sync engine for Alembic
-sync_engine = create_engine(
-    settings.database.url.replace("+asyncpg", ""),
-    echo=settings.debug,
-    pool_pre_ping=True,
-    pool_recycle=300,
-)
+# Sync engine for Alembic, created on first use so that app processes
+# never hold connections for it
+_sync_engine = None
+
+
+def get_sync_engine():
+    """Get the sync engine used for migrations."""
+    global _sync_engine
+    if _sync_engine is None:
+        # Migrations are one-shot, so there is nothing to gain from pooling
+        _sync_engine = create_engine(
+            make_url(settings.database.url).set(drivername="postgresql+psycopg2"),
+            echo=settings.debug,
+            poolclass=NullPool,
+            # psycopg2: batch INSERTs as multi-row VALUES and UPDATE/DELETE
+            # executemany calls with execute_batch
+            executemany_mode="values_plus_batch",
+            insertmanyvalues_page_size=INSERT_BATCH_SIZE,
+        )
+    return _sync_engine
+
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -39,6 +88,14 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Session factory for large scans: rows are fetched through a server-side
+# cursor in batches instead of materializing the whole result set
+StreamingSessionLocal = async_sessionmaker(
+    async_engine.execution_options(stream_results=True, yield_per=1000),
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 # Naming convention for constraints
 naming_convention = {
     "ix": "ix_%(column_0_label)s",
@@ -56,23 +113,83 @@ class Base(DeclarativeBase):
     
     metadata = metadata
     
+    # Unsized text and timezone-aware timestamps unless a column says otherwise
+    type_annotation_map = {
+        str: Text,
+        datetime: DateTime(timezone=True),
+    }
+    
     # Common fields for all models
-    id: Mapped[uuid.UUID] = mapped_column(
+    # Compact BIGINT identity keys for joins and foreign keys; the UUID is
+    # only for external references. Time-ordered UUIDs keep inserts into its
+    # unique index on the right-hand edge instead of scattering them
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        Identity(always=True),
         primary_key=True,
-        default=uuid.uuid4,
-        index=True,
     )
+    public_id: Mapped[uuid.UUID] = mapped_column(
+        unique=True,
+        default=uuid7,
+    )
+    # Timestamps are filled in by Postgres: created_at by the column default,
+    # updated_at by the set_updated_at trigger (see below)
     created_at: Mapped[datetime] = mapped_column(
-        default=func.now(),
+        server_default=func.now(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
-        default=func.now(),
-        onupdate=func.now(),
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
 
+# Trigger function that stamps updated_at on every UPDATE
+SET_UPDATED_AT_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# Attach the trigger to every table in the schema that has an updated_at
+# column; partitions are skipped since they inherit their parent's trigger
+SET_UPDATED_AT_TRIGGERS = """
+DO $$
+DECLARE
+    tbl text;
+BEGIN
+    FOR tbl IN
+        SELECT c.relname
+        FROM pg_class c
+        JOIN pg_attribute a
+          ON a.attrelid = c.oid AND a.attname = 'updated_at' AND NOT a.attisdropped
+        WHERE c.relnamespace = current_schema()::regnamespace
+          AND c.relkind IN ('r', 'p')
+          AND NOT c.relispartition
+    LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS set_updated_at ON %I', tbl);
+        EXECUTE format(
+            'CREATE TRIGGER set_updated_at BEFORE UPDATE ON %I '
+            'FOR EACH ROW EXECUTE FUNCTION set_updated_at()',
+            tbl
+        );
+    END LOOP;
+END $$
+"""
+
+
+@event.listens_for(metadata, "after_create")
+def create_updated_at_triggers(target, connection, **kw):
+    """Install the updated_at triggers when tables are created outside Alembic."""
+    if connection.dialect.name == "postgresql":
+        connection.execute(text(SET_UPDATED_AT_FUNCTION))
+        connection.execute(text(SET_UPDATED_AT_TRIGGERS))
+
+
 # Dependency to get database session
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency to get database session."""
@@ -83,6 +200,21 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+# Dependency to get a session for streaming scan queries
+async def get_streaming_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get a database session for large scans.
+    
+    Iterate results with `async for row in await session.stream(stmt)` to
+    keep memory bounded by the batch size rather than the row count.
+    """
+    async with StreamingSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
 # Function to create all tables
 async def create_tables():
     """Create all database tables."""
@@ -8,38 +8,81 @@ from datetime import datetime
 from typing import List, Optional
 
 from sqlalchemy import (
+    DDL,
+    BigInteger,
     Boolean,
+    CheckConstraint,
+    Computed,
     ForeignKey,
+    ForeignKeyConstraint,
     Integer,
     String,
     Text,
     UniqueConstraint,
     ARRAY,
     DateTime,
+    Index,
+    event,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from uuid6 import uuid7
 
 from .base import Base
 
 
+def jsonb_gin_index(table_name: str, column: str) -> Index:
+    """GIN index on a JSONB column using jsonb_path_ops, which is smaller and
+    faster than the default opclass but only supports @> containment."""
+    return Index(
+        f"ix_{table_name}_{column}_gin",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "jsonb_path_ops"},
+    )
+
+
+def execution_time_indexes(table_name: str) -> tuple:
+    """Indexes for execution tables partitioned by start_time: a BRIN index on
+    the append-ordered start_time, and a partial index of active executions."""
+    return (
+        Index(f"ix_{table_name}_start_time_brin", "start_time", postgresql_using="brin"),
+        Index(
+            f"ix_{table_name}_active",
+            "status",
+            postgresql_where=text("status IN ('running', 'pending')"),
+        ),
+    )
+
+
+def duration_ms_column() -> Mapped[Optional[int]]:
+    """Execution duration computed by Postgres from start_time and end_time,
+    so no write path has to keep it in sync."""
+    return mapped_column(
+        BigInteger,
+        Computed("(EXTRACT(EPOCH FROM (end_time - start_time)) * 1000)::bigint", persisted=True)
+    )
+
+
+def status_check(*statuses: str) -> CheckConstraint:
+    """CHECK constraint limiting status to known values, which also gives the
+    planner exact selectivity for status filters."""
+    allowed = ", ".join(f"'{status}'" for status in statuses)
+    return CheckConstraint(f"status IN ({allowed})", name="status")
+
+
 # User and Authentication Models
 class User(Base):
     """User model."""
     
     __tablename__ = "users"
     
-    user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        primary_key=True,
-        default=uuid.uuid4,
-        name="user_id"
-    )
-    username: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
-    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
-    password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
-    first_name: Mapped[Optional[str]] = mapped_column(String(255))
-    last_name: Mapped[Optional[str]] = mapped_column(String(255))
+    username: Mapped[str] = mapped_column(unique=True, nullable=False)
+    email: Mapped[str] = mapped_column(unique=True, nullable=False)
+    password_hash: Mapped[str] = mapped_column(nullable=False)
+    first_name: Mapped[Optional[str]] = mapped_column()
+    last_name: Mapped[Optional[str]] = mapped_column()
     
     # Relationships
     roles = relationship("UserRole", back_populates="user")
@@ -55,7 +98,6 @@ class Role(Base):
     
     __tablename__ = "roles"
     
-    role_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     role_name: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
     
     # Relationships
@@ -67,15 +109,20 @@ class UserRole(Base):
     
     __tablename__ = "user_roles"
     
-    user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("users.user_id"),
-        primary_key=True
+    user_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("users.id"),
+        nullable=False
     )
     role_id: Mapped[int] = mapped_column(
-        Integer,
-        ForeignKey("roles.role_id"),
-        primary_key=True
+        BigInteger,
+        ForeignKey("roles.id"),
+        nullable=False
+    )
+    
+    # Ensure unique user-role assignments
+    __table_args__ = (
+        UniqueConstraint("user_id", "role_id", name="uq_user_role", postgresql_nulls_not_distinct=True),
     )
     
     # Relationships
@@ -89,23 +136,23 @@ class LLMModel(Base):
     
     __tablename__ = "llm_models"
     
-    model_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        primary_key=True,
-        default=uuid.uuid4
-    )
-    user_id: Mapped[Optional[uuid.UUID]] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("users.user_id"),
+    user_id: Mapped[Optional[int]] = mapped_column(
+        BigInteger,
+        ForeignKey("users.id"),
         nullable=True  # Can be null for global/admin-managed models
     )
-    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    name: Mapped[str] = mapped_column(nullable=False)
     provider: Mapped[str] = mapped_column(String(100), nullable=False)  # OpenAI, Anthropic, etc.
-    model_identifier: Mapped[str] = mapped_column(String(255), nullable=False)  # gpt-4o, claude-3-opus, etc.
+    model_identifier: Mapped[str] = mapped_column(nullable=False)  # gpt-4o, claude-3-opus, etc.
     api_key_encrypted: Mapped[Optional[str]] = mapped_column(Text)
-    endpoint_url: Mapped[Optional[str]] = mapped_column(String(500))  # For Ollama or custom APIs
+    endpoint_url: Mapped[Optional[str]] = mapped_column()  # For Ollama or custom APIs
     config_params_json: Mapped[dict] = mapped_column(JSONB, default=dict)  # temperature, max_tokens, etc.
     
+    # GIN indexes for @> containment queries on the JSONB columns
+    __table_args__ = (
+        jsonb_gin_index("llm_models", "config_params_json"),
+    )
+    
     # Relationships
     user = relationship("User", back_populates="llm_models")
     agents = relationship("Agent", back_populates="llm_model")
@@ -117,29 +164,26 @@ class KnowledgeBase(Base):
     
     __tablename__ = "knowledge_bases"
     
-    kb_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        primary_key=True,
-        default=uuid.uuid4
-    )
-    user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("users.user_id"),
+    user_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("users.id"),
         nullable=False
     )
-    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    name: Mapped[str] = mapped_column(nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text)
     source_type: Mapped[str] = mapped_column(String(50), nullable=False)  # upload, web_url, direct_text
     status: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
         default="pending"
-    )  # pending, indexing, ready, error
-    vector_db_collection_name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    )
+    vector_db_collection_name: Mapped[str] = mapped_column(unique=True, nullable=False)
+    
+    __table_args__ = (status_check("pending", "indexing", "ready", "error"),)
     
     # Relationships
     user = relationship("User", back_populates="knowledge_bases")
-    documents = relationship("KBDocument", back_populates="knowledge_base")
+    documents = relationship("KBDocument", back_populates="knowledge_base", lazy="selectin")
     agent_associations = relationship("AgentKnowledgeBase", back_populates="knowledge_base")
 
 
@@ -148,27 +192,26 @@ class KBDocument(Base):
     
     __tablename__ = "kb_documents"
     
-    document_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        primary_key=True,
-        default=uuid.uuid4
-    )
-    kb_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("knowledge_bases.kb_id"),
+    kb_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("knowledge_bases.id"),
         nullable=False
     )
-    original_file_name: Mapped[Optional[str]] = mapped_column(String(500))
-    storage_path_or_url: Mapped[Optional[str]] = mapped_column(String(1000))
-    content_hash: Mapped[Optional[str]] = mapped_column(String(255))
+    original_file_name: Mapped[Optional[str]] = mapped_column()
+    storage_path_or_url: Mapped[Optional[str]] = mapped_column()
+    content_hash: Mapped[Optional[str]] = mapped_column()
     status: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
         default="pending_processing"
-    )  # pending_processing, processing, processed, error_processing
+    )
     num_chunks: Mapped[Optional[int]] = mapped_column(Integer)
     processed_at: Mapped[Optional[datetime]] = mapped_column()
     
+    __table_args__ = (
+        status_check("pending_processing", "processing", "processed", "error_processing"),
+    )
+    
     # Relationships
     knowledge_base = relationship("KnowledgeBase", back_populates="documents")
 
@@ -179,23 +222,18 @@ class Agent(Base):
     
     __tablename__ = "agents"
     
-    agent_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        primary_key=True,
-        default=uuid.uuid4
-    )
-    user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("users.user_id"),
+    user_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("users.id"),
         nullable=False
     )
-    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    name: Mapped[str] = mapped_column(nullable=False)
     role: Mapped[str] = mapped_column(Text, nullable=False)
     goal: Mapped[str] = mapped_column(Text, nullable=False)
     backstory: Mapped[str] = mapped_column(Text, nullable=False)
-    llm_model_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("llm_models.model_id"),
+    llm_model_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("llm_models.id"),
         nullable=False
     )
     tools_config: Mapped[list] = mapped_column(JSONB, default=list)  # Array of tool definitions
@@ -204,9 +242,14 @@ class Agent(Base):
     max_iter: Mapped[int] = mapped_column(Integer, default=15)
     max_rpm: Mapped[Optional[int]] = mapped_column(Integer)
     
+    # GIN indexes for @> containment queries on the JSONB columns
+    __table_args__ = (
+        jsonb_gin_index("agents", "tools_config"),
+    )
+    
     # Relationships
     user = relationship("User", back_populates="agents")
-    llm_model = relationship("LLMModel", back_populates="agents")
+    llm_model = relationship("LLMModel", back_populates="agents", lazy="joined")
     knowledge_base_associations = relationship("AgentKnowledgeBase", back_populates="agent")
     workflow_agents = relationship("WorkflowAgent", back_populates="agent")
     task_executions = relationship("TaskExecution", back_populates="assigned_agent")
@@ -217,24 +260,21 @@ class AgentKnowledgeBase(Base):
     
     __tablename__ = "agent_knowledge_bases"
     
-    agent_kb_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        primary_key=True,
-        default=uuid.uuid4
-    )
-    agent_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("agents.agent_id"),
+    agent_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("agents.id"),
         nullable=False
     )
-    kb_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("knowledge_bases.kb_id"),
+    kb_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("knowledge_bases.id"),
         nullable=False
     )
     
     # Ensure unique agent-KB associations
-    __table_args__ = (UniqueConstraint("agent_id", "kb_id", name="uq_agent_kb"),)
+    __table_args__ = (
+        UniqueConstraint("agent_id", "kb_id", name="uq_agent_kb", postgresql_nulls_not_distinct=True),
+    )
     
     # Relationships
     agent = relationship("Agent", back_populates="knowledge_base_associations")
@@ -247,17 +287,12 @@ class Workflow(Base):
     
     __tablename__ = "workflows"
     
-    workflow_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        primary_key=True,
-        default=uuid.uuid4
-    )
-    user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("users.user_id"),
+    user_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("users.id"),
         nullable=False
     )
-    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    name: Mapped[str] = mapped_column(nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text)
     process_type: Mapped[str] = mapped_column(
         String(50),
@@ -267,8 +302,8 @@ class Workflow(Base):
     
     # Relationships
     user = relationship("User", back_populates="workflows")
-    workflow_agents = relationship("WorkflowAgent", back_populates="workflow")
-    tasks = relationship("Task", back_populates="workflow")
+    workflow_agents = relationship("WorkflowAgent", back_populates="workflow", lazy="selectin")
+    tasks = relationship("Task", back_populates="workflow", lazy="selectin")
     executions = relationship("WorkflowExecution", back_populates="workflow")
 
 
@@ -277,27 +312,22 @@ class WorkflowAgent(Base):
     
     __tablename__ = "workflow_agents"
     
-    workflow_agent_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        primary_key=True,
-        default=uuid.uuid4
-    )
-    workflow_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("workflows.workflow_id"),
+    workflow_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("workflows.id"),
         nullable=False
     )
-    agent_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("agents.agent_id"),
+    agent_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("agents.id"),
         nullable=False
     )
-    alias_in_workflow: Mapped[Optional[str]] = mapped_column(String(255))  # User-friendly naming
+    alias_in_workflow: Mapped[Optional[str]] = mapped_column()  # User-friendly naming
     sequence_order: Mapped[Optional[int]] = mapped_column(Integer)  # For UI ordering
     
     # Relationships
     workflow = relationship("Workflow", back_populates="workflow_agents")
-    agent = relationship("Agent", back_populates="workflow_agents")
+    agent = relationship("Agent", back_populates="workflow_agents", lazy="joined")
     assigned_tasks = relationship("Task", back_populates="assigned_workflow_agent")
 
 
@@ -306,33 +336,35 @@ class Task(Base):
     
     __tablename__ = "tasks"
     
-    task_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        primary_key=True,
-        default=uuid.uuid4
-    )
-    workflow_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("workflows.workflow_id"),
+    workflow_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("workflows.id"),
         nullable=False
     )
-    assigned_workflow_agent_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("workflow_agents.workflow_agent_id"),
+    assigned_workflow_agent_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("workflow_agents.id"),
         nullable=False
     )
     description: Mapped[str] = mapped_column(Text, nullable=False)
     expected_output: Mapped[str] = mapped_column(Text, nullable=False)
-    context_task_ids: Mapped[list] = mapped_column(
-        JSONB,
+    context_task_ids: Mapped[List[int]] = mapped_column(
+        ARRAY(BigInteger),
         default=list
-    )  # Array of task_ids this task depends on
+    )  # Array of task ids this task depends on
     human_input_required: Mapped[bool] = mapped_column(Boolean, default=False)
     config_json: Mapped[dict] = mapped_column(JSONB, default=dict)  # Task-specific configurations
     
+    __table_args__ = (
+        # Serves "tasks depending on X": context_task_ids @> ARRAY[X]
+        Index("ix_tasks_context_task_ids_gin", "context_task_ids", postgresql_using="gin"),
+        # GIN index for @> containment queries on the JSONB column
+        jsonb_gin_index("tasks", "config_json"),
+    )
+    
     # Relationships
     workflow = relationship("Workflow", back_populates="tasks")
-    assigned_workflow_agent = relationship("WorkflowAgent", back_populates="assigned_tasks")
+    assigned_workflow_agent = relationship("WorkflowAgent", back_populates="assigned_tasks", lazy="joined")
     executions = relationship("TaskExecution", back_populates="task")
 
 
@@ -342,37 +374,69 @@ class WorkflowExecution(Base):
     
     __tablename__ = "workflow_executions"
     
-    execution_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        primary_key=True,
-        default=uuid.uuid4
-    )
-    workflow_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("workflows.workflow_id"),
+    workflow_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("workflows.id"),
         nullable=False
     )
-    user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("users.user_id"),
+    user_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("users.id"),
         nullable=False
     )
-    start_time: Mapped[datetime] = mapped_column(nullable=False)
+    # Unique constraints on a partitioned table must include the partition key
+    public_id: Mapped[uuid.UUID] = mapped_column(default=uuid7)
+    # Ordered after id so the primary key is (id, start_time)
+    start_time: Mapped[datetime] = mapped_column(primary_key=True, sort_order=1)
     end_time: Mapped[Optional[datetime]] = mapped_column()
-    duration_ms: Mapped[Optional[int]] = mapped_column(Integer)
+    duration_ms: Mapped[Optional[int]] = duration_ms_column()
     status: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
         default="pending"
-    )  # pending, running, completed, failed, cancelled
+    )
     inputs_json: Mapped[dict] = mapped_column(JSONB, default=dict)  # Initial inputs
     final_output_json: Mapped[Optional[dict]] = mapped_column(JSONB)  # Final result
     usage_metrics_json: Mapped[Optional[dict]] = mapped_column(JSONB)  # Token counts, etc.
+    # Extracted by Postgres so token usage can be indexed and filtered directly
+    total_tokens: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        Computed("(usage_metrics_json->>'total_tokens')::int", persisted=True)
+    )
+    
+    # Partitioned by start_time, which must therefore be part of every key
+    __table_args__ = (
+        UniqueConstraint("public_id", "start_time", name="uq_workflow_executions_public_id"),
+        status_check("pending", "running", "completed", "failed", "cancelled"),
+        # GIN indexes for @> containment queries on the JSONB columns
+        jsonb_gin_index("workflow_executions", "inputs_json"),
+        jsonb_gin_index("workflow_executions", "final_output_json"),
+        jsonb_gin_index("workflow_executions", "usage_metrics_json"),
+        *execution_time_indexes("workflow_executions"),
+        # Dashboard filters: equality columns first, then the time range,
+        # covering the listed columns to avoid heap fetches
+        Index(
+            "ix_workflow_executions_user_status_time",
+            "user_id",
+            "status",
+            text("start_time DESC"),
+            postgresql_include=["workflow_id", "duration_ms"],
+        ),
+        Index(
+            "ix_workflow_executions_active_by_user",
+            "user_id",
+            "start_time",
+            postgresql_where=text("status IN ('running', 'pending')"),
+        ),
+        Index("ix_workflow_executions_total_tokens", "total_tokens"),
+        Index("ix_workflow_executions_duration_ms", "duration_ms"),
+        {"postgresql_partition_by": "RANGE (start_time)"},
+    )
     
     # Relationships
     workflow = relationship("Workflow", back_populates="executions")
     user = relationship("User", back_populates="workflow_executions")
-    task_executions = relationship("TaskExecution", back_populates="execution")
+    task_executions = relationship("TaskExecution", back_populates="execution", lazy="selectin")
 
 
 class TaskExecution(Base):
@@ -380,40 +444,68 @@ class TaskExecution(Base):
     
     __tablename__ = "task_executions"
     
-    task_execution_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        primary_key=True,
-        default=uuid.uuid4
-    )
-    execution_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("workflow_executions.execution_id"),
-        nullable=False
-    )
-    task_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("tasks.task_id"),
+    execution_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Foreign keys into the partitioned workflow_executions table must
+    # reference its full primary key
+    execution_start_time: Mapped[datetime] = mapped_column(nullable=False)
+    task_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("tasks.id"),
         nullable=False
     )  # Original task definition
-    assigned_agent_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("agents.agent_id"),
+    assigned_agent_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("agents.id"),
         nullable=False
     )  # Actual agent that ran
-    start_time: Mapped[datetime] = mapped_column(nullable=False)
+    public_id: Mapped[uuid.UUID] = mapped_column(default=uuid7)
+    # Ordered after id so the primary key is (id, start_time)
+    start_time: Mapped[datetime] = mapped_column(primary_key=True, sort_order=1)
     end_time: Mapped[Optional[datetime]] = mapped_column()
-    duration_ms: Mapped[Optional[int]] = mapped_column(Integer)
+    duration_ms: Mapped[Optional[int]] = duration_ms_column()
     status: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
         default="pending"
-    )  # pending, running, completed, failed
+    )
     inputs_data: Mapped[Optional[dict]] = mapped_column(JSONB)  # Input to the task
     output_data: Mapped[Optional[str]] = mapped_column(Text)  # Output of the task agent
     logs_text: Mapped[Optional[str]] = mapped_column(Text)  # Detailed logs
     error_message: Mapped[Optional[str]] = mapped_column(Text)
     
+    # Partitioned by start_time, which must therefore be part of every key
+    __table_args__ = (
+        UniqueConstraint("public_id", "start_time", name="uq_task_executions_public_id"),
+        status_check("pending", "running", "completed", "failed"),
+        ForeignKeyConstraint(
+            ["execution_id", "execution_start_time"],
+            ["workflow_executions.id", "workflow_executions.start_time"],
+        ),
+        # GIN indexes for @> containment queries on the JSONB columns
+        jsonb_gin_index("task_executions", "inputs_data"),
+        *execution_time_indexes("task_executions"),
+        Index(
+            "ix_task_executions_execution_status_time",
+            "execution_id",
+            "status",
+            text("start_time DESC"),
+            postgresql_include=["assigned_agent_id", "duration_ms"],
+        ),
+        Index("ix_task_executions_duration_ms", "duration_ms"),
+        {"postgresql_partition_by": "RANGE (start_time)"},
+    )
+    
     # Relationships
     execution = relationship("WorkflowExecution", back_populates="task_executions")
     task = relationship("Task", back_populates="executions")
-    assigned_agent = relationship("Agent", back_populates="task_executions") 
\ No newline at end of file
+    assigned_agent = relationship("Agent", back_populates="task_executions") 
+
+
+# Rows outside the ranged partitions created by migrations land here
+for _table in (WorkflowExecution.__table__, TaskExecution.__table__):
+    event.listen(
+        _table,
+        "after_create",
+        DDL("CREATE TABLE IF NOT EXISTS %(table)s_default PARTITION OF %(table)s DEFAULT")
+        .execute_if(dialect="postgresql"),
+    )
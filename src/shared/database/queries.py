@@ -0,0 +1,49 @@
+"""
+Query builders for the hot list views of the AI Agent Platform.
+"""
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import raiseload, selectinload
+
+from src.shared.config import get_settings
+
+from .models import TaskExecution, Workflow, WorkflowAgent, WorkflowExecution
+
+settings = get_settings()
+
+# Outside production, any relationship a list query does not load explicitly
+# raises on access instead of silently issuing one query per row
+STRICT_LOADING = settings.environment != "production"
+
+
+def _strict_loading() -> list:
+    """Loader options that forbid lazy loads when strict loading is on."""
+    return [raiseload("*")] if STRICT_LOADING else []
+
+
+def workflow_list_query(user_id: int) -> Select:
+    """Select a user's workflows with their tasks and agents."""
+    return (
+        select(Workflow)
+        .where(Workflow.user_id == user_id)
+        .order_by(Workflow.id)
+        .options(
+            selectinload(Workflow.tasks),
+            selectinload(Workflow.workflow_agents).joinedload(WorkflowAgent.agent),
+            *_strict_loading(),
+        )
+    )
+
+
+def execution_list_query(user_id: int, limit: int = 50) -> Select:
+    """Select a user's most recent workflow executions with their task runs."""
+    return (
+        select(WorkflowExecution)
+        .where(WorkflowExecution.user_id == user_id)
+        .order_by(WorkflowExecution.start_time.desc())
+        .limit(limit)
+        .options(
+            selectinload(WorkflowExecution.task_executions).joinedload(TaskExecution.assigned_agent),
+            *_strict_loading(),
+        )
+    )
@@ -4,32 +4,51 @@ Structured logging configuration for the AI Agent Platform.
 
 import logging
 import sys
-from typing import Any, Dict
 
+import orjson
 import structlog
 
 from src.shared.config import get_settings
 
 settings = get_settings()
 
+# Resolved once at import; reading pydantic settings per call is slow
+_LOG_FORMAT = settings.logging.format
+_LEVEL = getattr(logging, settings.logging.level.upper())
+
+
+def _orjson_dumps(obj: object, **kwargs) -> str:
+    """Serialize a log event with orjson; stdlib logging expects str."""
+    return orjson.dumps(obj, **kwargs).decode()
+
+
+_PROCESSORS = (
+    # Context bound with the helpers below is merged into every event
+    structlog.contextvars.merge_contextvars,
+    structlog.stdlib.filter_by_level,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.processors.UnicodeDecoder(),
+    structlog.processors.JSONRenderer(serializer=_orjson_dumps) if _LOG_FORMAT == "json"
+    else structlog.dev.ConsoleRenderer(),
+)
+
+_configured = False
+
 
 def configure_logging() -> None:
-    """Configure structured logging for the application."""
+    """Configure structured logging for the application (once per process)."""
+    global _configured
+    if _configured:
+        return
     
     # Configure structlog
     structlog.configure(
-        processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer() if settings.logging.format == "json"
-            else structlog.dev.ConsoleRenderer(),
-        ],
+        processors=list(_PROCESSORS),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         wrapper_class=structlog.stdlib.BoundLogger,
@@ -40,8 +59,9 @@ def configure_logging() -> None:
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, settings.logging.level.upper()),
+        level=_LEVEL,
     )
+    _configured = True
 
 
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
@@ -49,19 +69,24 @@ def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     return structlog.get_logger(name)
 
 
-def add_correlation_id(correlation_id: str) -> Dict[str, Any]:
-    """Add correlation ID to log context."""
-    return {"correlation_id": correlation_id}
+def add_correlation_id(correlation_id: str) -> None:
+    """Add correlation ID to the log context of the current request or task."""
+    structlog.contextvars.bind_contextvars(correlation_id=correlation_id)
 
 
-def add_user_context(user_id: str, username: str = None) -> Dict[str, Any]:
-    """Add user context to log context."""
-    context = {"user_id": user_id}
+def add_user_context(user_id: str, username: str = None) -> None:
+    """Add user context to the log context of the current request or task."""
     if username:
-        context["username"] = username
-    return context
+        structlog.contextvars.bind_contextvars(user_id=user_id, username=username)
+    else:
+        structlog.contextvars.bind_contextvars(user_id=user_id)
+
+
+def add_service_context(service_name: str) -> None:
+    """Add service context to the log context of the current request or task."""
+    structlog.contextvars.bind_contextvars(service=service_name)
 
 
-def add_service_context(service_name: str) -> Dict[str, Any]:
-    """Add service context to log context."""
-    return {"service": service_name} 
\ No newline at end of file
+def clear_log_context() -> None:
+    """Clear context bound by the helpers above; call when the request or task ends."""
+    structlog.contextvars.clear_contextvars()
@@ -1,8 +1,36 @@
+import copy
+from functools import lru_cache
+from pathlib import Path
+
+import yaml
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai_tools import SerperDevTool, FileReadTool
 from typing import List
 
+# libyaml's C loader when available, which parses several times faster
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Shared by every agent so searches reuse one client and its API key setup
+_SERPER = SerperDevTool()
+_FILE = FileReadTool()
+
+
+@lru_cache(maxsize=None)
+def _parse_yaml(config_path: Path) -> dict:
+    with open(config_path, "rb") as file:
+        content = yaml.load(file, Loader=_YAML_LOADER)
+    return content if isinstance(content, dict) else {}
+
+
+def _load_yaml(config_path: Path) -> dict:
+    """Load a config file, parsing each file only once per process.
+
+    Returns a deep copy because CrewAI writes the resolved agents and tools
+    back into the config dicts.
+    """
+    return copy.deepcopy(_parse_yaml(config_path))
+
 @CrewBase
 class BlogPostCrew():
     """Blog Post Generation Crew
@@ -16,7 +44,7 @@ class BlogPostCrew():
         return Agent(
             config=self.agents_config['research_agent'],
             verbose=True,
-            tools=[SerperDevTool(), FileReadTool()],
+            tools=[_SERPER, _FILE],
             max_iter=3,
             memory=True
         )
@@ -26,7 +54,7 @@ class BlogPostCrew():
         return Agent(
             config=self.agents_config['seo_specialist'],
             verbose=True,
-            tools=[SerperDevTool()],
+            tools=[_SERPER],
             max_iter=2,
             memory=True
         )
@@ -43,20 +71,24 @@ class BlogPostCrew():
     def research_task(self) -> Task:
         return Task(
             config=self.tasks_config['research_task'],
-            output_file='research_findings.md'
+            output_file='research_findings.md',
+            async_execution=True
         )
 
     @task
     def seo_optimization_task(self) -> Task:
         return Task(
             config=self.tasks_config['seo_optimization_task'],
-            output_file='seo_strategy.md'
+            output_file='seo_strategy.md',
+            async_execution=True
         )
 
     @task
     def content_writing_task(self) -> Task:
         return Task(
             config=self.tasks_config['content_writing_task'],
+            # Research and SEO run concurrently; the writer waits on both
+            context=[self.research_task(), self.seo_optimization_task()],
             output_file='blog_post.md'
         )
 
@@ -74,4 +106,9 @@ class BlogPostCrew():
                 "provider": "openai",
                 "config": {"model": "text-embedding-3-small"}
             }
-        ) 
\ No newline at end of file
+        )
+
+
+# CrewBase injects its own load_yaml over class attributes, so the cached
+# loader is installed after decoration
+BlogPostCrew.load_yaml = staticmethod(_load_yaml)
@@ -8,9 +8,37 @@ This workflow creates SEO-optimized blog posts using a multi-agent approach:
 3. Content Writer: Creates engaging, well-structured content
 """
 
-from datetime import datetime
+import threading
+from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+
+from src.shared.utils.logging import get_logger
+
 from .crew import BlogPostCrew
 
+logger = get_logger(__name__)
+
+# A Crew keeps per-run state on its tasks, so kickoffs on the shared crew
+# are serialized
+_crew_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_crew():
+    """Build the blog post crew once and reuse it across runs."""
+    return BlogPostCrew().crew()
+
+
+_DEFAULT_INPUTS = MappingProxyType({
+    'topic': 'Latest AI Development Trends',
+    'target_audience': 'Tech professionals and developers',
+    'keywords': ['AI development', 'machine learning', 'artificial intelligence'],
+    'word_count': 1500,
+    'tone': 'professional yet accessible',
+})
+
+
 def run(inputs=None):
     """
     Run the blog post generation workflow.
@@ -26,26 +54,24 @@ def run(inputs=None):
     Returns:
         CrewOutput: The generated blog post and metadata
     """
-    default_inputs = {
-        'topic': 'Latest AI Development Trends',
-        'target_audience': 'Tech professionals and developers',
-        'keywords': ['AI development', 'machine learning', 'artificial intelligence'],
-        'word_count': 1500,
-        'tone': 'professional yet accessible',
-        'current_year': str(datetime.now().year)
-    }
+    default_inputs = dict(_DEFAULT_INPUTS)
+    default_inputs['current_year'] = str(date.today().year)
     
     # Merge default inputs with provided inputs
     if inputs:
         default_inputs.update(inputs)
     
-    print(f"🚀 Starting blog post generation for: {default_inputs['topic']}")
-    print(f"📊 Target audience: {default_inputs['target_audience']}")
-    print(f"🎯 Keywords: {', '.join(default_inputs['keywords'])}")
+    logger.info(
+        "blog_post_started",
+        topic=default_inputs['topic'],
+        audience=default_inputs['target_audience'],
+        keywords=default_inputs['keywords'],
+    )
     
-    result = BlogPostCrew().crew().kickoff(inputs=default_inputs)
+    with _crew_lock:
+        result = _get_crew().kickoff(inputs=default_inputs)
     
-    print("✅ Blog post generation completed!")
+    logger.info("blog_post_completed", topic=default_inputs['topic'])
     return result
 
 def train(n_iterations=3, filename='blog_post_training.pkl'):
@@ -62,17 +88,17 @@ def train(n_iterations=3, filename='blog_post_training.pkl'):
         'keywords': ['AI healthcare', 'medical AI', 'healthcare technology'],
         'word_count': 1200,
         'tone': 'professional',
-        'current_year': str(datetime.now().year)
+        'current_year': str(date.today().year)
     }
     
     try:
-        print(f"🎓 Training blog post workflow for {n_iterations} iterations...")
+        logger.info("blog_post_training_started", n_iterations=n_iterations)
         BlogPostCrew().crew().train(
             n_iterations=n_iterations,
             filename=filename,
             inputs=inputs
         )
-        print("✅ Training completed successfully!")
+        logger.info("blog_post_training_completed", filename=filename)
     except Exception as e:
         raise Exception(f"Training failed: {e}")
 
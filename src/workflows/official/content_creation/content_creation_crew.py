@@ -7,16 +7,69 @@ This crew includes a researcher, content strategist, and content writer working
 from crewai import Agent, Crew, Process, Task
 from crewai_tools import SerperDevTool, FileReadTool
 from datetime import datetime
+from functools import cached_property, lru_cache
+import asyncio
+import hashlib
 import os
+import threading
+import time
+
+import numpy as np
+import orjson
+from pydantic import BaseModel, ConfigDict
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+# Crews kicked off at once by run_content_crews_parallel; keeps the burst of
+# LLM calls within provider rate limits
+MAX_PARALLEL_CREWS = 3
+
+# Appended to task descriptions when the research output is passed in as the
+# "research" input instead of as task context
+RESEARCH_INPUT = """
+            Market research findings:
+            {research}
+            """
+
+class ResearchOutput(BaseModel):
+    """Market research produced once and shared by every downstream crew"""
+    model_config = ConfigDict(frozen=True)
+    
+    topic: str
+    target_audience: str
+    business_type: str
+    findings: str
+    
+    def as_inputs(self):
+        """Kickoff inputs for crews whose tasks take the research from inputs"""
+        return {"research": self.findings}
+
+@lru_cache(maxsize=1)
+def _search_tool():
+    """Search tool shared by every crew in the process"""
+    return SerperDevTool()
+
+@lru_cache(maxsize=1)
+def _file_tool():
+    """File read tool shared by every crew in the process"""
+    return FileReadTool()
 
 class ContentCreationCrew:
-    """Content Creation crew for marketing material generation"""
+    """Content Creation crew for marketing material generation
+    
+    Agents are created once per instance and shared by its tasks and crews.
+    """
     
     def __init__(self):
         # Initialize tools
-        self.search_tool = SerperDevTool()
-        self.file_tool = FileReadTool()
+        self.search_tool = _search_tool()
+        self.file_tool = _file_tool()
         
+    @cached_property
     def market_researcher(self):
         """Agent specialized in market research and trend analysis"""
         return Agent(
@@ -31,6 +84,7 @@ class ContentCreationCrew:
             allow_delegation=False
         )
     
+    @cached_property
     def content_strategist(self):
         """Agent specialized in content strategy and planning"""
         return Agent(
@@ -44,6 +98,7 @@ class ContentCreationCrew:
             allow_delegation=False
         )
     
+    @cached_property
     def content_writer(self):
         """Agent specialized in writing engaging content"""
         return Agent(
@@ -59,13 +114,15 @@ class ContentCreationCrew:
     
     def research_market_task(self, topic, target_audience, business_type):
         """Task for conducting market research"""
+        # Per-run values go last so the static instructions form a stable
+        # prompt prefix that provider prompt caching can reuse across runs
         return Task(
             description=f"""
-            Conduct comprehensive market research for {business_type} targeting {target_audience} 
-            around the topic: {topic}
+            Conduct comprehensive market research for the business type, target audience
+            and topic given below.
             
             Your research should include:
-            1. Current market trends related to {topic}
+            1. Current market trends related to the topic
             2. Competitor analysis (identify 3-5 key competitors)
             3. Target audience pain points and interests
             4. Popular content formats and channels
@@ -73,6 +130,10 @@ class ContentCreationCrew:
             6. Industry challenges and opportunities
             
             Focus on actionable insights that can inform content strategy.
+            
+            Business type: {business_type}
+            Target audience: {target_audience}
+            Topic: {topic}
             """,
             expected_output="""
             A detailed market research report with:
@@ -83,10 +144,10 @@ class ContentCreationCrew:
             - Top 10 relevant keywords/topics
             - Strategic opportunities identified
             """,
-            agent=self.market_researcher()
+            agent=self.market_researcher
         )
     
-    def develop_strategy_task(self):
+    def develop_strategy_task(self, research_from_inputs=False):
         """Task for developing content strategy"""
         return Task(
             description="""
@@ -101,7 +162,7 @@ class ContentCreationCrew:
             7. Content repurposing opportunities
             
             Ensure the strategy is practical and actionable for implementation.
-            """,
+            """ + (RESEARCH_INPUT if research_from_inputs else ""),
             expected_output="""
             A strategic content plan document containing:
             - 3-5 content pillars with descriptions
@@ -112,18 +173,30 @@ class ContentCreationCrew:
             - Success metrics and measurement plan
             - Implementation timeline and priorities
             """,
-            agent=self.content_strategist()
+            agent=self.content_strategist
         )
     
-    def create_content_task(self, content_type="blog post"):
+    def create_content_task(self, content_type="blog post", research_from_inputs=False):
         """Task for creating actual content"""
+        # With research_from_inputs the task only receives {research}, with no
+        # strategy task before it to define a brand voice
+        if research_from_inputs:
+            basis = "the market research findings below"
+            voice = "Use a voice and messaging suited to the target audience"
+        else:
+            basis = "the research insights and content strategy"
+            voice = "Follow the established brand voice and messaging"
+        
+        # Per-run values go last so the static instructions form a stable
+        # prompt prefix that provider prompt caching can reuse across runs
         return Task(
             description=f"""
-            Create a high-quality {content_type} based on the research insights and content strategy.
+            Create a high-quality piece of content of the type given below, based on
+            {basis}.
             
             The content should:
             1. Address the target audience's main pain points
-            2. Follow the established brand voice and messaging
+            2. {voice}
             3. Include relevant keywords naturally
             4. Have a compelling headline and introduction
             5. Provide actionable value to readers
@@ -131,9 +204,11 @@ class ContentCreationCrew:
             7. Be optimized for the chosen distribution channel
             
             Make it engaging, informative, and conversion-focused.
-            """,
+            
+            Content type: {content_type}
+            """ + (RESEARCH_INPUT if research_from_inputs else ""),
             expected_output=f"""
-            A complete, ready-to-publish {content_type} including:
+            A complete, ready-to-publish piece of content including:
             - Compelling headline and subheadings
             - Well-structured content with clear sections
             - Natural keyword integration
@@ -141,8 +216,10 @@ class ContentCreationCrew:
             - Clear call-to-action
             - Meta description and SEO recommendations
             - Social media promotion suggestions
+            
+            Content type: {content_type}
             """,
-            agent=self.content_writer(),
+            agent=self.content_writer,
             output_file=f'content_output_{content_type.replace(" ", "_")}.md'
         )
     
@@ -161,14 +238,187 @@ class ContentCreationCrew:
         # Create and return crew
         return Crew(
             agents=[
-                self.market_researcher(),
-                self.content_strategist(),
-                self.content_writer()
+                self.market_researcher,
+                self.content_strategist,
+                self.content_writer
             ],
             tasks=[research_task, strategy_task, content_task],
             process=Process.sequential,
             verbose=True
         )
+    
+    def research_crew(self, topic, target_audience, business_type):
+        """Create a crew that only runs the market research task"""
+        return Crew(
+            agents=[self.market_researcher],
+            tasks=[self.research_market_task(topic, target_audience, business_type)],
+            verbose=True
+        )
+    
+    def run_research(self, topic, target_audience, business_type):
+        """Run the research task once; the result can feed any number of crews"""
+        result = self.research_crew(topic, target_audience, business_type).kickoff()
+        return ResearchOutput(topic=topic, target_audience=target_audience,
+                              business_type=business_type, findings=result.raw)
+    
+    async def run_research_async(self, topic, target_audience, business_type):
+        """Async variant of run_research"""
+        result = await self.research_crew(topic, target_audience, business_type).kickoff_async()
+        return ResearchOutput(topic=topic, target_audience=target_audience,
+                              business_type=business_type, findings=result.raw)
+    
+    def strategy_crew(self):
+        """Create a crew that develops the strategy from the "research" input"""
+        return Crew(
+            agents=[self.content_strategist],
+            tasks=[self.develop_strategy_task(research_from_inputs=True)],
+            verbose=True
+        )
+    
+    def content_crew(self, content_type="blog post"):
+        """Create a crew that writes one content variant from the "research" input"""
+        return Crew(
+            agents=[self.content_writer],
+            tasks=[self.create_content_task(content_type, research_from_inputs=True)],
+            verbose=True
+        )
+
+class CachedContentCreationCrew:
+    """
+    ContentCreationCrew behind a result cache for repeat requests.
+    
+    Identical inputs are served from an exact-match cache keyed by a BLAKE2b hash
+    of the inputs. When sentence-transformers is installed, near-duplicate
+    inputs are also served if the cosine similarity of their embeddings to a
+    cached request reaches the threshold. Entries expire after ttl_seconds.
+    """
+    
+    def __init__(self, ttl_seconds=3600, similarity_threshold=0.92,
+                 embedding_model="sentence-transformers/all-MiniLM-L6-v2"):
+        self.content_crew = ContentCreationCrew()
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self._model = SentenceTransformer(embedding_model) if SENTENCE_TRANSFORMERS_AVAILABLE else None
+        self._results = {}  # key -> (expires_at, result)
+        self._keys = []  # cache keys, row-aligned with _embeddings
+        self._embeddings = None  # (n, dim) array of normalized embeddings
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def cache_key(inputs):
+        """Hash of the inputs, independent of key order"""
+        return hashlib.blake2b(orjson.dumps(inputs, option=orjson.OPT_SORT_KEYS), digest_size=8).hexdigest()
+    
+    def _embed(self, inputs):
+        text = " | ".join(str(inputs[name]) for name in sorted(inputs))
+        return self._model.encode(text, normalize_embeddings=True)
+    
+    def _evict_expired(self, now):
+        expired = {key for key, (expires_at, _) in self._results.items() if expires_at <= now}
+        if not expired:
+            return
+        for key in expired:
+            del self._results[key]
+        if self._embeddings is not None:
+            keep = [i for i, key in enumerate(self._keys) if key not in expired]
+            self._keys = [self._keys[i] for i in keep]
+            self._embeddings = self._embeddings[keep] if keep else None
+    
+    def _similar_result(self, embedding):
+        """Cached result of the most similar request above the threshold, if any"""
+        if self._embeddings is None:
+            return None
+        # Embeddings are normalized, so the dot product is the cosine similarity
+        scores = self._embeddings @ embedding
+        best = int(np.argmax(scores))
+        if scores[best] < self.similarity_threshold:
+            return None
+        return self._results[self._keys[best]][1]
+    
+    def run(self, topic, target_audience, business_type, content_type="blog post"):
+        """Return a cached result for these inputs or run the crew and cache it"""
+        inputs = {
+            "topic": topic,
+            "target_audience": target_audience,
+            "business_type": business_type,
+            "content_type": content_type,
+        }
+        key = self.cache_key(inputs)
+        embedding = None
+        
+        with self._lock:
+            self._evict_expired(time.monotonic())
+            cached = self._results.get(key)
+            if cached is not None:
+                return cached[1]
+        
+        if self._model is not None:
+            # Encoding runs the model, so it happens outside the lock to
+            # keep concurrent lookups from queueing behind it
+            embedding = self._embed(inputs)
+            with self._lock:
+                result = self._similar_result(embedding)
+            if result is not None:
+                return result
+        
+        result = self.content_crew.create_crew(
+            topic, target_audience, business_type, content_type
+        ).kickoff()
+        
+        with self._lock:
+            self._results[key] = (time.monotonic() + self.ttl_seconds, result)
+            if embedding is not None:
+                self._keys.append(key)
+                row = embedding[np.newaxis, :]
+                self._embeddings = row if self._embeddings is None else np.vstack([self._embeddings, row])
+        return result
+
+def create_parallel_crews(content_types):
+    """
+    Create the crews that run concurrently once research is done: the
+    strategy crew followed by one content crew per content type.
+    
+    Each crew is built from its own ContentCreationCrew so that no agent is
+    shared between crews running at the same time.
+    """
+    return [ContentCreationCrew().strategy_crew()] + [
+        ContentCreationCrew().content_crew(content_type) for content_type in content_types
+    ]
+
+async def run_content_crews_parallel(topic, target_audience, business_type,
+                                     content_types=("blog post",), max_concurrency=MAX_PARALLEL_CREWS,
+                                     research=None):
+    """
+    Run research, then the strategy and every content variant concurrently.
+    
+    Content variants are drafted from the research alone rather than waiting
+    for the strategy, so wall-clock time is research plus the slowest of the
+    parallel crews instead of the sum of all three stages. Pass a previous
+    ResearchOutput as research to skip the research run entirely.
+    
+    Returns:
+        dict: the ResearchOutput, the strategy output, and content outputs
+        keyed by type
+    """
+    if research is None:
+        research = await ContentCreationCrew().run_research_async(
+            topic, target_audience, business_type
+        )
+    inputs = research.as_inputs()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def kickoff(crew):
+        async with semaphore:
+            return await crew.kickoff_async(inputs=inputs)
+    
+    strategy, *contents = await asyncio.gather(
+        *(kickoff(crew) for crew in create_parallel_crews(content_types))
+    )
+    return {
+        "research": research,
+        "strategy": strategy,
+        "content": dict(zip(content_types, contents)),
+    }
 
 def run_content_crew_example():
     """Example function to run the content creation crew"""
@@ -2,8 +2,14 @@ from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai_tools import SerperDevTool
 from crewai.agents.agent_builder.base_agent import BaseAgent
+from functools import lru_cache
 from typing import List
 
+@lru_cache(maxsize=1)
+def _search_tool() -> SerperDevTool:
+    """Search tool shared by every crew in the process"""
+    return SerperDevTool()
+
 @CrewBase
 class LatestAiDevelopmentCrew():
     """LatestAiDevelopment crew"""
@@ -15,7 +21,7 @@ class LatestAiDevelopmentCrew():
         return Agent(
             config=self.agents_config['researcher'],
             verbose=True,
-            tools=[SerperDevTool()]
+            tools=[_search_tool()]
         )
 
     @agent
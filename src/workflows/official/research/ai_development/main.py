@@ -1,25 +1,47 @@
 #!/usr/bin/env python
+import asyncio
 import sys
-from datetime import datetime
+from datetime import date
 from crew import LatestAiDevelopmentCrew
 
+# Crews kicked off at once by run_many; size to the LLM provider's rate limit
+MAX_CONCURRENT_CREWS = 4
+
 def run():
     """
     Run the crew.
     """
     inputs = {
         'topic': 'AI Agents',
-        'current_year': str(datetime.now().year)
+        'current_year': str(date.today().year)
     }
     LatestAiDevelopmentCrew().crew().kickoff(inputs=inputs)
 
+async def run_many(topics, max_concurrency=MAX_CONCURRENT_CREWS):
+    """
+    Run the crew for several independent topics concurrently.
+    
+    Each topic gets its own crew, and its report is written to
+    report_<n>.md instead of the shared report.md.
+    """
+    current_year = str(date.today().year)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def kickoff(index, topic):
+        crew = LatestAiDevelopmentCrew().crew()
+        crew.tasks[-1].output_file = f'report_{index}.md'
+        async with semaphore:
+            return await crew.kickoff_async(inputs={'topic': topic, 'current_year': current_year})
+
+    return await asyncio.gather(*(kickoff(index, topic) for index, topic in enumerate(topics)))
+
 def train():
     """
     Train the crew for a given number of iterations.
     """
     inputs = {
         'topic': 'AI Agents',
-        'current_year': str(datetime.now().year)
+        'current_year': str(date.today().year)
     }
     try:
         LatestAiDevelopmentCrew().crew().train(n_iterations=int(sys.argv[1]), filename=sys.argv[2], inputs=inputs)
@@ -41,7 +63,7 @@ def test():
     """
     inputs = {
         'topic': 'AI Agents',
-        'current_year': str(datetime.now().year)
+        'current_year': str(date.today().year)
     }
     try:
         LatestAiDevelopmentCrew().crew().test(n_iterations=int(sys.argv[1]), openai_model_name=sys.argv[2], inputs=inputs)
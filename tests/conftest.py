@@ -0,0 +1,64 @@
+"""
+Shared pytest fixtures.
+"""
+
+from contextlib import ExitStack
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+MONITOR_MODULE = 'src.core.monitoring.workflow_monitor'
+
+
+class _StubMetric:
+    """Prometheus collector stand-in that records calls in a plain list."""
+
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+
+    def labels(self, **labels):
+        self.calls.append(('labels', labels))
+        return self
+
+    def inc(self, *args):
+        self.calls.append(('inc', args))
+
+    def dec(self, *args):
+        self.calls.append(('dec', args))
+
+    def observe(self, value):
+        self.calls.append(('observe', value))
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """
+    Freeze datetime.now() inside the workflow monitor.
+
+    Returns a list of datetimes handed out by successive now() calls; once it
+    is empty, now() returns 2024-01-01.
+    """
+    calls = []
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return calls.pop(0) if calls else datetime(2024, 1, 1)
+
+    monkeypatch.setattr(f'{MONITOR_MODULE}.datetime', FrozenDatetime)
+    return calls
+
+
+@pytest.fixture
+def prom_stack():
+    """
+    Enable Prometheus in the workflow monitor with its HTTP server mocked and
+    its collectors replaced by _StubMetric.
+    """
+    with ExitStack() as stack:
+        stack.enter_context(patch(f'{MONITOR_MODULE}.PROMETHEUS_AVAILABLE', True))
+        stack.enter_context(patch(f'{MONITOR_MODULE}.start_http_server'))
+        for name in ('Counter', 'Histogram', 'Gauge'):
+            stack.enter_context(patch(f'{MONITOR_MODULE}.{name}', _StubMetric))
+        yield
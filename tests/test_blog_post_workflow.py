@@ -0,0 +1,15 @@
+"""
+Tests for the blog post workflow entry points.
+"""
+
+import pytest
+
+pytest.importorskip("crewai_tools")
+
+
+def test_entry_points_import():
+    """Test that the workflow's run/train entry points can be imported."""
+    from src.workflows.official.content_creation.blog_post_workflow.main import run, train
+
+    assert callable(run)
+    assert callable(train)
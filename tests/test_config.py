@@ -35,4 +35,18 @@ def test_jwt_settings():
     settings = get_settings()
     assert settings.jwt.algorithm == "HS256"
     assert settings.jwt.access_token_expire_minutes == 30
-    assert settings.jwt.refresh_token_expire_days == 7 
\ No newline at end of file
+    assert settings.jwt.refresh_token_expire_days == 7 
+
+
+def test_logging_settings():
+    """Test logging configuration."""
+    settings = get_settings()
+    assert settings.logging.level == "INFO"
+    assert settings.logging.format == "json"
+
+
+def test_logging_module_imports():
+    """Test that the logging utilities load with the default settings."""
+    from src.shared.utils.logging import get_logger
+
+    assert get_logger("test") is not None
@@ -2,14 +2,30 @@
 Tests for CrewManager orchestration functionality.
 """
 
+import asyncio
+import threading
+
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime
 
-from src.core.orchestrator.crew_manager import CrewManager, WorkflowConfig
+from src.core.orchestrator.crew_manager import CrewManager, ExecutionRecord, WorkflowConfig
 from src.core.monitoring.workflow_monitor import WorkflowMonitor
 
 
+def make_record(workflow_id, status):
+    """Create an ExecutionRecord with placeholder timings."""
+    timestamp = datetime(2024, 1, 1, 10, 0, 0)
+    return ExecutionRecord(
+        workflow_id=workflow_id,
+        status=status,
+        start_time=timestamp,
+        end_time=timestamp,
+        execution_time=0.0,
+        inputs={}
+    )
+
+
 class TestCrewManager:
     """Test suite for CrewManager class."""
     
@@ -46,7 +62,7 @@ class TestCrewManager:
         
         assert manager.monitor == mock_monitor
         assert manager.active_crews == {}
-        assert manager.execution_history == []
+        assert len(manager.execution_history) == 0
     
     def test_crew_manager_default_monitor(self):
         """Test CrewManager with default monitor."""
@@ -54,7 +70,21 @@ class TestCrewManager:
         
         assert isinstance(manager.monitor, WorkflowMonitor)
         assert manager.active_crews == {}
-        assert manager.execution_history == []
+        assert len(manager.execution_history) == 0
+    
+    def test_close_stops_default_monitor(self, prom_stack):
+        """Test that closing the manager stops the monitor it created."""
+        with CrewManager() as manager:
+            thread = manager.monitor._prom_thread
+            assert thread.is_alive()
+        
+        assert not thread.is_alive()
+    
+    def test_close_leaves_given_monitor_open(self, crew_manager, mock_monitor):
+        """Test that a monitor passed in is left for its owner to close."""
+        crew_manager.close()
+        
+        mock_monitor.close.assert_not_called()
     
     @patch('src.core.orchestrator.crew_manager.Crew')
     def test_load_workflow_success(self, mock_crew_class, crew_manager, sample_workflow_config):
@@ -72,9 +102,9 @@ class TestCrewManager:
         assert workflow_id.startswith("test_workflow_")
         assert len(workflow_id.split('_')) == 3  # name_date_time
         
-        # Verify crew was created and stored
+        # Verify a copy of the crew was created and stored
         assert workflow_id in crew_manager.active_crews
-        assert crew_manager.active_crews[workflow_id] == mock_crew_instance
+        assert crew_manager.active_crews[workflow_id] == mock_crew_instance.copy.return_value
         
         # Verify Crew was initialized correctly
         mock_crew_class.assert_called_once_with(
@@ -83,6 +113,25 @@ class TestCrewManager:
             verbose=True
         )
     
+    @patch('src.core.orchestrator.crew_manager.Crew')
+    def test_load_workflow_reuses_materialized_crew(self, mock_crew_class, crew_manager, sample_workflow_config):
+        """Test that loading the same configuration again copies the cached crew."""
+        crew_manager._create_agents = Mock(return_value=[Mock(), Mock()])
+        crew_manager._create_tasks = Mock(return_value=[Mock(), Mock()])
+        template = mock_crew_class.return_value
+        template.copy.side_effect = [Mock(), Mock()]
+        
+        with patch('src.core.orchestrator.crew_manager.datetime') as mock_datetime:
+            mock_datetime.now.side_effect = [datetime(2024, 1, 1, 10, 0, 0), datetime(2024, 1, 1, 10, 0, 1)]
+            first_id = crew_manager.load_workflow(sample_workflow_config)
+            second_id = crew_manager.load_workflow(sample_workflow_config.model_copy(update={"inputs": {}}))
+        
+        crew_manager._create_agents.assert_called_once()
+        crew_manager._create_tasks.assert_called_once()
+        mock_crew_class.assert_called_once()
+        assert template.copy.call_count == 2
+        assert crew_manager.active_crews[first_id] is not crew_manager.active_crews[second_id]
+    
     def test_load_workflow_failure(self, crew_manager, sample_workflow_config):
         """Test workflow loading failure."""
         # Mock agent creation to raise an exception
@@ -99,17 +148,19 @@ class TestCrewManager:
         with pytest.raises(ValueError, match="Workflow nonexistent not found"):
             crew_manager.execute_workflow("nonexistent")
     
+    @patch('src.core.orchestrator.crew_manager.perf_counter')
     @patch('src.core.orchestrator.crew_manager.datetime')
-    def test_execute_workflow_success(self, mock_datetime, crew_manager, mock_monitor):
+    def test_execute_workflow_success(self, mock_datetime, mock_perf_counter, crew_manager, mock_monitor):
         """Test successful workflow execution."""
-        # Setup mock datetime
+        # Setup mock clocks
         start_time = datetime(2024, 1, 1, 10, 0, 0)
         end_time = datetime(2024, 1, 1, 10, 5, 0)
-        mock_datetime.now.side_effect = [start_time, end_time, end_time]
+        mock_datetime.now.return_value = start_time
+        mock_perf_counter.side_effect = [1000.0, 1300.0]
         
         # Setup mock crew
         mock_crew = Mock()
-        mock_crew.kickoff.return_value = "Workflow completed successfully"
+        mock_crew.kickoff_async = AsyncMock(return_value="Workflow completed successfully")
         workflow_id = "test_workflow_20240101_100000"
         crew_manager.active_crews[workflow_id] = mock_crew
         
@@ -118,7 +169,7 @@ class TestCrewManager:
         result = crew_manager.execute_workflow(workflow_id, inputs)
         
         # Verify execution
-        mock_crew.kickoff.assert_called_once_with(inputs=inputs)
+        mock_crew.kickoff_async.assert_awaited_once_with(inputs=inputs)
         mock_monitor.start_execution.assert_called_once_with(workflow_id)
         mock_monitor.end_execution.assert_called_once_with(workflow_id, True, 300.0)
         
@@ -132,21 +183,22 @@ class TestCrewManager:
         # Verify execution history
         assert len(crew_manager.execution_history) == 1
         history_record = crew_manager.execution_history[0]
-        assert history_record['workflow_id'] == workflow_id
-        assert history_record['status'] == 'success'
-        assert history_record['execution_time'] == 300.0
+        assert history_record.workflow_id == workflow_id
+        assert history_record.status == 'success'
+        assert history_record.execution_time == 300.0
     
+    @patch('src.core.orchestrator.crew_manager.perf_counter')
     @patch('src.core.orchestrator.crew_manager.datetime')
-    def test_execute_workflow_failure(self, mock_datetime, crew_manager, mock_monitor):
+    def test_execute_workflow_failure(self, mock_datetime, mock_perf_counter, crew_manager, mock_monitor):
         """Test workflow execution failure."""
-        # Setup mock datetime
+        # Setup mock clocks
         start_time = datetime(2024, 1, 1, 10, 0, 0)
-        end_time = datetime(2024, 1, 1, 10, 2, 30)
-        mock_datetime.now.side_effect = [start_time, end_time]
+        mock_datetime.now.return_value = start_time
+        mock_perf_counter.side_effect = [1000.0, 1150.0]
         
         # Setup mock crew that fails
         mock_crew = Mock()
-        mock_crew.kickoff.side_effect = Exception("Execution failed")
+        mock_crew.kickoff_async = AsyncMock(side_effect=Exception("Execution failed"))
         workflow_id = "test_workflow_20240101_100000"
         crew_manager.active_crews[workflow_id] = mock_crew
         
@@ -161,23 +213,89 @@ class TestCrewManager:
         # Verify execution history records failure
         assert len(crew_manager.execution_history) == 1
         history_record = crew_manager.execution_history[0]
-        assert history_record['workflow_id'] == workflow_id
-        assert history_record['status'] == 'failed'
-        assert history_record['error'] == "Execution failed"
+        assert history_record.workflow_id == workflow_id
+        assert history_record.status == 'failed'
+        assert history_record.error == "Execution failed"
+    
+    def test_execute_workflow_async_runs_concurrently(self, crew_manager):
+        """Test that async executions overlap instead of running one after another."""
+        running = 0
+        max_running = 0
+        
+        async def kickoff_async(inputs):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return "done"
+        
+        workflow_ids = [f"parallel_2024010{i}_100000" for i in range(1, 4)]
+        for workflow_id in workflow_ids:
+            crew_manager.active_crews[workflow_id] = Mock(kickoff_async=kickoff_async)
+        
+        async def run_all():
+            return await asyncio.gather(
+                *(crew_manager.execute_workflow_async(workflow_id) for workflow_id in workflow_ids)
+            )
+        
+        results = asyncio.run(run_all())
+        
+        assert [result['status'] for result in results] == ['success'] * 3
+        assert max_running == 3
+        assert len(crew_manager.get_execution_history('parallel')) == 3
+    
+    def test_execute_workflow_from_concurrent_threads(self, crew_manager):
+        """Test blocking executions from several threads, each running its own loop."""
+        async def kickoff_async(inputs):
+            await asyncio.sleep(0.01)
+            return "done"
+        
+        workflow_ids = [f"threaded_2024010{i}_100000" for i in range(1, 5)]
+        for workflow_id in workflow_ids:
+            crew_manager.active_crews[workflow_id] = Mock(kickoff_async=kickoff_async)
+        
+        results = {}
+        threads = [
+            threading.Thread(
+                target=lambda wid=workflow_id: results.__setitem__(wid, crew_manager.execute_workflow(wid))
+            )
+            for workflow_id in workflow_ids
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+        
+        assert not any(thread.is_alive() for thread in threads)
+        assert [results[wid]['status'] for wid in workflow_ids] == ['success'] * 4
+    
+    def test_execute_workflow_inside_running_loop(self, crew_manager):
+        """Test that the blocking wrapper still works when an event loop is running."""
+        workflow_id = "nested_20240101_100000"
+        crew_manager.active_crews[workflow_id] = Mock(kickoff_async=AsyncMock(return_value="done"))
+        
+        async def call_sync():
+            return crew_manager.execute_workflow(workflow_id)
+        
+        result = asyncio.run(call_sync())
+        
+        assert result['status'] == 'success'
+        assert result['result'] == "done"
     
     def test_get_execution_history_all(self, crew_manager):
         """Test getting all execution history."""
         # Add some mock history
         crew_manager.execution_history = [
-            {'workflow_id': 'workflow1_123', 'status': 'success'},
-            {'workflow_id': 'workflow2_456', 'status': 'failed'},
-            {'workflow_id': 'workflow1_789', 'status': 'success'}
+            make_record('workflow1_123', 'success'),
+            make_record('workflow2_456', 'failed'),
+            make_record('workflow1_789', 'success')
         ]
         
         history = crew_manager.get_execution_history()
         
         assert len(history) == 3
-        assert history == crew_manager.execution_history
+        assert history == list(crew_manager.execution_history)
         # Verify it returns a copy, not the original
         assert history is not crew_manager.execution_history
     
@@ -185,15 +303,52 @@ class TestCrewManager:
         """Test getting filtered execution history."""
         # Add some mock history
         crew_manager.execution_history = [
-            {'workflow_id': 'workflow1_123', 'status': 'success'},
-            {'workflow_id': 'workflow2_456', 'status': 'failed'},
-            {'workflow_id': 'workflow1_789', 'status': 'success'}
+            make_record('workflow1_123', 'success'),
+            make_record('workflow2_456', 'failed'),
+            make_record('workflow1_789', 'success')
         ]
         
         history = crew_manager.get_execution_history('workflow1')
         
         assert len(history) == 2
-        assert all(record['workflow_id'].startswith('workflow1') for record in history)
+        assert all(record.workflow_id.startswith('workflow1') for record in history)
+    
+    def test_get_execution_history_by_workflow_name(self, crew_manager):
+        """Test that executed workflows are matched by ID prefix, in history order."""
+        for workflow_id in ["report_20240101_100000", "report_weekly_20240101_110000", "report_20240102_100000"]:
+            crew_manager.active_crews[workflow_id] = Mock(kickoff_async=AsyncMock())
+            crew_manager.execute_workflow(workflow_id)
+        
+        history = crew_manager.get_execution_history('report')
+        
+        assert [record.workflow_id for record in history] == [
+            "report_20240101_100000",
+            "report_weekly_20240101_110000",
+            "report_20240102_100000",
+        ]
+        assert len(crew_manager.get_execution_history('report_weekly')) == 1
+        assert len(crew_manager.get_execution_history('rep')) == 3
+        assert [record.workflow_id for record in crew_manager.get_execution_history('report_2024')] == [
+            "report_20240101_100000",
+            "report_20240102_100000",
+        ]
+        assert crew_manager.get_execution_history('other') == []
+    
+    def test_execution_history_is_bounded(self, crew_manager):
+        """Test that the oldest records are dropped from the history and the name index."""
+        with patch('src.core.orchestrator.crew_manager.MAX_EXECUTION_HISTORY', 2):
+            crew_manager.execution_history = [
+                make_record('first_20240101_100000', 'success'),
+                make_record('second_20240101_100000', 'success'),
+                make_record('second_20240102_100000', 'failed')
+            ]
+        
+        assert [record.workflow_id for record in crew_manager.execution_history] == [
+            'second_20240101_100000',
+            'second_20240102_100000',
+        ]
+        assert crew_manager.get_execution_history('first') == []
+        assert len(crew_manager.get_execution_history('second')) == 2
     
     def test_cleanup_workflow_exists(self, crew_manager):
         """Test cleaning up an existing workflow."""
@@ -254,6 +409,13 @@ class TestWorkflowConfig:
         assert config.inputs == {}
         assert config.output_dir is None
     
+    def test_workflow_config_is_frozen(self):
+        """Test that WorkflowConfig cannot be modified after creation."""
+        config = WorkflowConfig(name="test_workflow")
+        
+        with pytest.raises(ValueError):
+            config.name = "other_workflow"
+    
     def test_workflow_config_validation(self):
         """Test WorkflowConfig validation."""
         # Test missing required field
@@ -0,0 +1,115 @@
+"""
+Tests for OutputValidator functionality.
+"""
+
+import pytest
+
+from src.core.output_management.output_validator import OutputValidator, ValidationRule
+from src.core.output_management.structured_output import (
+    StructuredOutput,
+    OutputMetadata,
+    OutputType,
+)
+
+
+class TestOutputValidator:
+    """Test suite for OutputValidator class."""
+
+    @pytest.fixture
+    def validator(self):
+        """Create an OutputValidator instance."""
+        return OutputValidator()
+
+    def make_output(self, content, output_type=OutputType.TEXT):
+        """Create a structured output with minimal metadata."""
+        return StructuredOutput(
+            content=content,
+            output_type=output_type,
+            metadata=OutputMetadata(agent_id="agent_1", agent_role="Researcher")
+        )
+
+    def test_validate_output_skips_inapplicable_rules(self, validator):
+        """Test that type-specific rules are not evaluated for other output types."""
+        validation = validator.validate_output(self.make_output("Plain text content for testing"))
+
+        assert validation.is_valid is True
+        assert "json_validity" not in validation.requirements_met
+        assert "markdown_structure" not in validation.requirements_met
+        assert "content_type_consistency" not in validation.requirements_met
+
+    def test_validate_output_applies_type_specific_rules(self, validator):
+        """Test that JSON rules run for JSON outputs."""
+        validation = validator.validate_output(self.make_output("not json at all", OutputType.JSON))
+
+        assert validation.is_valid is False
+        assert validation.requirements_met["json_validity"] is False
+        assert validation.requirements_met["content_type_consistency"] is False
+
+    def test_validate_output_fail_fast(self, validator):
+        """Test that fail_fast stops at the first error."""
+        calls = []
+        custom_rule = ValidationRule(
+            name="never_called",
+            description="Should not be evaluated after an earlier error",
+            validator_func=lambda output: calls.append(output) or True,
+            error_message="unused"
+        )
+        output = self.make_output("Run eval(payload) on the server")
+
+        validation = validator.validate_output(output, custom_rules=[custom_rule], fail_fast=True)
+
+        assert validation.is_valid is False
+        assert len(validation.errors) == 1
+        assert validation.errors[0].startswith("no_suspicious_content")
+        assert "never_called" not in validation.requirements_met
+        assert calls == []
+
+    def test_validate_output_without_fail_fast_evaluates_all_rules(self, validator):
+        """Test that all rules run when fail_fast is disabled."""
+        custom_rule = ValidationRule(
+            name="always_fails",
+            description="Always fails",
+            validator_func=lambda output: False,
+            error_message="failed"
+        )
+        output = self.make_output("Run eval(payload) on the server")
+
+        validation = validator.validate_output(output, custom_rules=[custom_rule])
+
+        assert len(validation.errors) == 2
+        assert validation.requirements_met["always_fails"] is False
+
+    def test_content_quality_rule(self, validator):
+        """Test required and forbidden keyword checks."""
+        output = self.make_output("An overview of AI development trends")
+
+        assert validator.create_content_quality_rule(
+            required_keywords=["AI", "Development"]
+        ).validate(output)[0] is True
+        assert validator.create_content_quality_rule(
+            required_keywords=["blockchain"]
+        ).validate(output)[0] is False
+        assert validator.create_content_quality_rule(
+            forbidden_words=["TRENDS"]
+        ).validate(output)[0] is False
+
+    def test_get_validation_summary(self, validator):
+        """Test summary statistics over multiple validations."""
+        outputs = [
+            self.make_output("Plain text content for testing"),
+            self.make_output("Run eval(payload) on the server"),
+        ]
+        validations = validator.validate_multiple_outputs(outputs)
+
+        summary = validator.get_validation_summary(validations)
+
+        assert summary["total_validations"] == 2
+        assert summary["valid_count"] == 1
+        assert summary["invalid_count"] == 1
+        assert summary["total_errors"] == 1
+        assert summary["max_score"] == 1.0
+        assert summary["min_score"] < 1.0
+
+    def test_get_validation_summary_empty(self, validator):
+        """Test summary of an empty validation list."""
+        assert "error" in validator.get_validation_summary([])
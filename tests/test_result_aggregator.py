@@ -0,0 +1,115 @@
+"""
+Tests for ResultAggregator functionality.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.core.output_management import result_aggregator
+from src.core.output_management.result_aggregator import ResultAggregator, WorkflowResult
+from src.core.output_management.structured_output import (
+    StructuredOutput,
+    OutputMetadata,
+    OutputStatus,
+    OutputType,
+)
+
+
+class TestResultAggregator:
+    """Test suite for ResultAggregator class."""
+
+    @pytest.fixture
+    def aggregator(self):
+        """Create a ResultAggregator instance."""
+        return ResultAggregator()
+
+    def make_output(self, agent_role, status=OutputStatus.SUCCESS, word_count=None,
+                    confidence_score=None, sections=None):
+        """Create a structured output for the given agent."""
+        return StructuredOutput(
+            content=f"Output from {agent_role}",
+            output_type=OutputType.TEXT,
+            status=status,
+            metadata=OutputMetadata(
+                agent_id=agent_role.lower(),
+                agent_role=agent_role,
+                word_count=word_count,
+                confidence_score=confidence_score
+            ),
+            sections=sections
+        )
+
+    @pytest.fixture
+    def outputs(self):
+        """Outputs with distinct quality levels."""
+        return [
+            self.make_output("Writer", OutputStatus.PARTIAL, word_count=300),
+            self.make_output("Researcher", word_count=1500, confidence_score=0.9,
+                             sections={"summary": "s", "findings": "f"}),
+            self.make_output("Editor", OutputStatus.FAILED),
+        ]
+
+    def test_select_best_output(self, aggregator, outputs):
+        """Test that the highest scoring output is selected."""
+        best = aggregator._select_best_output(outputs, "Best")
+
+        assert best.metadata.agent_role == "Best"
+        assert best.metadata.word_count == 1500
+
+    def test_rank_outputs(self, aggregator, outputs):
+        """Test ranking order and scores."""
+        ranking = aggregator._rank_outputs(outputs)
+
+        assert [item["agent"] for item in ranking] == ["Researcher", "Writer", "Editor"]
+        assert [item["rank"] for item in ranking] == [1, 2, 3]
+        assert ranking[0]["score"] == 30 + 15 + 0.9 * 15 + 4
+        assert ranking[1]["score"] == 15 + 3
+        assert ranking[2]["score"] == 0
+        assert ranking[2]["word_count"] is None
+
+    def test_rank_outputs_top_k(self, aggregator, outputs):
+        """Test that top_k keeps only the highest ranked outputs."""
+        ranking = aggregator._rank_outputs(outputs, top_k=2)
+
+        assert [item["agent"] for item in ranking] == ["Researcher", "Writer"]
+        assert [item["rank"] for item in ranking] == [1, 2]
+
+    def test_score_kernels_agree(self):
+        """Test that the loop and vectorized scoring kernels match."""
+        rng = np.random.default_rng(0)
+        features = rng.random((50, 5)) * [5, 1, 3000, 1, 12]
+        features[:, 0] = np.floor(features[:, 0]) - 1
+        features[:, 4] = np.floor(features[:, 4])
+        params = (
+            result_aggregator._RANK_STATUS_POINTS,
+            result_aggregator._RANK_WEIGHTS,
+            result_aggregator._RANK_CAPS,
+        )
+
+        np.testing.assert_allclose(
+            result_aggregator._score_rows(features, *params),
+            result_aggregator._score_rows_vectorized(features, *params)
+        )
+
+    def test_aggregate_with_naive_execution_end(self, aggregator, outputs):
+        """Test that a naive end time is comparable with the UTC output timestamps."""
+        result = aggregator.aggregate_workflow_results(
+            outputs, "wf_1", "Test Workflow", execution_end=datetime.now()
+        )
+
+        assert result.execution_start.tzinfo is not None
+        assert result.execution_end.tzinfo is not None
+        assert 0 <= result.execution_time < 60
+
+    def test_workflow_result_caches_in_slots(self, outputs):
+        """Test that lazily computed results are cached without an instance dict."""
+        start = datetime(2024, 1, 1)
+        result = WorkflowResult("wf_1", "Test Workflow", outputs, start, start + timedelta(seconds=30))
+
+        assert not hasattr(result, "__dict__")
+        assert result.analytics is result.analytics
+        assert result.analytics["total_outputs"] == 3
+        assert result.analytics["success_rate"] == pytest.approx(1 / 3)
+        assert result.summary["success_rate"] == "33.3%"
@@ -2,12 +2,30 @@
 Tests for WorkflowMonitor functionality.
 """
 
+import gc
+import threading
+from collections.abc import MutableMapping
+
+import numpy as np
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 from datetime import datetime, timedelta
-from collections import deque
 
-from src.core.monitoring.workflow_monitor import WorkflowMonitor
+from src.core.monitoring import _kernels
+from src.core.monitoring.workflow_monitor import (
+    ActiveExecution, RingDeque, WorkflowMonitor, _RingBuffer
+)
+
+
+def _seed_records(monitor, workflow_name, executions):
+    """Fill a workflow's ring buffer from execution dicts."""
+    for execution in executions:
+        monitor._record(
+            workflow_name,
+            execution.get('start_time', datetime.now()),
+            execution.get('execution_time', 0.0),
+            execution['success']
+        )
 
 
 class TestWorkflowMonitor:
@@ -19,47 +37,78 @@ class TestWorkflowMonitor:
         return WorkflowMonitor(enable_prometheus=False, prometheus_port=None)
     
     @pytest.fixture
-    def monitor_with_prometheus(self):
+    def monitor_with_prometheus(self, prom_stack):
         """Create a WorkflowMonitor instance with mocked Prometheus."""
-        with patch('src.core.monitoring.workflow_monitor.PROMETHEUS_AVAILABLE', True):
-            with patch('src.core.monitoring.workflow_monitor.start_http_server'):
-                with patch('src.core.monitoring.workflow_monitor.Counter'):
-                    with patch('src.core.monitoring.workflow_monitor.Histogram'):
-                        with patch('src.core.monitoring.workflow_monitor.Gauge'):
-                            return WorkflowMonitor(enable_prometheus=True, prometheus_port=8000)
+        monitor = WorkflowMonitor(enable_prometheus=True, prometheus_port=8000)
+        yield monitor
+        monitor.close()
     
     def test_monitor_initialization_without_prometheus(self, monitor):
         """Test WorkflowMonitor initialization without Prometheus."""
         assert monitor.enable_prometheus is False
-        assert isinstance(monitor.execution_metrics, dict)
-        assert isinstance(monitor.active_executions, dict)
-        assert isinstance(monitor.performance_history, deque)
+        assert isinstance(monitor.execution_metrics, MutableMapping)
+        assert isinstance(monitor.active_executions, MutableMapping)
+        assert isinstance(monitor.performance_history, RingDeque)
         assert monitor.execution_time_threshold == 300
         assert monitor.error_rate_threshold == 0.1
     
+    def test_close_flushes_pending_prometheus_updates(self, monitor_with_prometheus):
+        """Test that close() applies queued Prometheus updates before stopping."""
+        monitor = monitor_with_prometheus
+        
+        monitor.start_execution("closing_workflow_123")
+        monitor.end_execution("closing_workflow_123", False, 5.0)
+        monitor.close()
+        
+        assert not monitor._prom_queue
+        assert monitor.active_workflows.calls.count(('dec', ())) == 1
+    
+    def test_dropped_monitor_stops_prometheus_thread(self, prom_stack):
+        """Test that the Prometheus thread exits once its monitor is collected."""
+        monitor = WorkflowMonitor(enable_prometheus=True, prometheus_port=None)
+        thread = monitor._prom_thread
+        assert thread.is_alive()
+        
+        del monitor
+        gc.collect()
+        thread.join(timeout=5)
+        
+        assert not thread.is_alive()
+    
+    def test_prometheus_label_children_cached(self, monitor_with_prometheus):
+        """Test that labelled metric children are resolved once per label set."""
+        monitor = monitor_with_prometheus
+        
+        monitor._counter_for('test', 'success')
+        monitor._counter_for('test', 'success')
+        
+        assert monitor.workflow_executions_total.calls == [
+            ('labels', {'workflow_name': 'test', 'status': 'success'})
+        ]
+    
     def test_monitor_initialization_with_prometheus(self, monitor_with_prometheus):
         """Test WorkflowMonitor initialization with Prometheus."""
         assert monitor_with_prometheus.enable_prometheus is True
     
-    def test_start_execution(self, monitor):
+    def test_start_execution(self, monitor, frozen_now):
         """Test starting execution monitoring."""
         workflow_id = "test_workflow_20240101_100000"
         metadata = {"user": "test_user", "priority": "high"}
+        start_time = datetime(2024, 1, 1, 10, 0, 0)
+        frozen_now.append(start_time)
         
-        with patch('src.core.monitoring.workflow_monitor.datetime') as mock_datetime:
-            start_time = datetime(2024, 1, 1, 10, 0, 0)
-            mock_datetime.now.return_value = start_time
-            
+        with patch('src.core.monitoring.workflow_monitor.time.monotonic_ns', return_value=5_000):
             monitor.start_execution(workflow_id, metadata)
         
         # Verify execution was recorded
         assert workflow_id in monitor.active_executions
         execution_data = monitor.active_executions[workflow_id]
         
-        assert execution_data['workflow_id'] == workflow_id
-        assert execution_data['workflow_name'] == 'test'
-        assert execution_data['start_time'] == start_time
-        assert execution_data['metadata'] == metadata
+        assert execution_data.workflow_id == workflow_id
+        assert execution_data.workflow_name == 'test'
+        assert execution_data.start_time == start_time
+        assert execution_data.start_ns == 5_000
+        assert execution_data.metadata == metadata
     
     def test_start_execution_without_metadata(self, monitor):
         """Test starting execution monitoring without metadata."""
@@ -69,7 +118,7 @@ class TestWorkflowMonitor:
         
         assert workflow_id in monitor.active_executions
         execution_data = monitor.active_executions[workflow_id]
-        assert execution_data['metadata'] == {}
+        assert execution_data.metadata == {}
     
     def test_end_execution_success(self, monitor):
         """Test ending execution monitoring for successful execution."""
@@ -77,21 +126,18 @@ class TestWorkflowMonitor:
         
         # Start execution first
         start_time = datetime(2024, 1, 1, 10, 0, 0)
-        monitor.active_executions[workflow_id] = {
-            'workflow_id': workflow_id,
-            'workflow_name': 'test',
-            'start_time': start_time,
-            'metadata': {}
-        }
+        monitor.active_executions[workflow_id] = ActiveExecution(
+            workflow_id=workflow_id,
+            workflow_name='test',
+            start_time=start_time,
+            start_ns=0,
+            metadata={}
+        )
         
         execution_time = 120.5
         result_data = {"output": "success"}
         
-        with patch('src.core.monitoring.workflow_monitor.datetime') as mock_datetime:
-            end_time = datetime(2024, 1, 1, 10, 2, 0)
-            mock_datetime.now.return_value = end_time
-            
-            monitor.end_execution(workflow_id, True, execution_time, result_data)
+        monitor.end_execution(workflow_id, True, execution_time, result_data)
         
         # Verify execution was removed from active
         assert workflow_id not in monitor.active_executions
@@ -100,27 +146,42 @@ class TestWorkflowMonitor:
         assert 'test' in monitor.execution_metrics
         assert len(monitor.execution_metrics['test']) == 1
         
-        execution_record = monitor.execution_metrics['test'][0]
+        sample = monitor.execution_metrics['test'].view()[0]
+        assert sample['ok']
+        assert sample['dur'] == execution_time
+        
+        # Verify performance history
+        assert len(monitor.performance_history) == 1
+        execution_record = monitor.performance_history[0]
         assert execution_record['workflow_id'] == workflow_id
         assert execution_record['success'] is True
         assert execution_record['execution_time'] == execution_time
         assert execution_record['result_data'] == result_data
+        assert execution_record['end_time'] == datetime(2024, 1, 1, 10, 2, 0, 500000)
+    
+    def test_end_execution_measures_duration(self, monitor):
+        """Test that an omitted execution time is measured on the monotonic clock."""
+        workflow_id = "timed_workflow_20240101_100000"
         
-        # Verify performance history
-        assert len(monitor.performance_history) == 1
-        assert monitor.performance_history[0] == execution_record
+        with patch('src.core.monitoring.workflow_monitor.time.monotonic_ns', side_effect=[1_000_000_000, 3_500_000_000]):
+            monitor.start_execution(workflow_id)
+            monitor.end_execution(workflow_id, True)
+        
+        assert monitor.performance_history[0]['execution_time'] == 2.5
+        assert monitor.execution_metrics['timed'].view()[0]['dur'] == 2.5
     
     def test_end_execution_failure(self, monitor):
         """Test ending execution monitoring for failed execution."""
         workflow_id = "failed_workflow_20240101_100000"
         
         # Start execution first
-        monitor.active_executions[workflow_id] = {
-            'workflow_id': workflow_id,
-            'workflow_name': 'failed',
-            'start_time': datetime(2024, 1, 1, 10, 0, 0),
-            'metadata': {}
-        }
+        monitor.active_executions[workflow_id] = ActiveExecution(
+            workflow_id=workflow_id,
+            workflow_name='failed',
+            start_time=datetime(2024, 1, 1, 10, 0, 0),
+            start_ns=0,
+            metadata={}
+        )
         
         execution_time = 60.0
         
@@ -128,9 +189,9 @@ class TestWorkflowMonitor:
         
         # Verify execution was recorded as failed
         assert 'failed' in monitor.execution_metrics
-        execution_record = monitor.execution_metrics['failed'][0]
-        assert execution_record['success'] is False
-        assert execution_record['execution_time'] == execution_time
+        sample = monitor.execution_metrics['failed'].view()[0]
+        assert not sample['ok']
+        assert sample['dur'] == execution_time
     
     def test_end_execution_not_found(self, monitor):
         """Test ending execution for non-existent workflow."""
@@ -140,6 +201,27 @@ class TestWorkflowMonitor:
         # Verify no metrics were recorded
         assert len(monitor.execution_metrics) == 0
     
+    def test_concurrent_executions(self, monitor):
+        """Test starting and ending executions from several threads at once."""
+        def run(thread_index):
+            for i in range(200):
+                workflow_id = f"worker{thread_index % 4}_{thread_index}_{i}"
+                monitor.start_execution(workflow_id)
+                monitor.end_execution(workflow_id, i % 2 == 0, 1.0)
+        
+        threads = [threading.Thread(target=run, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(monitor.active_executions) == 0
+        assert sorted(monitor.execution_metrics) == ['worker0', 'worker1', 'worker2', 'worker3']
+        for name in monitor.execution_metrics:
+            metrics = monitor.get_workflow_metrics(name)
+            assert metrics['total_executions'] == 400
+            assert metrics['successful_executions'] == 200
+    
     def test_get_workflow_metrics_success(self, monitor):
         """Test getting workflow metrics for existing workflow."""
         workflow_name = "test_workflow"
@@ -165,7 +247,7 @@ class TestWorkflowMonitor:
                 'success': False
             }
         ]
-        monitor.execution_metrics[workflow_name] = executions
+        _seed_records(monitor, workflow_name, executions)
         
         metrics = monitor.get_workflow_metrics(workflow_name)
         
@@ -205,7 +287,7 @@ class TestWorkflowMonitor:
                 'success': True
             }
         ]
-        monitor.execution_metrics[workflow_name] = executions
+        _seed_records(monitor, workflow_name, executions)
         
         # Get metrics for last hour
         time_window = timedelta(hours=1)
@@ -214,6 +296,80 @@ class TestWorkflowMonitor:
         assert metrics['total_executions'] == 1
         assert metrics['avg_execution_time'] == 90.0
     
+    def test_get_workflow_metrics_with_out_of_order_records(self, monitor):
+        """Test that executions finishing out of start order are windowed correctly."""
+        workflow_name = "test_workflow"
+        now = datetime.now()
+        
+        executions = [
+            {'start_time': now - timedelta(minutes=10), 'execution_time': 30.0, 'success': True},
+            {'start_time': now - timedelta(hours=3), 'execution_time': 500.0, 'success': False},
+            {'start_time': now - timedelta(minutes=20), 'execution_time': 60.0, 'success': False},
+        ]
+        _seed_records(monitor, workflow_name, executions)
+        
+        metrics = monitor.get_workflow_metrics(workflow_name, timedelta(hours=1))
+        
+        assert metrics['total_executions'] == 2
+        assert metrics['successful_executions'] == 1
+        assert metrics['min_execution_time'] == 30.0
+        assert metrics['max_execution_time'] == 60.0
+    
+    def test_execution_metrics_ring_buffer_is_bounded(self, monitor):
+        """Test that the ring buffer keeps the newest samples and all-time totals."""
+        workflow_name = "busy_workflow"
+        monitor.execution_metrics[workflow_name] = _RingBuffer(capacity=4)
+        now = datetime.now()
+        
+        _seed_records(monitor, workflow_name, [
+            {'start_time': now - timedelta(minutes=10 - i), 'execution_time': float(i), 'success': True}
+            for i in range(10)
+        ])
+        
+        series = monitor.execution_metrics[workflow_name]
+        assert len(series) == 4
+        assert list(series.view()['dur']) == [6.0, 7.0, 8.0, 9.0]
+        assert monitor.get_workflow_metrics(workflow_name)['total_executions'] == 10
+    
+    def test_ring_buffer_since_across_wrap(self):
+        """Test windowed lookups on a ring buffer that has wrapped."""
+        series = _RingBuffer(capacity=5)
+        for i in range(8):
+            series.append(i * 10, float(i), True)
+        
+        # Samples 3..7 remain, stored as [5, 6, 7, 3, 4]
+        assert list(series.since(0)['dur']) == [3.0, 4.0, 5.0, 6.0, 7.0]
+        assert list(series.since(41)['dur']) == [5.0, 6.0, 7.0]
+        assert list(series.since(40)['dur']) == [4.0, 5.0, 6.0, 7.0]
+        assert len(series.since(71)) == 0
+    
+    def test_summarize_kernels_agree(self):
+        """Test that the loop and vectorized window reductions match."""
+        rng = np.random.default_rng(0)
+        for size in (1, 2, 50):
+            dur = rng.random(size) * 100
+            ok = rng.random(size) < 0.7
+            
+            loop = _kernels._summarize_loop(dur, ok)
+            vectorized = _kernels._summarize_vectorized(dur, ok)
+            
+            assert loop[0] == vectorized[0] == size
+            assert loop[4] == vectorized[4]
+            np.testing.assert_allclose(loop[1:4], vectorized[1:4])
+    
+    def test_performance_history_ring_deque(self):
+        """Test RingDeque indexing and slicing across the wrap point."""
+        history = RingDeque(maxlen=3)
+        for i in range(5):
+            history.append({'n': i})
+        
+        assert len(history) == 3
+        assert history[0] == {'n': 2}
+        assert history[-1] == {'n': 4}
+        assert [record['n'] for record in history.latest(2)] == [3, 4]
+        with pytest.raises(IndexError):
+            history[3]
+    
     def test_get_system_health_empty(self, monitor):
         """Test getting system health with no executions."""
         health = monitor.get_system_health()
@@ -232,13 +388,13 @@ class TestWorkflowMonitor:
         monitor.active_executions['active2'] = {}
         
         # Add some execution metrics
-        monitor.execution_metrics['workflow1'] = [
+        _seed_records(monitor, 'workflow1', [
             {'execution_time': 100.0, 'success': True},
             {'execution_time': 200.0, 'success': False}
-        ]
-        monitor.execution_metrics['workflow2'] = [
+        ])
+        _seed_records(monitor, 'workflow2', [
             {'execution_time': 150.0, 'success': True}
-        ]
+        ])
         
         health = monitor.get_system_health()
         
@@ -256,10 +412,10 @@ class TestWorkflowMonitor:
         
         assert len(alerts) == 1
         alert = alerts[0]
-        assert alert['type'] == 'slow_execution'
-        assert alert['workflow_name'] == workflow_name
-        assert alert['execution_time'] == execution_time
-        assert alert['threshold'] == 300
+        assert alert.type == 'slow_execution'
+        assert alert.workflow_name == workflow_name
+        assert alert.value == execution_time
+        assert alert.threshold == 300
     
     def test_check_performance_alerts_high_error_rate(self, monitor):
         """Test performance alerts for high error rate."""
@@ -273,16 +429,27 @@ class TestWorkflowMonitor:
             {'success': True},   # Success
             {'success': False}   # Error
         ]
-        monitor.execution_metrics[workflow_name] = executions
+        _seed_records(monitor, workflow_name, executions)
         
         alerts = monitor._check_performance_alerts(workflow_name, 100.0, False)
         
         # Should trigger high error rate alert (4/5 = 80% > 10% threshold)
         assert len(alerts) == 1
         alert = alerts[0]
-        assert alert['type'] == 'high_error_rate'
-        assert alert['workflow_name'] == workflow_name
-        assert alert['error_rate'] == 0.8
+        assert alert.type == 'high_error_rate'
+        assert alert.workflow_name == workflow_name
+        assert alert.value == 0.8
+    
+    def test_check_performance_alerts_error_rate_window_rolls(self, monitor):
+        """Test that failures older than the error-rate window stop counting."""
+        workflow_name = "recovered_workflow"
+        
+        _seed_records(monitor, workflow_name, [{'success': False}] * 10 + [{'success': True}] * 10)
+        
+        series = monitor.execution_metrics[workflow_name]
+        assert series.recent_size == 10
+        assert series.recent_failures == 0
+        assert monitor._check_performance_alerts(workflow_name, 100.0, True) == []
     
     def test_check_performance_alerts_insufficient_data(self, monitor):
         """Test performance alerts with insufficient data."""
@@ -294,7 +461,7 @@ class TestWorkflowMonitor:
             {'success': False},
             {'success': False}
         ]
-        monitor.execution_metrics[workflow_name] = executions
+        _seed_records(monitor, workflow_name, executions)
         
         alerts = monitor._check_performance_alerts(workflow_name, 100.0, False)
         
@@ -311,33 +478,24 @@ class TestWorkflowMonitor:
         # Should not raise exception
         monitor.log_performance_metrics()
     
-    @patch('src.core.monitoring.workflow_monitor.PROMETHEUS_AVAILABLE', True)
-    def test_prometheus_metrics_update(self):
+    def test_prometheus_metrics_update(self, prom_stack):
         """Test Prometheus metrics updates."""
-        with patch('src.core.monitoring.workflow_monitor.start_http_server'):
-            with patch('src.core.monitoring.workflow_monitor.Counter') as mock_counter:
-                with patch('src.core.monitoring.workflow_monitor.Histogram') as mock_histogram:
-                    with patch('src.core.monitoring.workflow_monitor.Gauge') as mock_gauge:
-                        
-                        # Create monitor with Prometheus enabled
-                        monitor = WorkflowMonitor(enable_prometheus=True, prometheus_port=8000)
-                        
-                        # Mock the metric instances
-                        mock_counter_instance = Mock()
-                        mock_histogram_instance = Mock()
-                        mock_gauge_instance = Mock()
-                        
-                        monitor.workflow_executions_total = mock_counter_instance
-                        monitor.workflow_execution_duration = mock_histogram_instance
-                        monitor.active_workflows = mock_gauge_instance
-                        
-                        # Start and end execution
-                        workflow_id = "test_workflow_123"
-                        monitor.start_execution(workflow_id)
-                        monitor.end_execution(workflow_id, True, 120.0)
-                        
-                        # Verify Prometheus metrics were called
-                        mock_gauge_instance.inc.assert_called_once()
-                        mock_gauge_instance.dec.assert_called_once()
-                        mock_counter_instance.labels.assert_called()
-                        mock_histogram_instance.labels.assert_called() 
\ No newline at end of file
+        # Create monitor with Prometheus enabled; its collectors are stubs
+        monitor = WorkflowMonitor(enable_prometheus=True, prometheus_port=8000)
+        counter = monitor.workflow_executions_total
+        histogram = monitor.workflow_execution_duration
+        gauge = monitor.active_workflows
+        
+        # Start and end execution
+        workflow_id = "test_workflow_123"
+        monitor.start_execution(workflow_id)
+        monitor.end_execution(workflow_id, True, 120.0)
+        monitor._flush_prom()
+        
+        # Verify Prometheus metrics were called
+        assert gauge.calls == [('inc', ()), ('dec', ())]
+        assert any(call[0] == 'labels' for call in counter.calls)
+        assert ('inc', ()) in counter.calls
+        assert any(call[0] == 'labels' for call in histogram.calls)
+        assert ('observe', 120.0) in histogram.calls
+        monitor.close()